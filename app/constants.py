@@ -1 +1,14 @@
-MAX_PRIME_COUNT = 10000
+from app import settings
+
+PRIME_ALGORITHM_VERSION = 1
+
+MAX_PRIME_COUNT = settings.MAX_PRIME_COUNT
+DEFAULT_PRIME_PAGE_SIZE = min(1000, MAX_PRIME_COUNT)
+MAX_PRIME_RANGE_SIZE = settings.MAX_PRIME_RANGE_SIZE
+# Windows near the bound sieve base primes up to its square root.
+MAX_PRIME_RANGE_BOUND = min(settings.MAX_PRIME_RANGE_BOUND, 2**64)
+MAX_PRIMALITY_CHECK_BATCH = settings.MAX_PRIMALITY_CHECK_BATCH
+MAX_PRIMALITY_CHECK_NUMBER = 2**64
+MAX_NTH_PRIME_INDEX = settings.MAX_NTH_PRIME_INDEX
+MAX_PRIME_COUNTING_BOUND = settings.MAX_PRIME_COUNTING_BOUND
+PRIME_PARALLEL_SIEVE_THRESHOLD = settings.PRIME_PARALLEL_SIEVE_THRESHOLD
@@ -1,7 +1,14 @@
+from typing import Optional
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 from sqlmodel import Session, create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app import settings
 
+ASYNC_DRIVERS = {"sqlite": "aiosqlite", "postgresql": "asyncpg"}
+
 engine = create_engine(
     settings.DATABASE_URL,
     echo=settings.DB_ECHO,
@@ -10,12 +17,51 @@ engine = create_engine(
     max_overflow=20,
 )
 
+_async_engine: Optional[AsyncEngine] = None
+
+
+def to_async_database_url(database_url: str) -> str:
+    url = make_url(database_url)
+    backend = url.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"no async driver configured for {backend!r} databases")
+    return url.set(drivername=f"{backend}+{ASYNC_DRIVERS[backend]}").render_as_string(
+        hide_password=False
+    )
+
+
+def get_async_engine() -> AsyncEngine:
+    global _async_engine
+
+    if _async_engine is None:
+        _async_engine = create_async_engine(
+            to_async_database_url(database_url=settings.DATABASE_URL),
+            echo=settings.DB_ECHO,
+            pool_pre_ping=True,
+            pool_size=10,
+            max_overflow=20,
+        )
+    return _async_engine
+
 
 def get_session():
     with Session(engine) as session:
         yield session
 
 
+async def get_async_session():
+    async with AsyncSession(get_async_engine(), expire_on_commit=False) as session:
+        yield session
+
+
+async def dispose_async_engine() -> None:
+    global _async_engine
+
+    if _async_engine is not None:
+        await _async_engine.dispose()
+        _async_engine = None
+
+
 def create_db_and_tables():
     from sqlmodel import SQLModel
 
@@ -1,3 +0,0 @@
-from app.decorators.login_decorators import log_failed_login
-
-__all__ = ["log_failed_login"]
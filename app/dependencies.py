@@ -1,23 +1,137 @@
-from typing import Annotated
+from dataclasses import replace
+from typing import Annotated, Optional
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from sqlmodel import Session, select
+from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.database import get_session
-from app.models import User
+from app import settings
+from app.database import get_async_session, get_session
+from app.dtos import UserDTO
+from app.interactos.publisher_interface import ILoginEventPublisher
+from app.interactos.storage_interface import (
+    IAsyncLoginLogStorage,
+    IAsyncUserStorage,
+    ILoginLogStorage,
+    IUserStorage,
+)
+from app.storages.login_log_buffer import get_login_log_buffer
+from app.storages.storage_implementation import (
+    AsyncLoginLogStorage,
+    AsyncUserStorage,
+    BufferedLoginLogStorage,
+    LoginLogStorage,
+    ThreadedLoginLogStorage,
+    ThreadedUserStorage,
+    UserStorage,
+)
+from app.storages.user_cache import get_user_cache
+from app.tasks.publisher_implementation import LoginEventPublisher
 from app.utils import decode_jwt_token
 
 security = HTTPBearer()
 
 
+def get_user_storage(session: Annotated[Session, Depends(get_session)]) -> IUserStorage:
+    return UserStorage(session=session)
+
+
+def get_login_log_storage(
+    session: Annotated[Session, Depends(get_session)],
+) -> ILoginLogStorage:
+    return LoginLogStorage(session=session)
+
+
+def get_async_user_storage(
+    session: Annotated[AsyncSession, Depends(get_async_session)],
+) -> IAsyncUserStorage:
+    return AsyncUserStorage(session=session)
+
+
+def get_async_login_log_storage(
+    session: Annotated[AsyncSession, Depends(get_async_session)],
+) -> IAsyncLoginLogStorage:
+    login_log_buffer = get_login_log_buffer()
+    if login_log_buffer is not None:
+        return BufferedLoginLogStorage(buffer=login_log_buffer)
+    return AsyncLoginLogStorage(session=session)
+
+
+def get_threaded_user_storage(
+    user_storage: Annotated[IUserStorage, Depends(get_user_storage)],
+) -> IAsyncUserStorage:
+    return ThreadedUserStorage(storage=user_storage)
+
+
+def get_threaded_login_log_storage(
+    login_log_storage: Annotated[ILoginLogStorage, Depends(get_login_log_storage)],
+) -> IAsyncLoginLogStorage:
+    login_log_buffer = get_login_log_buffer()
+    if login_log_buffer is not None:
+        return BufferedLoginLogStorage(buffer=login_log_buffer)
+    return ThreadedLoginLogStorage(storage=login_log_storage)
+
+
+def get_login_event_publisher() -> Optional[ILoginEventPublisher]:
+    if settings.LOGIN_EVENTS_VIA_CELERY:
+        return LoginEventPublisher()
+    return None
+
+
 def get_current_user(
     credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
     session: Annotated[Session, Depends(get_session)],
-) -> User:
-    token = credentials.credentials
+) -> UserDTO:
+    user_id = _get_token_user_id(credentials=credentials)
+
+    # The session only checks out a connection on a cache miss.
+    user = _get_cached_user(user_id=user_id)
+    if user is None:
+        user = _cache_user(user=UserStorage(session=session).get_by_id(user_id=user_id))
 
-    payload = decode_jwt_token(token)
+    return _ensure_active(user=user)
+
+
+async def get_current_user_async(
+    credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
+    session: Annotated[AsyncSession, Depends(get_async_session)],
+) -> UserDTO:
+    user_id = _get_token_user_id(credentials=credentials)
+
+    # The sync Redis client must not block the event loop, so the async
+    # path goes through the cache's async methods.
+    user = await _get_cached_user_async(user_id=user_id)
+    if user is None:
+        user = await _cache_user_async(
+            user=await AsyncUserStorage(session=session).get_by_id(user_id=user_id)
+        )
+
+    return _ensure_active(user=user)
+
+
+# DB_ASYNC picks which session path the routers run on; both share the cache.
+CurrentUser = Annotated[
+    UserDTO, Depends(get_current_user_async if settings.DB_ASYNC else get_current_user)
+]
+# The login route only sees async storages; without DB_ASYNC the sync ones
+# run in the threadpool.
+UserStorageDependency = Annotated[
+    IAsyncUserStorage,
+    Depends(get_async_user_storage if settings.DB_ASYNC else get_threaded_user_storage),
+]
+LoginLogStorageDependency = Annotated[
+    IAsyncLoginLogStorage,
+    Depends(
+        get_async_login_log_storage
+        if settings.DB_ASYNC
+        else get_threaded_login_log_storage
+    ),
+]
+
+
+def _get_token_user_id(credentials: HTTPAuthorizationCredentials) -> str:
+    payload = decode_jwt_token(credentials.credentials)
     if payload is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
 
@@ -25,11 +139,44 @@ def get_current_user(
     if user_id is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
 
-    user = session.exec(select(User).where(User.id == user_id)).first()
+    return user_id
+
+
+def _get_cached_user(user_id: str) -> Optional[UserDTO]:
+    user_cache = get_user_cache()
+    return user_cache.get(user_id=user_id) if user_cache is not None else None
+
+
+def _cache_user(user: Optional[UserDTO]) -> UserDTO:
     if user is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
 
+    user = replace(user, password_hash=None)
+    user_cache = get_user_cache()
+    if user_cache is not None:
+        user_cache.put(user=user)
+    return user
+
+
+async def _get_cached_user_async(user_id: str) -> Optional[UserDTO]:
+    user_cache = get_user_cache()
+    if user_cache is None:
+        return None
+    return await user_cache.get_async(user_id=user_id)
+
+
+async def _cache_user_async(user: Optional[UserDTO]) -> UserDTO:
+    if user is None:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
+
+    user = replace(user, password_hash=None)
+    user_cache = get_user_cache()
+    if user_cache is not None:
+        await user_cache.put_async(user=user)
+    return user
+
+
+def _ensure_active(user: UserDTO) -> UserDTO:
     if not user.is_active:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN)
-
     return user
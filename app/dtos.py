@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Sequence
 
 
 @dataclass
@@ -51,4 +51,70 @@ class PrimeNumbersRequestDTO:
 @dataclass
 class PrimeNumbersResultDTO:
     count: int
-    primes: list[int]
+    primes: Sequence[int]
+
+
+@dataclass
+class PrimeRangeRequestDTO:
+    lo: int
+    hi: int
+    user_id: str
+
+
+@dataclass
+class PrimeRangeResultDTO:
+    lo: int
+    hi: int
+    count: int
+    primes: Sequence[int]
+
+
+@dataclass
+class PrimePageRequestDTO:
+    offset: int
+    limit: int
+    user_id: str
+    cursor: Optional[str] = None
+
+
+@dataclass
+class PrimePageResultDTO:
+    offset: int
+    primes: Sequence[int]
+    next_cursor: Optional[str] = None
+
+
+@dataclass
+class PrimalityCheckRequestDTO:
+    numbers: list[int]
+    user_id: str
+
+
+@dataclass
+class PrimalityCheckResultDTO:
+    numbers: list[int]
+    results: list[bool]
+
+
+@dataclass
+class NthPrimeRequestDTO:
+    n: int
+    user_id: str
+
+
+@dataclass
+class NthPrimeResultDTO:
+    n: int
+    prime: int
+
+
+@dataclass
+class PrimeCountRequestDTO:
+    x: int
+    user_id: str
+
+
+@dataclass
+class PrimeCountResultDTO:
+    x: int
+    count: int
@@ -12,3 +12,7 @@ class InvalidPasswordException(Exception):
 
 class InactiveAccountException(Exception):
     pass
+
+
+class PrimeComputationTimeoutException(Exception):
+    pass
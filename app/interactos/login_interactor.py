@@ -10,8 +10,10 @@ from app.exceptions import (
     UserNotFoundException,
 )
 from app.interactos.presenter_interface import ILoginPresenter
-from app.interactos.storage_interface import ILoginLogStorage, IUserStorage
+from app.interactos.publisher_interface import ILoginEventPublisher
+from app.interactos.storage_interface import IAsyncLoginLogStorage, IAsyncUserStorage
 from app.observability.metric_decorators import track_auth_attempt
+from app.password_executor import run_password_task
 from app.tasks.login_tasks import check_login_location
 from app.utils import create_jwt_token, verify_password
 
@@ -19,17 +21,19 @@ from app.utils import create_jwt_token, verify_password
 class LoginInteractor:
     def __init__(
         self,
-        user_storage: IUserStorage,
-        login_log_storage: ILoginLogStorage,
+        user_storage: IAsyncUserStorage,
+        login_log_storage: IAsyncLoginLogStorage,
         presenter: ILoginPresenter,
+        login_event_publisher: Optional[ILoginEventPublisher] = None,
     ):
         self.user_storage = user_storage
         self.login_log_storage = login_log_storage
         self.presenter = presenter
+        self.login_event_publisher = login_event_publisher
 
-    def user_login_wrapper(self, request_dto: LoginRequestDTO) -> JSONResponse:
+    async def user_login_wrapper(self, request_dto: LoginRequestDTO) -> JSONResponse:
         try:
-            result = self._execute_login(request_dto=request_dto)
+            result = await self._execute_login(request_dto=request_dto)
             return self.presenter.get_success_response(result=result)
         except InvalidInputException as e:
             return self.presenter.get_invalid_input_response(message=str(e))
@@ -39,22 +43,32 @@ class LoginInteractor:
             return self.presenter.get_inactive_account_response()
 
     @track_auth_attempt
-    def _execute_login(self, request_dto: LoginRequestDTO) -> LoginResultDTO:
+    async def _execute_login(self, request_dto: LoginRequestDTO) -> LoginResultDTO:
         self._validate_input(request_dto=request_dto)
 
-        user_dto = self._fetch_user(username=request_dto.username)
+        user_dto = await self._fetch_user(username=request_dto.username)
 
-        self._validate_user(user_dto=user_dto, request_dto=request_dto)
+        await self._validate_user(user_dto=user_dto, request_dto=request_dto)
 
         jwt_token, expires_in = self._generate_token(user_dto=user_dto)
-        if request_dto.ip_address:
-            check_login_location.delay(user_dto.id, request_dto.ip_address)
-
-        self._log_successful_login(
-            user_id=user_dto.id,
-            ip_address=request_dto.ip_address,
-            user_agent=request_dto.user_agent,
-        )
+        if self.login_event_publisher is not None:
+            # One message; the worker writes the log and checks the location.
+            self.login_event_publisher.publish_login(
+                login_log_dto=LoginLogDTO(
+                    user_id=user_dto.id,
+                    ip_address=request_dto.ip_address,
+                    user_agent=request_dto.user_agent,
+                )
+            )
+        else:
+            if request_dto.ip_address:
+                check_login_location.delay(user_dto.id, request_dto.ip_address)
+
+            await self._log_successful_login(
+                user_id=user_dto.id,
+                ip_address=request_dto.ip_address,
+                user_agent=request_dto.user_agent,
+            )
 
         return LoginResultDTO(
             success=True, user=user_dto, jwt_token=jwt_token, expires_in=expires_in
@@ -67,33 +81,38 @@ class LoginInteractor:
         if not request_dto.password or not request_dto.password.strip():
             raise InvalidInputException()
 
-    def _fetch_user(self, username: str) -> UserDTO:
-        user_dto = self.user_storage.get_by_username(username=username)
+    async def _fetch_user(self, username: str) -> UserDTO:
+        user_dto = await self.user_storage.get_by_username(username=username)
         if not user_dto:
             raise UserNotFoundException()
         return user_dto
 
-    def _validate_user(self, user_dto: UserDTO, request_dto: LoginRequestDTO) -> None:
+    async def _validate_user(
+        self, user_dto: UserDTO, request_dto: LoginRequestDTO
+    ) -> None:
         if not user_dto.is_active:
             raise InactiveAccountException()
 
-        if not verify_password(
-            plain_password=request_dto.password, hashed_password=user_dto.password_hash
+        if not await run_password_task(
+            verify_password,
+            operation="verify",
+            plain_password=request_dto.password,
+            hashed_password=user_dto.password_hash,
         ):
             raise InvalidPasswordException()
 
     def _generate_token(self, user_dto: UserDTO) -> tuple[str, int]:
         return create_jwt_token(user_id=user_dto.id, username=user_dto.username)
 
-    def _log_successful_login(
+    async def _log_successful_login(
         self, user_id: str, ip_address: Optional[str], user_agent: Optional[str]
     ):
         log_dto = LoginLogDTO(
             user_id=user_id, ip_address=ip_address, user_agent=user_agent
         )
-        self.login_log_storage.create(login_log_dto=log_dto)
+        await self.login_log_storage.create(login_log_dto=log_dto)
 
-    def _log_failed_login(
+    async def _log_failed_login(
         self,
         user_id: Optional[str],
         ip_address: Optional[str],
@@ -105,4 +124,4 @@ class LoginInteractor:
         log_dto = LoginLogDTO(
             user_id=user_id, ip_address=ip_address, user_agent=user_agent
         )
-        self.login_log_storage.create(login_log_dto=log_dto)
+        await self.login_log_storage.create(login_log_dto=log_dto)
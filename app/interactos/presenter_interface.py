@@ -1,8 +1,17 @@
 from abc import ABC, abstractmethod
+from typing import Optional
 
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 
-from app.dtos import LoginResultDTO, PrimeNumbersResultDTO
+from app.dtos import (
+    LoginResultDTO,
+    NthPrimeResultDTO,
+    PrimalityCheckResultDTO,
+    PrimeCountResultDTO,
+    PrimeNumbersResultDTO,
+    PrimePageResultDTO,
+    PrimeRangeResultDTO,
+)
 
 
 class ILoginPresenter(ABC):
@@ -25,9 +34,45 @@ class ILoginPresenter(ABC):
 
 class IPrimeNumbersPresenter(ABC):
     @abstractmethod
-    def get_success_response(self, result: PrimeNumbersResultDTO) -> JSONResponse:
+    def is_not_modified(self, count: int) -> bool:
+        pass
+
+    @abstractmethod
+    def get_not_modified_response(self, count: int) -> Response:
+        pass
+
+    @abstractmethod
+    def get_cached_success_response(self, count: int) -> Optional[Response]:
+        pass
+
+    @abstractmethod
+    def get_success_response(self, result: PrimeNumbersResultDTO) -> Response:
+        pass
+
+    @abstractmethod
+    def get_page_success_response(self, result: PrimePageResultDTO) -> Response:
+        pass
+
+    @abstractmethod
+    def get_range_success_response(self, result: PrimeRangeResultDTO) -> Response:
+        pass
+
+    @abstractmethod
+    def get_check_success_response(self, result: PrimalityCheckResultDTO) -> Response:
+        pass
+
+    @abstractmethod
+    def get_nth_prime_success_response(self, result: NthPrimeResultDTO) -> Response:
+        pass
+
+    @abstractmethod
+    def get_prime_count_success_response(self, result: PrimeCountResultDTO) -> Response:
         pass
 
     @abstractmethod
     def get_invalid_input_response(self, message: str) -> JSONResponse:
         pass
+
+    @abstractmethod
+    def get_timeout_response(self) -> JSONResponse:
+        pass
@@ -0,0 +1,36 @@
+from abc import ABC, abstractmethod
+from typing import Optional, Sequence
+
+
+class IPrimeEngine(ABC):
+    @abstractmethod
+    def first_n_primes(self, count: int) -> Sequence[int]:
+        pass
+
+    @abstractmethod
+    def primes_in_range(
+        self, lo: int, hi: int, base_primes: Optional[Sequence[int]] = None
+    ) -> Sequence[int]:
+        pass
+
+    @abstractmethod
+    def primes_from(
+        self, lo: int, count: int, base_primes: Optional[Sequence[int]] = None
+    ) -> Sequence[int]:
+        pass
+
+    @abstractmethod
+    def are_primes(self, numbers: Sequence[int]) -> list[bool]:
+        pass
+
+    @abstractmethod
+    def nth_prime(self, n: int, base_primes: Optional[Sequence[int]] = None) -> int:
+        pass
+
+    @abstractmethod
+    def prime_count(self, x: int, base_primes: Optional[Sequence[int]] = None) -> int:
+        pass
+
+    def cached_prime_count(self) -> int:
+        """How many of the first primes are already cached, so need no sieve."""
+        return 0
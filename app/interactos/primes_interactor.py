@@ -1,32 +1,169 @@
-from fastapi.responses import JSONResponse
+from typing import Optional, Sequence
 
-from app.constants import MAX_PRIME_COUNT
-from app.dtos import PrimeNumbersRequestDTO, PrimeNumbersResultDTO
-from app.exceptions import InvalidInputException
+from fastapi.responses import Response
+
+from app.constants import (
+    MAX_NTH_PRIME_INDEX,
+    MAX_PRIMALITY_CHECK_BATCH,
+    MAX_PRIMALITY_CHECK_NUMBER,
+    MAX_PRIME_COUNT,
+    MAX_PRIME_COUNTING_BOUND,
+    MAX_PRIME_RANGE_BOUND,
+    MAX_PRIME_RANGE_SIZE,
+    PRIME_PARALLEL_SIEVE_THRESHOLD,
+)
+from app.dtos import (
+    NthPrimeRequestDTO,
+    NthPrimeResultDTO,
+    PrimalityCheckRequestDTO,
+    PrimalityCheckResultDTO,
+    PrimeCountRequestDTO,
+    PrimeCountResultDTO,
+    PrimeNumbersRequestDTO,
+    PrimeNumbersResultDTO,
+    PrimePageRequestDTO,
+    PrimePageResultDTO,
+    PrimeRangeRequestDTO,
+    PrimeRangeResultDTO,
+)
+from app.exceptions import InvalidInputException, PrimeComputationTimeoutException
 from app.interactos.presenter_interface import IPrimeNumbersPresenter
+from app.interactos.prime_engine_interface import IPrimeEngine
 from app.observability.metric_decorators import track_prime_generation
+from app.prime_engine.executor import run_parallel_first_n_primes, run_prime_engine
+from app.utils import decode_prime_cursor, encode_prime_cursor
 
 
 class PrimeNumbersInteractor:
-    def __init__(self, presenter: IPrimeNumbersPresenter):
+    def __init__(self, presenter: IPrimeNumbersPresenter, prime_engine: IPrimeEngine):
         self.presenter = presenter
+        self.prime_engine = prime_engine
 
-    def generate_primes_wrapper(
+    async def generate_primes_wrapper(
         self, request_dto: PrimeNumbersRequestDTO
-    ) -> JSONResponse:
+    ) -> Response:
         try:
-            result = self._execute_prime_generation(request_dto=request_dto)
+            self._validate_input(request_dto=request_dto)
+            if self.presenter.is_not_modified(count=request_dto.count):
+                return self.presenter.get_not_modified_response(count=request_dto.count)
+
+            cached_response = self.presenter.get_cached_success_response(
+                count=request_dto.count
+            )
+            if cached_response is not None:
+                return cached_response
+
+            result = await self._execute_prime_generation(request_dto=request_dto)
             return self.presenter.get_success_response(result=result)
         except InvalidInputException as e:
             return self.presenter.get_invalid_input_response(message=str(e))
+        except PrimeComputationTimeoutException:
+            return self.presenter.get_timeout_response()
+
+    async def get_prime_page_wrapper(
+        self, request_dto: PrimePageRequestDTO
+    ) -> Response:
+        try:
+            result = await self._execute_prime_page(request_dto=request_dto)
+            return self.presenter.get_page_success_response(result=result)
+        except InvalidInputException as e:
+            return self.presenter.get_invalid_input_response(message=str(e))
+        except PrimeComputationTimeoutException:
+            return self.presenter.get_timeout_response()
+
+    async def generate_primes_in_range_wrapper(
+        self, request_dto: PrimeRangeRequestDTO
+    ) -> Response:
+        try:
+            result = await self._execute_prime_range_generation(request_dto=request_dto)
+            return self.presenter.get_range_success_response(result=result)
+        except InvalidInputException as e:
+            return self.presenter.get_invalid_input_response(message=str(e))
+        except PrimeComputationTimeoutException:
+            return self.presenter.get_timeout_response()
 
-    def _execute_prime_generation(
+    async def check_primality_wrapper(
+        self, request_dto: PrimalityCheckRequestDTO
+    ) -> Response:
+        try:
+            result = await self._execute_primality_check(request_dto=request_dto)
+            return self.presenter.get_check_success_response(result=result)
+        except InvalidInputException as e:
+            return self.presenter.get_invalid_input_response(message=str(e))
+        except PrimeComputationTimeoutException:
+            return self.presenter.get_timeout_response()
+
+    async def get_nth_prime_wrapper(self, request_dto: NthPrimeRequestDTO) -> Response:
+        try:
+            result = await self._execute_nth_prime(request_dto=request_dto)
+            return self.presenter.get_nth_prime_success_response(result=result)
+        except InvalidInputException as e:
+            return self.presenter.get_invalid_input_response(message=str(e))
+        except PrimeComputationTimeoutException:
+            return self.presenter.get_timeout_response()
+
+    async def count_primes_wrapper(self, request_dto: PrimeCountRequestDTO) -> Response:
+        try:
+            result = await self._execute_prime_count(request_dto=request_dto)
+            return self.presenter.get_prime_count_success_response(result=result)
+        except InvalidInputException as e:
+            return self.presenter.get_invalid_input_response(message=str(e))
+        except PrimeComputationTimeoutException:
+            return self.presenter.get_timeout_response()
+
+    async def _execute_prime_generation(
         self, request_dto: PrimeNumbersRequestDTO
     ) -> PrimeNumbersResultDTO:
-        self._validate_input(request_dto=request_dto)
-        primes = self._generate_n_primes(count=request_dto.count)
+        primes = await self._generate_n_primes(count=request_dto.count)
         return PrimeNumbersResultDTO(count=request_dto.count, primes=primes)
 
+    async def _execute_prime_page(
+        self, request_dto: PrimePageRequestDTO
+    ) -> PrimePageResultDTO:
+        offset, lo = self._get_page_cursor_position(request_dto=request_dto)
+        self._validate_page_input(request_dto=request_dto, offset=offset, lo=lo)
+        if lo is None:
+            lo = await self._find_nth_prime(n=offset) + 1 if offset else 0
+
+        primes = await self._generate_prime_page(lo=lo, count=request_dto.limit)
+        next_offset = offset + len(primes)
+        next_cursor = None
+        if len(primes) == request_dto.limit and next_offset < MAX_NTH_PRIME_INDEX:
+            next_cursor = encode_prime_cursor(offset=next_offset, lo=primes[-1] + 1)
+        return PrimePageResultDTO(offset=offset, primes=primes, next_cursor=next_cursor)
+
+    async def _execute_prime_range_generation(
+        self, request_dto: PrimeRangeRequestDTO
+    ) -> PrimeRangeResultDTO:
+        self._validate_range_input(request_dto=request_dto)
+        primes = await self._generate_primes_in_range(
+            lo=request_dto.lo, hi=request_dto.hi
+        )
+        return PrimeRangeResultDTO(
+            lo=request_dto.lo, hi=request_dto.hi, count=len(primes), primes=primes
+        )
+
+    async def _execute_primality_check(
+        self, request_dto: PrimalityCheckRequestDTO
+    ) -> PrimalityCheckResultDTO:
+        self._validate_check_input(request_dto=request_dto)
+        results = await self._check_primality(numbers=request_dto.numbers)
+        return PrimalityCheckResultDTO(numbers=request_dto.numbers, results=results)
+
+    async def _execute_nth_prime(
+        self, request_dto: NthPrimeRequestDTO
+    ) -> NthPrimeResultDTO:
+        self._validate_nth_prime_input(request_dto=request_dto)
+        prime = await self._find_nth_prime(n=request_dto.n)
+        return NthPrimeResultDTO(n=request_dto.n, prime=prime)
+
+    async def _execute_prime_count(
+        self, request_dto: PrimeCountRequestDTO
+    ) -> PrimeCountResultDTO:
+        self._validate_prime_count_input(request_dto=request_dto)
+        count = await self._count_primes(x=request_dto.x)
+        return PrimeCountResultDTO(x=request_dto.x, count=count)
+
     def _validate_input(self, request_dto: PrimeNumbersRequestDTO) -> None:
         if request_dto.count <= 0:
             raise InvalidInputException()
@@ -34,17 +171,104 @@ class PrimeNumbersInteractor:
         if request_dto.count > MAX_PRIME_COUNT:
             raise InvalidInputException()
 
+    def _get_page_cursor_position(
+        self, request_dto: PrimePageRequestDTO
+    ) -> tuple[int, Optional[int]]:
+        if request_dto.cursor is None:
+            return request_dto.offset, None
+
+        position = decode_prime_cursor(cursor=request_dto.cursor)
+        if position is None:
+            raise InvalidInputException()
+        return position
+
+    def _validate_page_input(
+        self, request_dto: PrimePageRequestDTO, offset: int, lo: Optional[int]
+    ) -> None:
+        if request_dto.limit <= 0:
+            raise InvalidInputException()
+
+        if request_dto.limit > MAX_PRIME_COUNT:
+            raise InvalidInputException()
+
+        if offset < 0 or offset >= MAX_NTH_PRIME_INDEX:
+            raise InvalidInputException()
+
+        if lo is not None and (lo < 0 or lo >= MAX_PRIME_RANGE_BOUND):
+            raise InvalidInputException()
+
+    def _validate_range_input(self, request_dto: PrimeRangeRequestDTO) -> None:
+        if request_dto.lo < 0:
+            raise InvalidInputException()
+
+        if request_dto.hi <= request_dto.lo:
+            raise InvalidInputException()
+
+        if request_dto.hi > MAX_PRIME_RANGE_BOUND:
+            raise InvalidInputException()
+
+        if request_dto.hi - request_dto.lo > MAX_PRIME_RANGE_SIZE:
+            raise InvalidInputException()
+
+    def _validate_check_input(self, request_dto: PrimalityCheckRequestDTO) -> None:
+        if not request_dto.numbers:
+            raise InvalidInputException()
+
+        if len(request_dto.numbers) > MAX_PRIMALITY_CHECK_BATCH:
+            raise InvalidInputException()
+
+        for number in request_dto.numbers:
+            if number < 0 or number >= MAX_PRIMALITY_CHECK_NUMBER:
+                raise InvalidInputException()
+
+    def _validate_nth_prime_input(self, request_dto: NthPrimeRequestDTO) -> None:
+        if request_dto.n <= 0:
+            raise InvalidInputException()
+
+        if request_dto.n > MAX_NTH_PRIME_INDEX:
+            raise InvalidInputException()
+
+    def _validate_prime_count_input(self, request_dto: PrimeCountRequestDTO) -> None:
+        if request_dto.x < 0:
+            raise InvalidInputException()
+
+        if request_dto.x > MAX_PRIME_COUNTING_BOUND:
+            raise InvalidInputException()
+
     @track_prime_generation
-    def _generate_n_primes(self, count: int) -> list[int]:
-        primes = []
-        num = 2
+    async def _generate_n_primes(self, count: int) -> Sequence[int]:
+        if (
+            count >= PRIME_PARALLEL_SIEVE_THRESHOLD
+            and count > self.prime_engine.cached_prime_count()
+        ):
+            return await run_parallel_first_n_primes(
+                prime_engine=self.prime_engine, count=count
+            )
+        return await run_prime_engine(self.prime_engine, "first_n_primes", count=count)
 
-        while len(primes) < count:
-            if self._is_prime(num):
-                primes.append(num)
-            num += 1
+    @track_prime_generation
+    async def _generate_prime_page(self, lo: int, count: int) -> Sequence[int]:
+        return await run_prime_engine(
+            self.prime_engine, "primes_from", lo=lo, count=count
+        )
+
+    @track_prime_generation
+    async def _generate_primes_in_range(self, lo: int, hi: int) -> Sequence[int]:
+        return await run_prime_engine(
+            self.prime_engine, "primes_in_range", lo=lo, hi=hi
+        )
+
+    @track_prime_generation
+    async def _check_primality(self, numbers: list[int]) -> list[bool]:
+        return await run_prime_engine(self.prime_engine, "are_primes", numbers=numbers)
+
+    @track_prime_generation
+    async def _find_nth_prime(self, n: int) -> int:
+        return await run_prime_engine(self.prime_engine, "nth_prime", n=n)
 
-        return primes
+    @track_prime_generation
+    async def _count_primes(self, x: int) -> int:
+        return await run_prime_engine(self.prime_engine, "prime_count", x=x)
 
     def _is_prime(self, n: int) -> bool:
         if n < 2:
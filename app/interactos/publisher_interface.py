@@ -0,0 +1,9 @@
+from abc import ABC, abstractmethod
+
+from app.dtos import LoginLogDTO
+
+
+class ILoginEventPublisher(ABC):
+    @abstractmethod
+    def publish_login(self, login_log_dto: LoginLogDTO) -> LoginLogDTO:
+        pass
@@ -9,8 +9,36 @@ class IUserStorage(ABC):
     def get_by_username(self, username: str) -> Optional[UserDTO]:
         pass
 
+    @abstractmethod
+    def get_by_id(self, user_id: str) -> Optional[UserDTO]:
+        pass
+
 
 class ILoginLogStorage(ABC):
     @abstractmethod
     def create(self, login_log_dto: LoginLogDTO) -> LoginLogDTO:
         pass
+
+    @abstractmethod
+    def create_many(self, login_log_dtos: list[LoginLogDTO]) -> None:
+        pass
+
+
+class IAsyncUserStorage(ABC):
+    @abstractmethod
+    async def get_by_username(self, username: str) -> Optional[UserDTO]:
+        pass
+
+    @abstractmethod
+    async def get_by_id(self, user_id: str) -> Optional[UserDTO]:
+        pass
+
+
+class IAsyncLoginLogStorage(ABC):
+    @abstractmethod
+    async def create(self, login_log_dto: LoginLogDTO) -> LoginLogDTO:
+        pass
+
+    @abstractmethod
+    async def create_many(self, login_log_dtos: list[LoginLogDTO]) -> None:
+        pass
@@ -7,19 +7,34 @@ from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
 from opentelemetry.instrumentation.sqlalchemy import SQLAlchemyInstrumentor
 
 from app import settings
-from app.database import create_db_and_tables
+from app.database import create_db_and_tables, dispose_async_engine, engine
 from app.middleware.exception_handlers import (
     generic_exception_handler,
     validation_exception_handler,
 )
 from app.middleware.rate_limiter import rate_limit_middleware
+from app.password_executor import shutdown_password_executor, start_password_executor
+from app.prime_engine import (
+    get_prime_table,
+    shutdown_prime_executor,
+    start_prime_executor,
+)
 from app.routers import auth_router, primes_router
+from app.storages.login_log_buffer import start_login_log_buffer, stop_login_log_buffer
+from app.storages.user_cache import start_user_cache_listener, stop_user_cache_listener
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     create_db_and_tables()
 
+    if settings.PRIME_TABLE_PRELOAD:
+        get_prime_table().load()
+    start_prime_executor()
+    start_password_executor()
+    start_user_cache_listener()
+    start_login_log_buffer(engine=engine)
+
     if os.getenv("ENABLE_METRICS", "false").lower() == "true":
         from app.observability.metrics import setup_metrics
 
@@ -34,6 +49,12 @@ async def lifespan(app: FastAPI):
 
     yield
 
+    stop_login_log_buffer()
+    stop_user_cache_listener()
+    shutdown_prime_executor()
+    shutdown_password_executor()
+    await dispose_async_engine()
+
 
 app = FastAPI(title=settings.APP_NAME, version=settings.APP_VERSION, lifespan=lifespan)
 
@@ -16,6 +16,36 @@ primes_generation_duration = meter.create_histogram(
     unit="ms",
 )
 
+primes_executor_queue_depth = meter.create_up_down_counter(
+    name="primes.executor.queue_depth",
+    description="Prime computations submitted to the process pool and not yet finished",
+    unit="1",
+)
+
+response_cache_hits_counter = meter.create_counter(
+    name="primes.response_cache.hits",
+    description="Prime responses served from the encoded body cache",
+    unit="1",
+)
+
+response_cache_misses_counter = meter.create_counter(
+    name="primes.response_cache.misses",
+    description="Prime responses that had to be encoded",
+    unit="1",
+)
+
+compression_ratio = meter.create_histogram(
+    name="primes.compression.ratio",
+    description="Uncompressed size divided by compressed size of prime responses",
+    unit="1",
+)
+
+compression_duration = meter.create_histogram(
+    name="primes.compression.duration",
+    description="CPU time spent compressing prime responses in milliseconds",
+    unit="ms",
+)
+
 http_errors_counter = meter.create_counter(
     name="http.errors.total",
     description="HTTP errors by status code and endpoint",
@@ -26,6 +56,48 @@ auth_attempts_counter = meter.create_counter(
     description="Authentication attempts by result",
 )
 
+password_hash_queue_wait = meter.create_histogram(
+    name="auth.password_hash.queue_wait",
+    description="Time Argon2 hashes and verifications waited for a worker in milliseconds",
+    unit="ms",
+)
+
+password_hash_duration = meter.create_histogram(
+    name="auth.password_hash.duration",
+    description="Time spent in Argon2 hashing and verification in milliseconds",
+    unit="ms",
+)
+
+user_cache_hits_counter = meter.create_counter(
+    name="auth.user_cache.hits",
+    description="Authenticated requests resolved from the user cache",
+    unit="1",
+)
+
+user_cache_misses_counter = meter.create_counter(
+    name="auth.user_cache.misses",
+    description="Authenticated requests that had to load the user from the database",
+    unit="1",
+)
+
+login_log_flush_size = meter.create_histogram(
+    name="auth.login_log.flush_size",
+    description="Login log rows written per buffered INSERT",
+    unit="1",
+)
+
+login_log_flush_duration = meter.create_histogram(
+    name="auth.login_log.flush_duration",
+    description="Time spent writing a batch of buffered login logs in milliseconds",
+    unit="ms",
+)
+
+login_log_dropped_counter = meter.create_counter(
+    name="auth.login_log.dropped",
+    description="Buffered login logs dropped, by reason",
+    unit="1",
+)
+
 db_query_duration = meter.create_histogram(
     name="db.query.duration",
     description="Database query execution time",
@@ -38,6 +110,23 @@ def record_prime_generation(duration_ms: float):
     primes_generation_duration.record(duration_ms)
 
 
+def record_prime_executor_queue_depth(delta: int):
+    primes_executor_queue_depth.add(delta)
+
+
+def record_response_cache_lookup(hit: bool):
+    if hit:
+        response_cache_hits_counter.add(1)
+    else:
+        response_cache_misses_counter.add(1)
+
+
+def record_compression(encoding: str, ratio: float, duration_ms: float):
+    labels = {"encoding": encoding}
+    compression_ratio.record(ratio, labels)
+    compression_duration.record(duration_ms, labels)
+
+
 def record_http_error(status_code: int, endpoint: str):
     http_errors_counter.add(1, {"status_code": str(status_code), "endpoint": endpoint})
 
@@ -49,6 +138,29 @@ def record_auth_attempt(success: bool, reason: str = None):
     auth_attempts_counter.add(1, labels)
 
 
+def record_password_hashing(operation: str, queue_wait_ms: float, duration_ms: float):
+    labels = {"operation": operation}
+    password_hash_queue_wait.record(queue_wait_ms, labels)
+    password_hash_duration.record(duration_ms, labels)
+
+
+def record_user_cache_lookup(hit: bool):
+    if hit:
+        user_cache_hits_counter.add(1)
+    else:
+        user_cache_misses_counter.add(1)
+
+
+def record_login_log_flush(rows: int, duration_ms: float, success: bool):
+    labels = {"success": success}
+    login_log_flush_size.record(rows, labels)
+    login_log_flush_duration.record(duration_ms, labels)
+
+
+def record_login_log_dropped(rows: int, reason: str):
+    login_log_dropped_counter.add(rows, {"reason": reason})
+
+
 def record_db_query(duration_ms: float, operation: str):
     db_query_duration.record(duration_ms, {"operation": operation})
 
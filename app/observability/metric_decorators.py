@@ -1,6 +1,8 @@
+import inspect
 import time
+from contextlib import contextmanager
 from functools import wraps
-from typing import Callable
+from typing import Callable, Iterator
 
 from app.exceptions import (
     InactiveAccountException,
@@ -16,27 +18,53 @@ from app.observability.custom_metrics import (
 
 
 def track_auth_attempt(func: Callable) -> Callable:
+    if inspect.iscoroutinefunction(func):
+
+        @wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            with _recording_auth_attempt():
+                return await func(*args, **kwargs)
+
+        return async_wrapper
+
     @wraps(func)
     def wrapper(*args, **kwargs):
-        try:
-            result = func(*args, **kwargs)
-            record_auth_attempt(success=True)
-            return result
-        except InvalidInputException:
-            record_auth_attempt(success=False, reason="invalid_input")
-            raise
-        except (UserNotFoundException, InvalidPasswordException):
-            record_auth_attempt(success=False, reason="invalid_credentials")
-            raise
-        except InactiveAccountException:
-            record_auth_attempt(success=False, reason="inactive_account")
-            raise
+        with _recording_auth_attempt():
+            return func(*args, **kwargs)
 
     return wrapper
 
 
+@contextmanager
+def _recording_auth_attempt() -> Iterator[None]:
+    try:
+        yield
+        record_auth_attempt(success=True)
+    except InvalidInputException:
+        record_auth_attempt(success=False, reason="invalid_input")
+        raise
+    except (UserNotFoundException, InvalidPasswordException):
+        record_auth_attempt(success=False, reason="invalid_credentials")
+        raise
+    except InactiveAccountException:
+        record_auth_attempt(success=False, reason="inactive_account")
+        raise
+
+
 def track_db_query(operation: str):
     def decorator(func: Callable) -> Callable:
+        if inspect.iscoroutinefunction(func):
+
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                start_time = time.time()
+                result = await func(*args, **kwargs)
+                duration_ms = (time.time() - start_time) * 1000
+                record_db_query(duration_ms, operation)
+                return result
+
+            return async_wrapper
+
         @wraps(func)
         def wrapper(*args, **kwargs):
             start_time = time.time()
@@ -51,6 +79,18 @@ def track_db_query(operation: str):
 
 
 def track_prime_generation(func: Callable) -> Callable:
+    if inspect.iscoroutinefunction(func):
+
+        @wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            start_time = time.time()
+            result = await func(*args, **kwargs)
+            duration_ms = (time.time() - start_time) * 1000
+            record_prime_generation(duration_ms)
+            return result
+
+        return async_wrapper
+
     @wraps(func)
     def wrapper(*args, **kwargs):
         start_time = time.time()
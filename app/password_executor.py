@@ -0,0 +1,66 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from app import settings
+from app.observability.custom_metrics import record_password_hashing
+
+_executor: Optional[ThreadPoolExecutor] = None
+_semaphore: Optional[asyncio.Semaphore] = None
+
+
+def start_password_executor(
+    max_workers: int = settings.PASSWORD_HASH_WORKER_COUNT,
+    max_concurrency: int = settings.PASSWORD_HASH_MAX_CONCURRENCY,
+) -> Optional[ThreadPoolExecutor]:
+    global _executor, _semaphore
+
+    if _executor is None and max_workers > 0:
+        _executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="password-hash"
+        )
+        _semaphore = asyncio.Semaphore(max(max_concurrency, 1))
+    return _executor
+
+
+def shutdown_password_executor() -> None:
+    global _executor, _semaphore
+
+    if _executor is not None:
+        _executor.shutdown(wait=True, cancel_futures=True)
+        _executor = None
+        _semaphore = None
+
+
+async def run_password_task(
+    fn: Callable[..., Any], operation: str, **kwargs: Any
+) -> Any:
+    """Run an Argon2 hash or verification without blocking the event loop.
+
+    The semaphore caps how many run at once, and with it the Argon2 memory
+    in use; callers beyond the cap wait their turn. Without a pool the call
+    runs inline.
+    """
+    queued_at = time.perf_counter()
+    if _executor is None:
+        return _run_timed(fn, operation, queued_at, kwargs)
+
+    async with _semaphore:
+        return await asyncio.get_running_loop().run_in_executor(
+            _executor, _run_timed, fn, operation, queued_at, kwargs
+        )
+
+
+def _run_timed(
+    fn: Callable[..., Any], operation: str, queued_at: float, kwargs: dict[str, Any]
+) -> Any:
+    started_at = time.perf_counter()
+    try:
+        return fn(**kwargs)
+    finally:
+        record_password_hashing(
+            operation=operation,
+            queue_wait_ms=(started_at - queued_at) * 1000,
+            duration_ms=(time.perf_counter() - started_at) * 1000,
+        )
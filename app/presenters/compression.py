@@ -0,0 +1,72 @@
+import gzip
+import time
+from typing import Optional
+
+from app.observability.custom_metrics import record_compression
+from app.presenters.prime_formats import parse_quality
+from app.presenters.response_cache import IDENTITY_ENCODING
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+GZIP_ENCODING = "gzip"
+BROTLI_ENCODING = "br"
+ZSTD_ENCODING = "zstd"
+
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+ZSTD_LEVEL = 6
+
+# Server preference when the client weights several encodings equally.
+SUPPORTED_ENCODINGS = tuple(
+    encoding
+    for encoding, available in (
+        (ZSTD_ENCODING, zstandard is not None),
+        (BROTLI_ENCODING, brotli is not None),
+        (GZIP_ENCODING, True),
+    )
+    if available
+)
+
+
+def negotiate_content_encoding(accept_encoding: Optional[str]) -> str:
+    qualities = {}
+    for coding in (accept_encoding or "").split(","):
+        name, _, params = coding.strip().partition(";")
+        qualities[name.strip().lower()] = parse_quality(params=params)
+
+    best_encoding = IDENTITY_ENCODING
+    best_quality = 0.0
+    for encoding in SUPPORTED_ENCODINGS:
+        quality = qualities.get(encoding, qualities.get("*", 0.0))
+        if quality > best_quality:
+            best_encoding, best_quality = encoding, quality
+    return best_encoding
+
+
+def compress_body(body: bytes, encoding: str) -> bytes:
+    start_time = time.thread_time()
+
+    if encoding == GZIP_ENCODING:
+        compressed = gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+    elif encoding == BROTLI_ENCODING:
+        compressed = brotli.compress(body, quality=BROTLI_QUALITY)
+    elif encoding == ZSTD_ENCODING:
+        compressed = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(body)
+    else:
+        raise ValueError(f"unsupported content encoding {encoding!r}")
+
+    duration_ms = (time.thread_time() - start_time) * 1000
+    record_compression(
+        encoding=encoding,
+        ratio=len(body) / max(len(compressed), 1),
+        duration_ms=duration_ms,
+    )
+    return compressed
@@ -0,0 +1,22 @@
+from typing import Optional
+
+from app.constants import PRIME_ALGORITHM_VERSION
+
+PRIME_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+def prime_etag(count: int, media_type: str) -> str:
+    subtype = media_type.rsplit("/", 1)[-1]
+    return f'"primes-v{PRIME_ALGORITHM_VERSION}-{count}-{subtype}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison, as RFC 9110 requires for If-None-Match."""
+    if not if_none_match:
+        return False
+
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
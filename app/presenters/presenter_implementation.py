@@ -1,7 +1,33 @@
-from fastapi.responses import JSONResponse
+from typing import Iterator, Optional, Sequence
 
-from app.dtos import LoginResultDTO, PrimeNumbersResultDTO
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+
+from app import settings
+from app.dtos import (
+    LoginResultDTO,
+    NthPrimeResultDTO,
+    PrimalityCheckResultDTO,
+    PrimeCountResultDTO,
+    PrimeNumbersResultDTO,
+    PrimePageResultDTO,
+    PrimeRangeResultDTO,
+)
 from app.interactos.presenter_interface import ILoginPresenter, IPrimeNumbersPresenter
+from app.presenters.compression import compress_body
+from app.presenters.http_cache import PRIME_CACHE_CONTROL, etag_matches, prime_etag
+from app.presenters.json_response import FastJSONResponse, dumps_json
+from app.presenters.prime_formats import (
+    BINARY_MEDIA_TYPE,
+    JSON_MEDIA_TYPE,
+    NDJSON_MEDIA_TYPE,
+    pack_primes,
+)
+from app.presenters.response_cache import (
+    IDENTITY_ENCODING,
+    CachedResponseBody,
+    ResponseBodyCache,
+    ResponseCacheKey,
+)
 
 
 class LoginPresenter(ILoginPresenter):
@@ -19,26 +45,226 @@ class LoginPresenter(ILoginPresenter):
             },
         }
 
-        return JSONResponse(content=response, status_code=200)
+        return FastJSONResponse(content=response, status_code=200)
 
     def get_invalid_input_response(self, message: str) -> JSONResponse:
         response = {"error": {"code": "INVALID_INPUT"}}
-        return JSONResponse(content=response, status_code=400)
+        return FastJSONResponse(content=response, status_code=400)
 
     def get_invalid_credentials_response(self) -> JSONResponse:
         response = {"error": {"code": "INVALID_CREDENTIALS"}}
-        return JSONResponse(content=response, status_code=401)
+        return FastJSONResponse(content=response, status_code=401)
 
     def get_inactive_account_response(self) -> JSONResponse:
         response = {"error": {"code": "INACTIVE_ACCOUNT"}}
-        return JSONResponse(content=response, status_code=403)
+        return FastJSONResponse(content=response, status_code=403)
+
+
+STREAM_CHUNK_SIZE = 1000
 
 
 class PrimeNumbersPresenter(IPrimeNumbersPresenter):
-    def get_success_response(self, result: PrimeNumbersResultDTO) -> JSONResponse:
-        response = {"count": result.count, "primes": result.primes}
-        return JSONResponse(content=response, status_code=200)
+    def __init__(
+        self,
+        media_type: str = JSON_MEDIA_TYPE,
+        stream: bool = False,
+        if_none_match: Optional[str] = None,
+        response_cache: Optional[ResponseBodyCache] = None,
+        content_encoding: str = IDENTITY_ENCODING,
+    ):
+        self.media_type = media_type
+        self.stream = stream
+        self.if_none_match = if_none_match
+        self.response_cache = response_cache
+        self.content_encoding = content_encoding
+
+    def is_not_modified(self, count: int) -> bool:
+        return etag_matches(
+            if_none_match=self.if_none_match,
+            etag=prime_etag(count=count, media_type=self.media_type),
+        )
+
+    def get_not_modified_response(self, count: int) -> Response:
+        return Response(status_code=304, headers=self._get_cache_headers(count=count))
+
+    def get_cached_success_response(self, count: int) -> Optional[Response]:
+        if not self._is_body_cacheable():
+            return None
+
+        entry = self.response_cache.get(key=self._get_body_cache_key(count=count))
+        if entry is None:
+            return None
+        return self._get_body_response(body=entry.body, headers=entry.headers)
+
+    def get_success_response(self, result: PrimeNumbersResultDTO) -> Response:
+        fields = {"count": result.count}
+        headers = self._get_cache_headers(count=result.count)
+        if not self._is_body_cacheable():
+            return self._get_primes_response(
+                fields=fields, primes=result.primes, headers=headers
+            )
+
+        body, headers = self._compress_body(
+            *self._encode_primes_body(
+                fields=fields, primes=result.primes, headers=headers
+            )
+        )
+        self.response_cache.put(
+            key=self._get_body_cache_key(count=result.count),
+            entry=CachedResponseBody(body=body, headers=headers),
+        )
+        return self._get_body_response(body=body, headers=headers)
+
+    def get_page_success_response(self, result: PrimePageResultDTO) -> Response:
+        response = {
+            "offset": result.offset,
+            "count": len(result.primes),
+            "primes": list(result.primes),
+            "next_cursor": result.next_cursor,
+        }
+        return self._get_compressed_json_response(content=response)
+
+    def get_range_success_response(self, result: PrimeRangeResultDTO) -> Response:
+        fields = {"lo": result.lo, "hi": result.hi, "count": result.count}
+        return self._get_primes_response(fields=fields, primes=result.primes)
+
+    def get_check_success_response(self, result: PrimalityCheckResultDTO) -> Response:
+        response = {
+            "count": len(result.numbers),
+            "results": [
+                {"number": number, "is_prime": is_prime}
+                for number, is_prime in zip(result.numbers, result.results)
+            ],
+        }
+        return self._get_compressed_json_response(content=response)
+
+    def get_nth_prime_success_response(self, result: NthPrimeResultDTO) -> Response:
+        response = {"n": result.n, "prime": result.prime}
+        return FastJSONResponse(content=response, status_code=200)
+
+    def get_prime_count_success_response(self, result: PrimeCountResultDTO) -> Response:
+        response = {"x": result.x, "count": result.count}
+        return FastJSONResponse(content=response, status_code=200)
 
     def get_invalid_input_response(self, message: str) -> JSONResponse:
         response = {"error": {"code": "INVALID_INPUT"}}
-        return JSONResponse(content=response, status_code=400)
+        return FastJSONResponse(content=response, status_code=400)
+
+    def get_timeout_response(self) -> JSONResponse:
+        response = {"error": {"code": "PRIME_COMPUTATION_TIMEOUT"}}
+        return FastJSONResponse(content=response, status_code=503)
+
+    def _get_cache_headers(self, count: int) -> dict[str, str]:
+        # 200 and 304 must send the same ETag, so it is weak whenever the
+        # body may be compressed rather than only when this one was.
+        etag = prime_etag(count=count, media_type=self.media_type)
+        if self._is_compressible():
+            etag = "W/" + etag
+        return {
+            "ETag": etag,
+            "Cache-Control": PRIME_CACHE_CONTROL,
+            "Vary": "Accept, Accept-Encoding",
+        }
+
+    def _is_compressible(self) -> bool:
+        return (
+            self.content_encoding != IDENTITY_ENCODING
+            and not self.stream
+            and self.media_type != NDJSON_MEDIA_TYPE
+        )
+
+    def _is_body_cacheable(self) -> bool:
+        return (
+            self.response_cache is not None
+            and not self.stream
+            and self.media_type != NDJSON_MEDIA_TYPE
+        )
+
+    def _get_body_cache_key(self, count: int) -> ResponseCacheKey:
+        return count, self.media_type, self.content_encoding
+
+    def _get_body_response(self, body: bytes, headers: dict[str, str]) -> Response:
+        return Response(
+            content=body, status_code=200, media_type=self.media_type, headers=headers
+        )
+
+    def _get_compressed_json_response(self, content: dict) -> Response:
+        body, headers = self._compress_body(
+            body=dumps_json(content=content), headers={}
+        )
+        return Response(
+            content=body, status_code=200, media_type=JSON_MEDIA_TYPE, headers=headers
+        )
+
+    def _compress_body(
+        self, body: bytes, headers: dict[str, str]
+    ) -> tuple[bytes, dict[str, str]]:
+        headers = {"Vary": "Accept-Encoding", **headers}
+        if (
+            self.content_encoding == IDENTITY_ENCODING
+            or len(body) < settings.PRIME_COMPRESSION_MIN_BYTES
+        ):
+            return body, headers
+
+        headers["Content-Encoding"] = self.content_encoding
+        return compress_body(body=body, encoding=self.content_encoding), headers
+
+    def _encode_primes_body(
+        self, fields: dict[str, int], primes: Sequence[int], headers: dict[str, str]
+    ) -> tuple[bytes, dict[str, str]]:
+        if self.media_type == BINARY_MEDIA_TYPE:
+            body, item_size = pack_primes(primes=primes)
+            return body, {
+                **headers,
+                "X-Prime-Count": str(fields["count"]),
+                "X-Prime-Item-Size": str(item_size),
+            }
+
+        response = {**fields, "primes": list(primes)}
+        return dumps_json(content=response), headers
+
+    def _get_primes_response(
+        self,
+        fields: dict[str, int],
+        primes: Sequence[int],
+        headers: Optional[dict[str, str]] = None,
+    ) -> Response:
+        headers = headers or {}
+        count_headers = {**headers, "X-Prime-Count": str(fields["count"])}
+
+        if self.media_type == NDJSON_MEDIA_TYPE:
+            return StreamingResponse(
+                content=self._iter_ndjson_chunks(primes=primes),
+                status_code=200,
+                media_type=NDJSON_MEDIA_TYPE,
+                headers=count_headers,
+            )
+
+        if self.stream and self.media_type == JSON_MEDIA_TYPE:
+            return StreamingResponse(
+                content=self._iter_json_chunks(fields=fields, primes=primes),
+                status_code=200,
+                media_type=JSON_MEDIA_TYPE,
+                headers=headers,
+            )
+
+        body, headers = self._compress_body(
+            *self._encode_primes_body(fields=fields, primes=primes, headers=headers)
+        )
+        return self._get_body_response(body=body, headers=headers)
+
+    def _iter_json_chunks(
+        self, fields: dict[str, int], primes: Sequence[int]
+    ) -> Iterator[bytes]:
+        yield dumps_json(content=fields)[:-1] + b',"primes":['
+
+        for start in range(0, len(primes), STREAM_CHUNK_SIZE):
+            chunk = ",".join(map(str, primes[start : start + STREAM_CHUNK_SIZE]))
+            yield (chunk if start == 0 else "," + chunk).encode()
+
+        yield b"]}"
+
+    def _iter_ndjson_chunks(self, primes: Sequence[int]) -> Iterator[bytes]:
+        for start in range(0, len(primes), STREAM_CHUNK_SIZE):
+            chunk = "\n".join(map(str, primes[start : start + STREAM_CHUNK_SIZE]))
+            yield (chunk + "\n").encode()
@@ -0,0 +1,56 @@
+import sys
+from array import array
+from typing import Optional, Sequence
+
+JSON_MEDIA_TYPE = "application/json"
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+BINARY_MEDIA_TYPE = "application/octet-stream"
+
+PRIME_MEDIA_TYPES = (JSON_MEDIA_TYPE, NDJSON_MEDIA_TYPE, BINARY_MEDIA_TYPE)
+
+UINT32_LIMIT = 1 << 32
+
+
+def negotiate_prime_media_type(accept: Optional[str]) -> str:
+    best_media_type = JSON_MEDIA_TYPE
+    best_quality = 0.0
+
+    for media_range in (accept or "").split(","):
+        media_type, _, params = media_range.strip().partition(";")
+        media_type = media_type.strip().lower()
+        if media_type not in PRIME_MEDIA_TYPES:
+            continue
+
+        quality = parse_quality(params=params)
+        if quality > best_quality:
+            best_media_type, best_quality = media_type, quality
+
+    return best_media_type
+
+
+def parse_quality(params: str) -> float:
+    for param in params.split(";"):
+        name, _, value = param.strip().partition("=")
+        if name.strip().lower() == "q":
+            try:
+                return float(value)
+            except ValueError:
+                return 0.0
+    return 1.0
+
+
+def pack_primes(primes: Sequence[int]) -> tuple[bytes, int]:
+    """Pack primes as little-endian uint32, or uint64 if any prime needs it."""
+    largest = primes[-1] if len(primes) else 0
+    typecode = "I" if largest < UINT32_LIMIT else "Q"
+
+    if sys.byteorder == "little":
+        if isinstance(primes, memoryview) and primes.format == typecode:
+            return primes.tobytes(), primes.itemsize
+        if isinstance(primes, array) and primes.typecode == typecode:
+            return primes.tobytes(), primes.itemsize
+
+    packed = array(typecode, primes)
+    if sys.byteorder != "little":
+        packed.byteswap()
+    return packed.tobytes(), packed.itemsize
@@ -0,0 +1,73 @@
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+from app import settings
+from app.observability.custom_metrics import record_response_cache_lookup
+
+IDENTITY_ENCODING = "identity"
+
+ResponseCacheKey = tuple[int, str, str]
+
+
+@dataclass(frozen=True)
+class CachedResponseBody:
+    body: bytes
+    headers: dict[str, str]
+
+
+class ResponseBodyCache:
+    """LRU of encoded response bodies, bounded by their total size in bytes."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries: OrderedDict[ResponseCacheKey, CachedResponseBody] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: ResponseCacheKey) -> Optional[CachedResponseBody]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+
+        record_response_cache_lookup(hit=entry is not None)
+        return entry
+
+    def put(self, key: ResponseCacheKey, entry: CachedResponseBody) -> None:
+        if len(entry.body) > self.max_bytes:
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.size -= len(previous.body)
+
+            self._entries[key] = entry
+            self.size += len(entry.body)
+            while self.size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.size -= len(evicted.body)
+
+
+_response_cache: Optional[ResponseBodyCache] = None
+_response_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> Optional[ResponseBodyCache]:
+    global _response_cache
+
+    if settings.PRIME_RESPONSE_CACHE_MAX_BYTES <= 0:
+        return None
+
+    if _response_cache is None:
+        with _response_cache_lock:
+            if _response_cache is None:
+                _response_cache = ResponseBodyCache(
+                    max_bytes=settings.PRIME_RESPONSE_CACHE_MAX_BYTES
+                )
+    return _response_cache
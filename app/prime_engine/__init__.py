@@ -0,0 +1,30 @@
+from app.prime_engine.bitset_table import BitsetPrimeTable
+from app.prime_engine.engine_implementation import (
+    NumpySievePrimeEngine,
+    SievePrimeEngine,
+    TablePrimeEngine,
+)
+from app.prime_engine.executor import (
+    get_prime_executor,
+    run_prime_engine,
+    shutdown_prime_executor,
+    start_prime_executor,
+)
+from app.prime_engine.factory import get_prime_engine, get_prime_table, get_sieve_engine
+from app.prime_engine.prime_table import MappedPrimeTable, PrimeTable
+
+__all__ = [
+    "BitsetPrimeTable",
+    "MappedPrimeTable",
+    "NumpySievePrimeEngine",
+    "PrimeTable",
+    "SievePrimeEngine",
+    "TablePrimeEngine",
+    "get_prime_engine",
+    "get_prime_executor",
+    "get_prime_table",
+    "get_sieve_engine",
+    "run_prime_engine",
+    "shutdown_prime_executor",
+    "start_prime_executor",
+]
@@ -0,0 +1,223 @@
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import chain, compress, cycle, repeat
+from math import isqrt
+from operator import add
+from typing import Optional, Sequence
+
+from app.interactos.prime_engine_interface import IPrimeEngine
+from app.prime_engine.numpy_sieve import (
+    NUMPY_AVAILABLE,
+    WHEEL,
+    WHEEL_PRIMES,
+    WHEEL_RESIDUES,
+    np,
+)
+from app.prime_engine.prime_table import DEFAULT_INITIAL_COUNT, PRIME_TYPECODE
+from app.prime_engine.sieve import estimate_nth_prime_upper_bound
+
+RANK_BLOCK_SIZE = 64
+
+_RESIDUE_BITS = [0] * WHEEL
+for _bit, _residue in enumerate(WHEEL_RESIDUES):
+    _RESIDUE_BITS[_residue] = 1 << _bit
+
+# Bits of a byte that stand for residues <= r, for r in 0..29.
+_PREFIX_MASKS = [
+    sum(1 << bit for bit, residue in enumerate(WHEEL_RESIDUES) if residue <= r)
+    for r in range(WHEEL)
+]
+_EXPANDED_BYTES = [
+    bytes((byte >> bit) & 1 for bit in range(len(WHEEL_RESIDUES)))
+    for byte in range(256)
+]
+
+
+class _WheelBitset:
+    def __init__(self, bits: bytes, limit: int):
+        self.bits = bits
+        self.limit = limit
+        self.ranks = array("I", [0])
+        for start in range(0, len(bits), RANK_BLOCK_SIZE):
+            block = bits[start : start + RANK_BLOCK_SIZE]
+            self.ranks.append(self.ranks[-1] + _popcount(block))
+        self.count = sum(p < limit for p in WHEEL_PRIMES) + self.ranks[-1]
+        self.largest = self._largest()
+
+    def _largest(self) -> int:
+        for index in range(len(self.bits) - 1, -1, -1):
+            if self.bits[index]:
+                return WHEEL * index + WHEEL_RESIDUES[self.bits[index].bit_length() - 1]
+        return max((p for p in WHEEL_PRIMES if p < self.limit), default=0)
+
+
+class BitsetPrimeTable:
+    """Prime cache stored as a mod-30 wheel bitset: one byte per 30 integers.
+
+    Bit ``i`` of byte ``k`` is set when ``30 * k + WHEEL_RESIDUES[i]`` is
+    prime; 2, 3 and 5 are implied. Membership is a single bit test, and a
+    cumulative popcount every ``RANK_BLOCK_SIZE`` bytes keeps ``nth`` and
+    ``count_up_to`` from scanning the whole table. It grows on demand like
+    ``PrimeTable``, at roughly ln(p) / 30 bytes per cached prime.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        sieve_engine: IPrimeEngine,
+        initial_count: int = DEFAULT_INITIAL_COUNT,
+    ):
+        self.capacity = capacity
+        self.sieve_engine = sieve_engine
+        self.initial_count = min(initial_count, capacity)
+        self._bitset: Optional[_WheelBitset] = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._bitset is not None
+
+    def cached_count(self) -> int:
+        bitset = self._bitset
+        return bitset.count if bitset is not None else 0
+
+    def load(self) -> bytes:
+        return self._load().bits
+
+    def extend_to(self, count: int) -> bytes:
+        return self._extend_to(count=count).bits
+
+    def first(self, count: int) -> Sequence[int]:
+        bitset = self._extend_to(count=count)
+        return self._decode(bitset=bitset, limit=self._nth(bitset=bitset, n=count))
+
+    def page(self, offset: int, count: int) -> Sequence[int]:
+        bitset = self._extend_to(count=offset + count)
+        lo = self._nth(bitset=bitset, n=offset) + 1 if offset else 0
+        return self._decode(
+            bitset=bitset, limit=self._nth(bitset=bitset, n=offset + count), lo=lo
+        )
+
+    def primes_up_to(self, limit: int) -> Optional[Sequence[int]]:
+        bitset = self._load()
+        if bitset.largest < limit:
+            return None
+        return self._decode(bitset=bitset, limit=limit)
+
+    def covers(self, n: int) -> bool:
+        return n <= self._load().largest
+
+    def contains(self, n: int) -> bool:
+        bitset = self._load()
+        if n in WHEEL_PRIMES:
+            return n <= bitset.largest
+        if n < 0 or n > bitset.largest:
+            return False
+        return bool(bitset.bits[n // WHEEL] & _RESIDUE_BITS[n % WHEEL])
+
+    def nth(self, n: int) -> int:
+        return self._nth(bitset=self._extend_to(count=n), n=n)
+
+    def count_up_to(self, limit: int) -> int:
+        bitset = self._load()
+        limit = min(limit, bitset.largest)
+        if limit < WHEEL_PRIMES[-1]:
+            return sum(p <= limit for p in WHEEL_PRIMES)
+
+        index, residue = divmod(limit, WHEEL)
+        block = index // RANK_BLOCK_SIZE
+        start = block * RANK_BLOCK_SIZE
+        return (
+            len(WHEEL_PRIMES)
+            + bitset.ranks[block]
+            + _popcount(bitset.bits[start:index])
+            + (bitset.bits[index] & _PREFIX_MASKS[residue]).bit_count()
+        )
+
+    def _load(self) -> _WheelBitset:
+        if self._bitset is not None:
+            return self._bitset
+        return self._extend_to(count=self.initial_count)
+
+    def _extend_to(self, count: int) -> _WheelBitset:
+        bitset = self._bitset
+        if bitset is not None and bitset.count >= count:
+            return bitset
+        if count > self.capacity:
+            raise ValueError(f"count {count} exceeds table capacity {self.capacity}")
+
+        with self._lock:
+            if self._bitset is None or self._bitset.count < count:
+                self._bitset = self._extend(bitset=self._bitset, count=count)
+        return self._bitset
+
+    def _extend(self, bitset: Optional[_WheelBitset], count: int) -> _WheelBitset:
+        if bitset is None:
+            target, lo, bits = max(count, self.initial_count), 0, bytearray()
+        else:
+            target = min(max(count, 2 * bitset.count), self.capacity)
+            lo, bits = bitset.limit, bytearray(bitset.bits)
+
+        hi = estimate_nth_prime_upper_bound(n=target) + 1
+        base_primes = None
+        if bitset is not None:
+            base_primes = self.primes_up_to(limit=isqrt(hi - 1))
+        tail = self.sieve_engine.primes_in_range(lo=lo, hi=hi, base_primes=base_primes)
+
+        bits.extend(bytes(-(-hi // WHEEL) - len(bits)))
+        for p in tail:
+            if p > WHEEL_PRIMES[-1]:
+                bits[p // WHEEL] |= _RESIDUE_BITS[p % WHEEL]
+        return _WheelBitset(bits=bytes(bits), limit=hi)
+
+    def _nth(self, bitset: _WheelBitset, n: int) -> int:
+        if n <= len(WHEEL_PRIMES):
+            return WHEEL_PRIMES[n - 1]
+
+        rank = n - len(WHEEL_PRIMES)
+        block = bisect_right(bitset.ranks, rank - 1) - 1
+        rank -= bitset.ranks[block]
+        for index in range(block * RANK_BLOCK_SIZE, len(bitset.bits)):
+            byte = bitset.bits[index]
+            if byte.bit_count() < rank:
+                rank -= byte.bit_count()
+                continue
+            for bit, residue in enumerate(WHEEL_RESIDUES):
+                if byte >> bit & 1:
+                    rank -= 1
+                    if rank == 0:
+                        return WHEEL * index + residue
+        raise IndexError(f"table holds fewer than {n} primes")
+
+    def _decode(self, bitset: _WheelBitset, limit: int, lo: int = 0) -> array:
+        primes = array(PRIME_TYPECODE, [p for p in WHEEL_PRIMES if lo <= p <= limit])
+        first_byte = lo // WHEEL
+        bits = bitset.bits[first_byte : limit // WHEEL + 1]
+
+        if NUMPY_AVAILABLE:
+            flags = np.unpackbits(
+                np.frombuffer(bits, dtype=np.uint8), bitorder="little"
+            )
+            positions = np.flatnonzero(flags)
+            values = ((positions >> 3) + first_byte) * WHEEL + np.array(WHEEL_RESIDUES)[
+                positions & 7
+            ]
+            primes.frombytes(values.astype(np.dtype(PRIME_TYPECODE)).tobytes())
+        else:
+            flags = b"".join(map(_EXPANDED_BYTES.__getitem__, bits))
+            start = WHEEL * first_byte
+            rows = map(
+                repeat, range(start, start + WHEEL * len(bits), WHEEL), repeat(8)
+            )
+            candidates = map(add, chain.from_iterable(rows), cycle(WHEEL_RESIDUES))
+            primes.extend(compress(candidates, flags))
+
+        while primes and primes[-1] > limit:
+            primes.pop()
+        del primes[: bisect_left(primes, lo)]
+        return primes
+
+
+def _popcount(data: bytes) -> int:
+    return int.from_bytes(data, "little").bit_count()
@@ -0,0 +1,115 @@
+from math import isqrt, log
+from typing import Callable, Optional, Sequence
+
+from app.prime_engine.sieve import primes_in_range, sieve_of_eratosthenes
+
+NTH_PRIME_WINDOW = 1 << 16
+PAGE_WINDOW_MARGIN = 1 << 8
+UINT64_LIMIT = 1 << 64
+
+
+def prime_count(x: int, base_primes: Optional[Sequence[int]] = None) -> int:
+    """pi(x) by the Lucy_Hedgehog method in O(x^(3/4)) time and O(sqrt(x)) space."""
+    if x < 2:
+        return 0
+
+    root = isqrt(x)
+    if base_primes is None:
+        base_primes = sieve_of_eratosthenes(limit=root)
+
+    # small[v] = pi-so-far(v) for v <= root, large[i] = pi-so-far(x // i) for i <= root.
+    small = [v - 1 for v in range(root + 1)]
+    large = [0] + [x // i - 1 for i in range(1, root + 1)]
+
+    for primes_below_p, p in enumerate(base_primes):
+        square = p * p
+        if square > x:
+            break
+
+        last_large = min(root, x // square)
+        large[1 : last_large + 1] = [
+            large[i]
+            - (large[i * p] if i * p <= root else small[x // (i * p)])
+            + primes_below_p
+            for i in range(1, last_large + 1)
+        ]
+        small[square : root + 1] = [
+            small[v] - small[v // p] + primes_below_p for v in range(square, root + 1)
+        ]
+
+    return large[1]
+
+
+def estimate_nth_prime(n: int) -> int:
+    if n < 6:
+        return (2, 3, 5, 7, 11)[n - 1]
+
+    ln_n = log(n)
+    ln_ln_n = log(ln_n)
+    # Cipolla (1902) asymptotic expansion, accurate to well under 0.1% for n >= 10^6.
+    return int(n * (ln_n + ln_ln_n - 1 + (ln_ln_n - 2) / ln_n))
+
+
+def nth_prime(
+    n: int,
+    base_primes: Optional[Sequence[int]] = None,
+    count_primes: Callable[..., int] = prime_count,
+    sieve_range: Callable[..., Sequence[int]] = primes_in_range,
+) -> int:
+    """The n-th prime (1-indexed): count up to an estimate, then sieve locally."""
+    if n < 1:
+        raise ValueError("n must be positive")
+
+    x = estimate_nth_prime(n=n)
+    base_primes = _cover(base_primes=base_primes, limit=x + NTH_PRIME_WINDOW)
+    count = count_primes(x=x, base_primes=base_primes)
+
+    # count = pi(x); walk windows forward from x + 1 or backward from x.
+    while count < n:
+        hi = x + 1 + NTH_PRIME_WINDOW
+        base_primes = _cover(base_primes=base_primes, limit=hi)
+        window = sieve_range(lo=x + 1, hi=hi, base_primes=base_primes)
+        if count + len(window) >= n:
+            return window[n - count - 1]
+        count += len(window)
+        x += NTH_PRIME_WINDOW
+
+    while True:
+        lo = max(x + 1 - NTH_PRIME_WINDOW, 0)
+        window = sieve_range(lo=lo, hi=x + 1, base_primes=base_primes)
+        if count - len(window) < n:
+            return window[n - (count - len(window)) - 1]
+        count -= len(window)
+        x = lo - 1
+
+
+def estimate_page_end(lo: int, count: int) -> int:
+    # Primes near x are ln(x) apart on average; the slack absorbs local gaps.
+    return lo + int(1.25 * count * log(max(lo, count, 3))) + PAGE_WINDOW_MARGIN
+
+
+def primes_from(
+    lo: int,
+    count: int,
+    base_primes: Optional[Sequence[int]] = None,
+    sieve_range: Callable[..., Sequence[int]] = primes_in_range,
+) -> list[int]:
+    """The first ``count`` primes >= lo, sieving only a window just past lo.
+
+    Stops at 2^64, so fewer than ``count`` primes come back near the top.
+    """
+    primes: list[int] = []
+    while len(primes) < count and lo < UINT64_LIMIT:
+        hi = min(estimate_page_end(lo=lo, count=count - len(primes)), UINT64_LIMIT)
+        base_primes = _cover(base_primes=base_primes, limit=hi)
+        window = sieve_range(lo=lo, hi=hi, base_primes=base_primes)
+        primes.extend(window[: count - len(primes)])
+        lo = hi
+    return primes
+
+
+def _cover(base_primes: Optional[Sequence[int]], limit: int) -> Sequence[int]:
+    root = isqrt(limit)
+    if base_primes is not None and len(base_primes) and base_primes[-1] >= root:
+        return base_primes
+    return sieve_of_eratosthenes(limit=2 * root)
@@ -0,0 +1,159 @@
+from math import isqrt
+from typing import Optional, Sequence, Union
+
+from app.interactos.prime_engine_interface import IPrimeEngine
+from app.prime_engine.bitset_table import BitsetPrimeTable
+from app.prime_engine.counting import (
+    estimate_page_end,
+    nth_prime,
+    prime_count,
+    primes_from,
+)
+from app.prime_engine.numpy_sieve import (
+    NUMPY_AVAILABLE,
+    numpy_first_n_primes,
+    numpy_prime_count,
+    numpy_primes_in_range,
+)
+from app.prime_engine.primality import is_prime
+from app.prime_engine.prime_table import MappedPrimeTable, PrimeTable
+from app.prime_engine.sieve import (
+    estimate_nth_prime_upper_bound,
+    first_n_primes,
+    primes_in_range,
+)
+
+
+class SievePrimeEngine(IPrimeEngine):
+    def first_n_primes(self, count: int) -> Sequence[int]:
+        if count <= 0:
+            return []
+
+        return first_n_primes(count=count)
+
+    def primes_in_range(
+        self, lo: int, hi: int, base_primes: Optional[Sequence[int]] = None
+    ) -> Sequence[int]:
+        return primes_in_range(lo=lo, hi=hi, base_primes=base_primes)
+
+    def primes_from(
+        self, lo: int, count: int, base_primes: Optional[Sequence[int]] = None
+    ) -> Sequence[int]:
+        return primes_from(lo=lo, count=count, base_primes=base_primes)
+
+    def are_primes(self, numbers: Sequence[int]) -> list[bool]:
+        return [is_prime(n=n) for n in numbers]
+
+    def nth_prime(self, n: int, base_primes: Optional[Sequence[int]] = None) -> int:
+        return nth_prime(n=n, base_primes=base_primes)
+
+    def prime_count(self, x: int, base_primes: Optional[Sequence[int]] = None) -> int:
+        return prime_count(x=x, base_primes=base_primes)
+
+
+class NumpySievePrimeEngine(IPrimeEngine):
+    def __init__(self):
+        if not NUMPY_AVAILABLE:
+            raise ImportError("NumpySievePrimeEngine requires numpy")
+
+    def first_n_primes(self, count: int) -> Sequence[int]:
+        if count <= 0:
+            return []
+
+        return numpy_first_n_primes(count=count)
+
+    def primes_in_range(
+        self, lo: int, hi: int, base_primes: Optional[Sequence[int]] = None
+    ) -> Sequence[int]:
+        return numpy_primes_in_range(lo=lo, hi=hi, base_primes=base_primes)
+
+    def primes_from(
+        self, lo: int, count: int, base_primes: Optional[Sequence[int]] = None
+    ) -> Sequence[int]:
+        return primes_from(
+            lo=lo,
+            count=count,
+            base_primes=base_primes,
+            sieve_range=numpy_primes_in_range,
+        )
+
+    def are_primes(self, numbers: Sequence[int]) -> list[bool]:
+        return [is_prime(n=n) for n in numbers]
+
+    def nth_prime(self, n: int, base_primes: Optional[Sequence[int]] = None) -> int:
+        return nth_prime(
+            n=n,
+            base_primes=base_primes,
+            count_primes=numpy_prime_count,
+            sieve_range=numpy_primes_in_range,
+        )
+
+    def prime_count(self, x: int, base_primes: Optional[Sequence[int]] = None) -> int:
+        return numpy_prime_count(x=x, base_primes=base_primes)
+
+
+class TablePrimeEngine(IPrimeEngine):
+    def __init__(
+        self,
+        table: Union[PrimeTable, MappedPrimeTable, BitsetPrimeTable],
+        fallback_engine: IPrimeEngine,
+    ):
+        self.table = table
+        self.fallback_engine = fallback_engine
+
+    def cached_prime_count(self) -> int:
+        return self.table.cached_count()
+
+    def first_n_primes(self, count: int) -> Sequence[int]:
+        if count <= 0:
+            return []
+
+        if count > self.table.capacity:
+            return self.fallback_engine.first_n_primes(count=count)
+        return self.table.first(count=count)
+
+    def primes_in_range(
+        self, lo: int, hi: int, base_primes: Optional[Sequence[int]] = None
+    ) -> Sequence[int]:
+        if base_primes is None and hi > 2:
+            base_primes = self.table.primes_up_to(limit=isqrt(hi - 1))
+        return self.fallback_engine.primes_in_range(
+            lo=lo, hi=hi, base_primes=base_primes
+        )
+
+    def primes_from(
+        self, lo: int, count: int, base_primes: Optional[Sequence[int]] = None
+    ) -> Sequence[int]:
+        if self.table.covers(n=lo):
+            offset = self.table.count_up_to(limit=lo - 1)
+            if offset + count <= self.table.capacity:
+                return self.table.page(offset=offset, count=count)
+        if base_primes is None:
+            base_primes = self.table.primes_up_to(
+                limit=isqrt(estimate_page_end(lo=lo, count=count))
+            )
+        return self.fallback_engine.primes_from(
+            lo=lo, count=count, base_primes=base_primes
+        )
+
+    def are_primes(self, numbers: Sequence[int]) -> list[bool]:
+        return [
+            self.table.contains(n=n) if self.table.covers(n=n) else is_prime(n=n)
+            for n in numbers
+        ]
+
+    def nth_prime(self, n: int, base_primes: Optional[Sequence[int]] = None) -> int:
+        if n <= self.table.capacity:
+            return self.table.nth(n=n)
+        if base_primes is None:
+            base_primes = self.table.primes_up_to(
+                limit=isqrt(estimate_nth_prime_upper_bound(n=n))
+            )
+        return self.fallback_engine.nth_prime(n=n, base_primes=base_primes)
+
+    def prime_count(self, x: int, base_primes: Optional[Sequence[int]] = None) -> int:
+        if self.table.covers(n=x):
+            return self.table.count_up_to(limit=x)
+        if base_primes is None:
+            base_primes = self.table.primes_up_to(limit=isqrt(x))
+        return self.fallback_engine.prime_count(x=x, base_primes=base_primes)
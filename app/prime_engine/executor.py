@@ -0,0 +1,153 @@
+import asyncio
+import multiprocessing
+from array import array
+from concurrent.futures import Future, ProcessPoolExecutor
+from math import isqrt
+from typing import Any, Optional, Sequence
+
+from app import settings
+from app.exceptions import PrimeComputationTimeoutException
+from app.interactos.prime_engine_interface import IPrimeEngine
+from app.observability.custom_metrics import record_prime_executor_queue_depth
+from app.prime_engine.factory import get_prime_engine
+from app.prime_engine.parallel_sieve import (
+    SharedSegment,
+    discard_segment_future,
+    read_shared_segments,
+    split_range,
+    write_shared_segment,
+)
+from app.prime_engine.sieve import (
+    estimate_nth_prime_upper_bound,
+    prime_typecode,
+    sieve_of_eratosthenes,
+)
+
+SEGMENTS_PER_WORKER = 4
+
+_executor: Optional[ProcessPoolExecutor] = None
+_worker_count = 0
+_worker_engine: Optional[IPrimeEngine] = None
+
+
+def start_prime_executor(
+    max_workers: int = settings.PRIME_WORKER_COUNT,
+) -> Optional[ProcessPoolExecutor]:
+    global _executor, _worker_count
+
+    if _executor is None and max_workers > 0:
+        _worker_count = max_workers
+        _executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_initialize_worker,
+        )
+    return _executor
+
+
+def shutdown_prime_executor() -> None:
+    global _executor
+
+    if _executor is not None:
+        _executor.shutdown(wait=True, cancel_futures=True)
+        _executor = None
+
+
+def get_prime_executor() -> Optional[ProcessPoolExecutor]:
+    return _executor
+
+
+async def run_prime_engine(
+    prime_engine: IPrimeEngine,
+    method: str,
+    timeout: float = settings.PRIME_REQUEST_TIMEOUT_SECONDS,
+    **kwargs: Any,
+) -> Any:
+    """Run ``prime_engine.<method>(**kwargs)`` without blocking the event loop.
+
+    With a pool running, the call executes on the worker's own engine, built
+    from the same factories as the routers', so only the arguments and the
+    result cross the process boundary. Without a pool it runs inline.
+    """
+    if _executor is None:
+        return getattr(prime_engine, method)(**kwargs)
+
+    future = _submit(_call_worker_engine, method, kwargs)
+
+    try:
+        return await asyncio.wait_for(asyncio.wrap_future(future), timeout=timeout)
+    except asyncio.TimeoutError:
+        raise PrimeComputationTimeoutException()
+
+
+async def run_parallel_first_n_primes(
+    prime_engine: IPrimeEngine,
+    count: int,
+    timeout: float = settings.PRIME_REQUEST_TIMEOUT_SECONDS,
+) -> Sequence[int]:
+    """Sieve the first ``count`` primes in segments spread across the pool.
+
+    Each worker hands its segment back through shared memory, so only the
+    segment bounds and the base primes are pickled.
+    """
+    if _executor is None:
+        return await run_prime_engine(
+            prime_engine, "first_n_primes", timeout=timeout, count=count
+        )
+
+    limit = estimate_nth_prime_upper_bound(n=count) + 1
+    base_primes = sieve_of_eratosthenes(limit=isqrt(limit - 1))
+    typecode = prime_typecode(limit=limit)
+    futures = [
+        _submit(_sieve_worker_segment, lo, hi, base_primes, typecode)
+        for lo, hi in split_range(
+            lo=0, hi=limit, parts=_worker_count * SEGMENTS_PER_WORKER
+        )
+    ]
+
+    try:
+        segments = await asyncio.wait_for(
+            asyncio.gather(*map(asyncio.wrap_future, futures)), timeout=timeout
+        )
+    except BaseException as e:
+        for future in futures:
+            future.add_done_callback(discard_segment_future)
+        if isinstance(e, asyncio.TimeoutError):
+            raise PrimeComputationTimeoutException()
+        raise
+    return read_shared_segments(segments=segments, count=count)
+
+
+def _submit(fn, *args) -> Future:
+    future = _executor.submit(fn, *args)
+    record_prime_executor_queue_depth(delta=1)
+    future.add_done_callback(_on_task_done)
+    return future
+
+
+def _on_task_done(future: Future) -> None:
+    record_prime_executor_queue_depth(delta=-1)
+
+
+def _initialize_worker() -> None:
+    global _worker_engine
+
+    _worker_engine = get_prime_engine()
+    if settings.PRIME_TABLE_PRELOAD:
+        _worker_engine.table.load()
+
+
+def _call_worker_engine(method: str, kwargs: dict[str, Any]) -> Any:
+    result = getattr(_worker_engine, method)(**kwargs)
+    if isinstance(result, memoryview):
+        primes = array(result.format)
+        primes.frombytes(result)
+        return primes
+    return result
+
+
+def _sieve_worker_segment(
+    lo: int, hi: int, base_primes: Sequence[int], typecode: str
+) -> SharedSegment:
+    primes = _worker_engine.primes_in_range(lo=lo, hi=hi, base_primes=base_primes)
+    return write_shared_segment(primes=primes, typecode=typecode)
@@ -0,0 +1,62 @@
+import logging
+import os
+import threading
+from typing import Optional, Union
+
+from app import settings
+from app.constants import MAX_PRIME_COUNT
+from app.interactos.prime_engine_interface import IPrimeEngine
+from app.prime_engine.bitset_table import BitsetPrimeTable
+from app.prime_engine.engine_implementation import (
+    NumpySievePrimeEngine,
+    SievePrimeEngine,
+    TablePrimeEngine,
+)
+from app.prime_engine.numpy_sieve import NUMPY_AVAILABLE
+from app.prime_engine.prime_table import MappedPrimeTable, PrimeTable
+
+SIEVE_BACKEND_PYTHON = "python"
+SIEVE_BACKEND_NUMPY = "numpy"
+TABLE_STORAGE_ARRAY = "array"
+TABLE_STORAGE_BITSET = "bitset"
+
+logger = logging.getLogger(__name__)
+
+_prime_table: Optional[Union[PrimeTable, MappedPrimeTable, BitsetPrimeTable]] = None
+_prime_table_lock = threading.Lock()
+
+
+def get_sieve_engine(backend: str = settings.PRIME_SIEVE_BACKEND) -> IPrimeEngine:
+    if backend == SIEVE_BACKEND_NUMPY:
+        if NUMPY_AVAILABLE:
+            return NumpySievePrimeEngine()
+        logger.warning("numpy is not installed, using the pure-Python sieve")
+    return SievePrimeEngine()
+
+
+def get_prime_engine() -> IPrimeEngine:
+    return TablePrimeEngine(table=get_prime_table(), fallback_engine=get_sieve_engine())
+
+
+def get_prime_table() -> Union[PrimeTable, MappedPrimeTable, BitsetPrimeTable]:
+    global _prime_table
+
+    if _prime_table is None:
+        with _prime_table_lock:
+            if _prime_table is None:
+                _prime_table = _open_prime_table(path=settings.PRIME_TABLE_PATH)
+    return _prime_table
+
+
+def _open_prime_table(
+    path: str, storage: str = settings.PRIME_TABLE_STORAGE
+) -> Union[PrimeTable, MappedPrimeTable, BitsetPrimeTable]:
+    if path and os.path.isfile(path):
+        return MappedPrimeTable(path=path)
+
+    table_class = BitsetPrimeTable if storage == TABLE_STORAGE_BITSET else PrimeTable
+    return table_class(
+        capacity=MAX_PRIME_COUNT,
+        sieve_engine=get_sieve_engine(),
+        initial_count=settings.PRIME_TABLE_INITIAL_COUNT,
+    )
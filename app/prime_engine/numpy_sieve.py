@@ -0,0 +1,134 @@
+from array import array
+from math import isqrt
+from typing import Optional, Sequence
+
+from app.prime_engine.sieve import (
+    estimate_nth_prime_upper_bound,
+    prime_typecode,
+    sieve_of_eratosthenes,
+)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+NUMPY_AVAILABLE = np is not None
+
+# Mod-30 wheel: only integers coprime to 2, 3 and 5 are stored, 8 per row of 30.
+WHEEL = 30
+WHEEL_PRIMES = (2, 3, 5)
+WHEEL_RESIDUES = (1, 7, 11, 13, 17, 19, 23, 29)
+
+
+def numpy_primes_up_to(limit: int) -> "np.ndarray":
+    small_primes = [p for p in WHEEL_PRIMES if p <= limit]
+    if limit < 7:
+        return np.array(small_primes, dtype=np.uint64)
+
+    rows = limit // WHEEL + 1
+    is_prime = np.ones((rows, len(WHEEL_RESIDUES)), dtype=bool)
+    is_prime[0, 0] = False
+
+    root = isqrt(limit)
+    for row in range(root // WHEEL + 1):
+        for column, residue in enumerate(WHEEL_RESIDUES):
+            p = WHEEL * row + residue
+            if p > root:
+                break
+            if not is_prime[row, column]:
+                continue
+            _cross_off(is_prime=is_prime, p=p)
+
+    candidates = np.flatnonzero(is_prime)
+    primes = (
+        candidates // len(WHEEL_RESIDUES) * WHEEL
+        + np.array(WHEEL_RESIDUES, dtype=np.int64)[candidates % len(WHEEL_RESIDUES)]
+    )
+    primes = primes[primes <= limit].astype(np.uint64)
+    return np.concatenate((np.array(small_primes, dtype=np.uint64), primes))
+
+
+def _cross_off(is_prime: "np.ndarray", p: int) -> None:
+    p_inverse = pow(p, -1, WHEEL)
+    for column, residue in enumerate(WHEEL_RESIDUES):
+        # Smallest multiplier q >= p with p * q in this residue class; the next
+        # multiple in the same class is p * (q + 30), exactly p rows further on.
+        q = p + (residue * p_inverse - p) % WHEEL
+        is_prime[p * q // WHEEL :: p, column] = False
+
+
+def numpy_first_n_primes(count: int) -> array:
+    limit = estimate_nth_prime_upper_bound(n=count)
+    typecode = prime_typecode(limit=limit)
+    primes = numpy_primes_up_to(limit=limit)[:count]
+
+    result = array(typecode)
+    result.frombytes(primes.astype(np.dtype(typecode)).tobytes())
+    return result
+
+
+def numpy_primes_in_range(
+    lo: int, hi: int, base_primes: Optional[Sequence[int]] = None
+) -> array:
+    typecode = prime_typecode(limit=hi)
+    result = array(typecode)
+    if hi <= max(lo, 2):
+        return result
+
+    if base_primes is None:
+        base_primes = sieve_of_eratosthenes(limit=isqrt(hi - 1))
+
+    first_odd = max(lo | 1, 3)
+    size = max((hi - first_odd + 1) // 2, 0)
+    is_prime = np.ones(size, dtype=bool)
+
+    for p in base_primes:
+        if p == 2:
+            continue
+        start = p * p
+        if start >= hi:
+            break
+        if start < first_odd:
+            start = -(-first_odd // p) * p
+            if start % 2 == 0:
+                start += p
+        is_prime[(start - first_odd) // 2 :: p] = False
+
+    primes = np.flatnonzero(is_prime).astype(np.uint64) * 2 + first_odd
+    if lo <= 2 < hi:
+        result.append(2)
+    result.frombytes(primes.astype(np.dtype(typecode)).tobytes())
+    return result
+
+
+def numpy_prime_count(x: int, base_primes: Optional[Sequence[int]] = None) -> int:
+    if x < 2:
+        return 0
+
+    root = isqrt(x)
+    if base_primes is None:
+        base_primes = sieve_of_eratosthenes(limit=root)
+
+    small = np.arange(-1, root, dtype=np.int64)
+    indices = np.arange(root + 1, dtype=np.int64)
+    large = np.zeros(root + 1, dtype=np.int64)
+    large[1:] = x // indices[1:] - 1
+    small_values = np.arange(root + 1, dtype=np.int64)
+
+    for primes_below_p, p in enumerate(base_primes):
+        square = p * p
+        if square > x:
+            break
+
+        last_large = min(root, x // square)
+        multiples = indices[1 : last_large + 1] * p
+        within_root = multiples <= root
+        counts = np.empty(last_large, dtype=np.int64)
+        counts[within_root] = large[multiples[within_root]]
+        counts[~within_root] = small[x // multiples[~within_root]]
+        large[1 : last_large + 1] -= counts - primes_below_p
+
+        small[square:] -= small[small_values[square:] // p] - primes_below_p
+
+    return int(large[1])
@@ -0,0 +1,67 @@
+from array import array
+from concurrent.futures import Future
+from multiprocessing import shared_memory
+from typing import Optional, Sequence
+
+SharedSegment = tuple[Optional[str], str, int]
+
+
+def split_range(lo: int, hi: int, parts: int) -> list[tuple[int, int]]:
+    step = max(-(-(hi - lo) // max(parts, 1)), 1)
+    return [(start, min(start + step, hi)) for start in range(lo, hi, step)]
+
+
+def write_shared_segment(primes: Sequence[int], typecode: str) -> SharedSegment:
+    """Copy ``primes`` into a new shared memory block and hand back its name.
+
+    The block outlives this process; whoever reads it must unlink it.
+    """
+    if not isinstance(primes, array) or primes.typecode != typecode:
+        primes = array(typecode, primes)
+    if not primes:
+        return None, typecode, 0
+
+    data = memoryview(primes).cast("B")
+    block = shared_memory.SharedMemory(create=True, size=len(data))
+    try:
+        block.buf[: len(data)] = data
+    finally:
+        block.close()
+    return block.name, typecode, len(primes)
+
+
+def read_shared_segments(segments: Sequence[SharedSegment], count: int) -> array:
+    primes = array(segments[0][1] if segments else "I")
+    for segment in segments:
+        name, _, length = segment
+        if name is None:
+            continue
+        if len(primes) >= count:
+            discard_shared_segment(segment=segment)
+            continue
+
+        block = shared_memory.SharedMemory(name=name)
+        try:
+            primes.frombytes(block.buf[: length * primes.itemsize])
+        finally:
+            block.close()
+            block.unlink()
+
+    del primes[count:]
+    return primes
+
+
+def discard_shared_segment(segment: SharedSegment) -> None:
+    name = segment[0]
+    if name is None:
+        return
+
+    block = shared_memory.SharedMemory(name=name)
+    block.close()
+    block.unlink()
+
+
+def discard_segment_future(future: Future) -> None:
+    if future.cancelled() or future.exception() is not None:
+        return
+    discard_shared_segment(segment=future.result())
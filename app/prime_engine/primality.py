@@ -0,0 +1,41 @@
+from app.prime_engine.sieve import sieve_of_eratosthenes
+
+SMALL_PRIMES = tuple(sieve_of_eratosthenes(limit=1000))
+SMALL_PRIMES_LIMIT = SMALL_PRIMES[-1] ** 2
+
+# Testing these bases is deterministic for every n < 3.18 * 10^23, so for all u64.
+MILLER_RABIN_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+
+
+def is_prime(n: int) -> bool:
+    if n < 2:
+        return False
+
+    for p in SMALL_PRIMES:
+        if n % p == 0:
+            return n == p
+    if n < SMALL_PRIMES_LIMIT:
+        return True
+
+    return _miller_rabin(n=n)
+
+
+def _miller_rabin(n: int) -> bool:
+    d = n - 1
+    s = 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+
+    for a in MILLER_RABIN_BASES:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+
+    return True
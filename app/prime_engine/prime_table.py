@@ -0,0 +1,186 @@
+import mmap
+import os
+import sys
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+from math import isqrt
+from typing import Optional, Sequence
+
+from app.interactos.prime_engine_interface import IPrimeEngine
+from app.prime_engine.sieve import estimate_nth_prime_upper_bound
+
+PRIME_TYPECODE = "I"
+PRIME_ITEM_SIZE = 4
+DEFAULT_INITIAL_COUNT = 1000
+
+
+class PrimeTable:
+    """In-memory prime cache that grows on demand up to ``capacity`` primes.
+
+    Growth at least doubles the cache and only sieves the missing tail, so
+    the cost of a hot working set is amortised to O(1) per request. Each
+    extension publishes a new array instead of resizing the old one, so
+    readers holding the previous array never see it change.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        sieve_engine: IPrimeEngine,
+        initial_count: int = DEFAULT_INITIAL_COUNT,
+    ):
+        self.capacity = capacity
+        self.sieve_engine = sieve_engine
+        self.initial_count = min(initial_count, capacity)
+        self._primes: Optional[array] = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._primes is not None
+
+    def cached_count(self) -> int:
+        primes = self._primes
+        return len(primes) if primes is not None else 0
+
+    def load(self) -> array:
+        if self._primes is not None:
+            return self._primes
+        return self.extend_to(count=self.initial_count)
+
+    def extend_to(self, count: int) -> array:
+        primes = self._primes
+        if primes is not None and len(primes) >= count:
+            return primes
+        if count > self.capacity:
+            raise ValueError(f"count {count} exceeds table capacity {self.capacity}")
+
+        with self._lock:
+            if not self._primes:
+                self._primes = self._build(count=max(count, self.initial_count))
+            elif len(self._primes) < count:
+                self._primes = self._extend(primes=self._primes, count=count)
+        return self._primes
+
+    def first(self, count: int) -> Sequence[int]:
+        return self.extend_to(count=count)[:count]
+
+    def page(self, offset: int, count: int) -> Sequence[int]:
+        return self.extend_to(count=offset + count)[offset : offset + count]
+
+    def primes_up_to(self, limit: int) -> Optional[Sequence[int]]:
+        return _prefix_up_to(primes=self.load(), limit=limit)
+
+    def covers(self, n: int) -> bool:
+        primes = self.load()
+        return len(primes) > 0 and n <= primes[-1]
+
+    def contains(self, n: int) -> bool:
+        return _contains(primes=self.load(), n=n)
+
+    def nth(self, n: int) -> int:
+        return self.extend_to(count=n)[n - 1]
+
+    def count_up_to(self, limit: int) -> int:
+        return bisect_right(self.load(), limit)
+
+    def _build(self, count: int) -> array:
+        primes = self.sieve_engine.first_n_primes(count=count)
+        if isinstance(primes, array):
+            return primes
+        return array(PRIME_TYPECODE, primes)
+
+    def _extend(self, primes: array, count: int) -> array:
+        target = min(max(count, 2 * len(primes)), self.capacity)
+        hi = estimate_nth_prime_upper_bound(n=target) + 1
+        tail = self.sieve_engine.primes_in_range(
+            lo=primes[-1] + 1,
+            hi=hi,
+            base_primes=_prefix_up_to(primes=primes, limit=isqrt(hi - 1)),
+        )
+
+        grown = array(PRIME_TYPECODE, primes)
+        grown.extend(tail[: target - len(primes)])
+        return grown
+
+
+class MappedPrimeTable:
+    def __init__(self, path: str):
+        self.path = path
+        self._mmap: Optional[mmap.mmap] = None
+        self._primes: Optional[Sequence[int]] = None
+        self._lock = threading.Lock()
+
+        file_size = os.path.getsize(path)
+        if file_size == 0 or file_size % PRIME_ITEM_SIZE != 0:
+            raise ValueError(f"{path} is not a packed uint32 prime table")
+        self.capacity = file_size // PRIME_ITEM_SIZE
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._primes is not None
+
+    def cached_count(self) -> int:
+        return self.capacity
+
+    def load(self) -> Sequence[int]:
+        if self._primes is not None:
+            return self._primes
+
+        with self._lock:
+            if self._primes is None:
+                with open(self.path, "rb") as table_file:
+                    self._mmap = mmap.mmap(
+                        table_file.fileno(), length=0, access=mmap.ACCESS_READ
+                    )
+                self._primes = self._view(buffer=self._mmap)
+        return self._primes
+
+    def first(self, count: int) -> Sequence[int]:
+        if count > self.capacity:
+            raise ValueError(f"count {count} exceeds table capacity {self.capacity}")
+        return self.load()[:count]
+
+    def page(self, offset: int, count: int) -> Sequence[int]:
+        if offset + count > self.capacity:
+            raise ValueError(
+                f"count {offset + count} exceeds table capacity {self.capacity}"
+            )
+        return self.load()[offset : offset + count]
+
+    def primes_up_to(self, limit: int) -> Optional[Sequence[int]]:
+        return _prefix_up_to(primes=self.load(), limit=limit)
+
+    def covers(self, n: int) -> bool:
+        primes = self.load()
+        return len(primes) > 0 and n <= primes[-1]
+
+    def contains(self, n: int) -> bool:
+        return _contains(primes=self.load(), n=n)
+
+    def nth(self, n: int) -> int:
+        return self.load()[n - 1]
+
+    def count_up_to(self, limit: int) -> int:
+        return bisect_right(self.load(), limit)
+
+    def _view(self, buffer: mmap.mmap) -> Sequence[int]:
+        if sys.byteorder == "little":
+            return memoryview(buffer).cast(PRIME_TYPECODE)
+
+        primes = array(PRIME_TYPECODE)
+        primes.frombytes(buffer[:])
+        primes.byteswap()
+        return primes
+
+
+def _prefix_up_to(primes: Sequence[int], limit: int) -> Optional[Sequence[int]]:
+    if not len(primes) or primes[-1] < limit:
+        return None
+    return primes[: bisect_right(primes, limit)]
+
+
+def _contains(primes: Sequence[int], n: int) -> bool:
+    index = bisect_left(primes, n)
+    return index < len(primes) and primes[index] == n
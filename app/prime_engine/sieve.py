@@ -0,0 +1,124 @@
+from array import array
+from itertools import compress
+from math import isqrt, log
+from typing import Iterator, Optional, Sequence
+
+# Dusart (2010): p_n < n(ln n + ln ln n - 1 + (ln ln n - 2) / ln n) for n >= 688383.
+DUSART_MIN_N = 688383
+SMALL_NTH_PRIME_BOUND = 13
+
+# Odd numbers per segment; one byte each, so a segment fits in a typical L2 cache.
+DEFAULT_SEGMENT_SIZE = 1 << 18
+UINT32_LIMIT = 1 << 32
+
+
+def estimate_nth_prime_upper_bound(n: int) -> int:
+    if n < 6:
+        return SMALL_NTH_PRIME_BOUND
+
+    ln_n = log(n)
+    ln_ln_n = log(ln_n)
+    if n >= DUSART_MIN_N:
+        bound = n * (ln_n + ln_ln_n - 1 + (ln_ln_n - 2) / ln_n)
+    else:
+        # Rosser (1941): p_n < n(ln n + ln ln n) for n >= 6.
+        bound = n * (ln_n + ln_ln_n)
+    return int(bound) + 1
+
+
+def prime_typecode(limit: int) -> str:
+    return "I" if limit < UINT32_LIMIT else "Q"
+
+
+def sieve_of_eratosthenes(limit: int) -> list[int]:
+    if limit < 2:
+        return []
+
+    is_prime = bytearray([1]) * (limit + 1)
+    is_prime[0] = is_prime[1] = 0
+
+    for p in range(2, isqrt(limit) + 1):
+        if is_prime[p]:
+            start = p * p
+            is_prime[start::p] = bytes(len(range(start, limit + 1, p)))
+
+    return list(compress(range(limit + 1), is_prime))
+
+
+def sieve_segment(low: int, high: int, base_primes: Sequence[int]) -> list[int]:
+    """Primes in [low, high); base_primes must cover every prime <= sqrt(high)."""
+    primes = [2] if low <= 2 < high else []
+
+    first_odd = max(low | 1, 3)
+    if first_odd >= high:
+        return primes
+
+    size = (high - first_odd + 1) // 2
+    is_prime = bytearray([1]) * size
+
+    for p in base_primes:
+        if p == 2:
+            continue
+        start = p * p
+        if start >= high:
+            break
+        if start < first_odd:
+            start = -(-first_odd // p) * p
+            if start % 2 == 0:
+                start += p
+        index = (start - first_odd) // 2
+        if index < size:
+            is_prime[index::p] = bytes((size - 1 - index) // p + 1)
+
+    primes.extend(compress(range(first_odd, high, 2), is_prime))
+    return primes
+
+
+def iter_prime_segments(
+    limit: int, segment_size: int = DEFAULT_SEGMENT_SIZE
+) -> Iterator[list[int]]:
+    """Yield the primes <= limit in ascending, segment-sized batches."""
+    if limit < 2:
+        return
+
+    base_primes = sieve_of_eratosthenes(limit=isqrt(limit))
+    low = 0
+    while low <= limit:
+        high = min(low + 2 * segment_size, limit + 1)
+        yield sieve_segment(low=low, high=high, base_primes=base_primes)
+        low = high
+
+
+def first_n_primes(count: int, segment_size: int = DEFAULT_SEGMENT_SIZE) -> array:
+    limit = estimate_nth_prime_upper_bound(n=count)
+    primes = array(prime_typecode(limit=limit))
+    if count <= 0:
+        return primes
+
+    for segment in iter_prime_segments(limit=limit, segment_size=segment_size):
+        primes.extend(segment[: count - len(primes)])
+        if len(primes) >= count:
+            break
+
+    return primes
+
+
+def primes_in_range(
+    lo: int,
+    hi: int,
+    base_primes: Optional[Sequence[int]] = None,
+    segment_size: int = DEFAULT_SEGMENT_SIZE,
+) -> array:
+    """Primes in [lo, hi), sieving only the window itself."""
+    primes = array(prime_typecode(limit=hi))
+    if hi <= max(lo, 2):
+        return primes
+
+    if base_primes is None:
+        base_primes = sieve_of_eratosthenes(limit=isqrt(hi - 1))
+
+    for low in range(lo, hi, 2 * segment_size):
+        high = min(low + 2 * segment_size, hi)
+        primes.extend(sieve_segment(low=low, high=high, base_primes=base_primes))
+
+    return primes
@@ -0,0 +1,38 @@
+import argparse
+import os
+import sys
+from array import array
+from typing import Optional
+
+from app.constants import MAX_PRIME_COUNT
+from app.prime_engine.factory import get_sieve_engine
+from app.prime_engine.prime_table import PRIME_TYPECODE
+
+
+def write_prime_table_file(path: str, count: int) -> int:
+    primes = array(PRIME_TYPECODE, get_sieve_engine().first_n_primes(count=count))
+    if sys.byteorder != "little":
+        primes.byteswap()
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as table_file:
+        primes.tofile(table_file)
+    os.replace(tmp_path, path)
+
+    return len(primes)
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Write the first N primes as packed little-endian uint32."
+    )
+    parser.add_argument("--count", type=int, default=MAX_PRIME_COUNT)
+    parser.add_argument("--output", required=True)
+    args = parser.parse_args(argv)
+
+    written = write_prime_table_file(path=args.output, count=args.count)
+    print(f"Wrote {written} primes to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,17 @@
-from typing import Annotated
+from typing import Annotated, Optional
 
 from fastapi import APIRouter, Depends, Request
 from pydantic import BaseModel
-from sqlmodel import Session
 
-from app.database import get_session
+from app.dependencies import (
+    LoginLogStorageDependency,
+    UserStorageDependency,
+    get_login_event_publisher,
+)
 from app.dtos import LoginRequestDTO
 from app.interactos.login_interactor import LoginInteractor
+from app.interactos.publisher_interface import ILoginEventPublisher
 from app.presenters.presenter_implementation import LoginPresenter
-from app.storages.storage_implementation import LoginLogStorage, UserStorage
 
 router = APIRouter(prefix="/api/v1/auth", tags=["authentication"])
 
@@ -22,16 +25,19 @@ class LoginRequest(BaseModel):
 async def login(
     request: Request,
     login_data: LoginRequest,
-    session: Annotated[Session, Depends(get_session)],
+    user_storage: UserStorageDependency,
+    login_log_storage: LoginLogStorageDependency,
+    login_event_publisher: Annotated[
+        Optional[ILoginEventPublisher], Depends(get_login_event_publisher)
+    ],
 ):
-    user_storage = UserStorage(session=session)
-    login_log_storage = LoginLogStorage(session=session)
     login_presenter = LoginPresenter()
 
     login_interactor = LoginInteractor(
         user_storage=user_storage,
         login_log_storage=login_log_storage,
         presenter=login_presenter,
+        login_event_publisher=login_event_publisher,
     )
 
     ip_address = request.client.host if request.client else None
@@ -44,4 +50,4 @@ async def login(
         user_agent=user_agent,
     )
 
-    return login_interactor.user_login_wrapper(request_dto=login_request_dto)
+    return await login_interactor.user_login_wrapper(request_dto=login_request_dto)
@@ -1,14 +1,32 @@
-from typing import Annotated
+from typing import Annotated, Optional
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Header, Path, Query
 from pydantic import BaseModel, Field
 
-from app.constants import MAX_PRIME_COUNT
-from app.dependencies import get_current_user
-from app.dtos import PrimeNumbersRequestDTO
+from app.constants import (
+    DEFAULT_PRIME_PAGE_SIZE,
+    MAX_NTH_PRIME_INDEX,
+    MAX_PRIMALITY_CHECK_BATCH,
+    MAX_PRIMALITY_CHECK_NUMBER,
+    MAX_PRIME_COUNT,
+    MAX_PRIME_COUNTING_BOUND,
+    MAX_PRIME_RANGE_BOUND,
+)
+from app.dependencies import CurrentUser
+from app.dtos import (
+    NthPrimeRequestDTO,
+    PrimalityCheckRequestDTO,
+    PrimeCountRequestDTO,
+    PrimeNumbersRequestDTO,
+    PrimePageRequestDTO,
+    PrimeRangeRequestDTO,
+)
 from app.interactos.primes_interactor import PrimeNumbersInteractor
-from app.models import User
+from app.presenters.compression import negotiate_content_encoding
 from app.presenters.presenter_implementation import PrimeNumbersPresenter
+from app.presenters.prime_formats import negotiate_prime_media_type
+from app.presenters.response_cache import get_response_cache
+from app.prime_engine import get_prime_engine
 
 router = APIRouter(prefix="/api/v1/primes", tags=["primes"])
 
@@ -17,16 +35,160 @@ class PrimeNumbersRequest(BaseModel):
     count: int = Field(..., gt=0, le=MAX_PRIME_COUNT)
 
 
+class PrimeRangeRequest(BaseModel):
+    lo: int = Field(..., ge=0, lt=MAX_PRIME_RANGE_BOUND)
+    hi: int = Field(..., gt=0, le=MAX_PRIME_RANGE_BOUND)
+
+
+class PrimalityCheckRequest(BaseModel):
+    numbers: list[Annotated[int, Field(ge=0, lt=MAX_PRIMALITY_CHECK_NUMBER)]] = Field(
+        ..., min_length=1, max_length=MAX_PRIMALITY_CHECK_BATCH
+    )
+
+
 @router.post("/generate")
 async def generate_primes(
     request_data: PrimeNumbersRequest,
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: CurrentUser,
+    stream: Annotated[bool, Query()] = False,
+    accept: Annotated[Optional[str], Header()] = None,
+    accept_encoding: Annotated[Optional[str], Header()] = None,
+    if_none_match: Annotated[Optional[str], Header()] = None,
 ):
-    presenter = PrimeNumbersPresenter()
-    interactor = PrimeNumbersInteractor(presenter=presenter)
+    presenter = PrimeNumbersPresenter(
+        media_type=negotiate_prime_media_type(accept=accept),
+        stream=stream,
+        if_none_match=if_none_match,
+        response_cache=get_response_cache(),
+        content_encoding=negotiate_content_encoding(accept_encoding=accept_encoding),
+    )
+    interactor = PrimeNumbersInteractor(
+        presenter=presenter, prime_engine=get_prime_engine()
+    )
 
     request_dto = PrimeNumbersRequestDTO(
         count=request_data.count, user_id=current_user.id
     )
 
-    return interactor.generate_primes_wrapper(request_dto=request_dto)
+    return await interactor.generate_primes_wrapper(request_dto=request_dto)
+
+
+@router.get("/generate")
+async def get_primes(
+    count: Annotated[int, Query(gt=0, le=MAX_PRIME_COUNT)],
+    current_user: CurrentUser,
+    stream: Annotated[bool, Query()] = False,
+    accept: Annotated[Optional[str], Header()] = None,
+    accept_encoding: Annotated[Optional[str], Header()] = None,
+    if_none_match: Annotated[Optional[str], Header()] = None,
+):
+    presenter = PrimeNumbersPresenter(
+        media_type=negotiate_prime_media_type(accept=accept),
+        stream=stream,
+        if_none_match=if_none_match,
+        response_cache=get_response_cache(),
+        content_encoding=negotiate_content_encoding(accept_encoding=accept_encoding),
+    )
+    interactor = PrimeNumbersInteractor(
+        presenter=presenter, prime_engine=get_prime_engine()
+    )
+
+    request_dto = PrimeNumbersRequestDTO(count=count, user_id=current_user.id)
+
+    return await interactor.generate_primes_wrapper(request_dto=request_dto)
+
+
+@router.get("/page")
+async def get_prime_page(
+    current_user: CurrentUser,
+    offset: Annotated[int, Query(ge=0, lt=MAX_NTH_PRIME_INDEX)] = 0,
+    limit: Annotated[int, Query(gt=0, le=MAX_PRIME_COUNT)] = DEFAULT_PRIME_PAGE_SIZE,
+    cursor: Annotated[Optional[str], Query()] = None,
+    accept_encoding: Annotated[Optional[str], Header()] = None,
+):
+    presenter = PrimeNumbersPresenter(
+        content_encoding=negotiate_content_encoding(accept_encoding=accept_encoding)
+    )
+    interactor = PrimeNumbersInteractor(
+        presenter=presenter, prime_engine=get_prime_engine()
+    )
+
+    request_dto = PrimePageRequestDTO(
+        offset=offset, limit=limit, user_id=current_user.id, cursor=cursor
+    )
+
+    return await interactor.get_prime_page_wrapper(request_dto=request_dto)
+
+
+@router.post("/range")
+async def generate_primes_in_range(
+    request_data: PrimeRangeRequest,
+    current_user: CurrentUser,
+    stream: Annotated[bool, Query()] = False,
+    accept: Annotated[Optional[str], Header()] = None,
+    accept_encoding: Annotated[Optional[str], Header()] = None,
+):
+    presenter = PrimeNumbersPresenter(
+        media_type=negotiate_prime_media_type(accept=accept),
+        stream=stream,
+        content_encoding=negotiate_content_encoding(accept_encoding=accept_encoding),
+    )
+    interactor = PrimeNumbersInteractor(
+        presenter=presenter, prime_engine=get_prime_engine()
+    )
+
+    request_dto = PrimeRangeRequestDTO(
+        lo=request_data.lo, hi=request_data.hi, user_id=current_user.id
+    )
+
+    return await interactor.generate_primes_in_range_wrapper(request_dto=request_dto)
+
+
+@router.post("/check")
+async def check_primality(
+    request_data: PrimalityCheckRequest,
+    current_user: CurrentUser,
+    accept_encoding: Annotated[Optional[str], Header()] = None,
+):
+    presenter = PrimeNumbersPresenter(
+        content_encoding=negotiate_content_encoding(accept_encoding=accept_encoding)
+    )
+    interactor = PrimeNumbersInteractor(
+        presenter=presenter, prime_engine=get_prime_engine()
+    )
+
+    request_dto = PrimalityCheckRequestDTO(
+        numbers=request_data.numbers, user_id=current_user.id
+    )
+
+    return await interactor.check_primality_wrapper(request_dto=request_dto)
+
+
+@router.get("/nth/{n}")
+async def get_nth_prime(
+    n: Annotated[int, Path(gt=0, le=MAX_NTH_PRIME_INDEX)],
+    current_user: CurrentUser,
+):
+    presenter = PrimeNumbersPresenter()
+    interactor = PrimeNumbersInteractor(
+        presenter=presenter, prime_engine=get_prime_engine()
+    )
+
+    request_dto = NthPrimeRequestDTO(n=n, user_id=current_user.id)
+
+    return await interactor.get_nth_prime_wrapper(request_dto=request_dto)
+
+
+@router.get("/count")
+async def count_primes(
+    x: Annotated[int, Query(ge=0, le=MAX_PRIME_COUNTING_BOUND)],
+    current_user: CurrentUser,
+):
+    presenter = PrimeNumbersPresenter()
+    interactor = PrimeNumbersInteractor(
+        presenter=presenter, prime_engine=get_prime_engine()
+    )
+
+    request_dto = PrimeCountRequestDTO(x=x, user_id=current_user.id)
+
+    return await interactor.count_primes_wrapper(request_dto=request_dto)
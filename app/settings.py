@@ -10,14 +10,65 @@ DEBUG = os.getenv("DEBUG", "False").lower() == "true"
 
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./primes.db")
 DB_ECHO = os.getenv("DB_ECHO", "False").lower() == "true"
+DB_ASYNC = os.getenv("DB_ASYNC", "False").lower() == "true"
 
 JWT_SECRET_KEY = os.getenv("JWT_SECRET_KEY", "AHFKADUSHFAKSHDFASIUOHFASDFAKJHASDFU")
 JWT_ALGORITHM = os.getenv("JWT_ALGORITHM", "HS256")
 JWT_EXPIRATION_MINUTES = int(os.getenv("JWT_EXPIRATION_MINUTES", "60"))
 
 PASSWORD_MIN_LENGTH = int(os.getenv("PASSWORD_MIN_LENGTH", "8"))
+PASSWORD_HASH_WORKER_COUNT = int(os.getenv("PASSWORD_HASH_WORKER_COUNT", "4"))
+PASSWORD_HASH_MAX_CONCURRENCY = int(os.getenv("PASSWORD_HASH_MAX_CONCURRENCY", "4"))
 
 # Redis Configuration
 REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379")
 LOGIN_RATE_LIMIT_REQUESTS = int(os.getenv("LOGIN_RATE_LIMIT_REQUESTS", "5"))
 LOGIN_RATE_LIMIT_WINDOW = int(os.getenv("LOGIN_RATE_LIMIT_WINDOW", "60"))  # 15 minutes
+
+# Authenticated User Cache
+USER_CACHE_MAX_SIZE = int(os.getenv("USER_CACHE_MAX_SIZE", "10000"))
+USER_CACHE_TTL_SECONDS = float(os.getenv("USER_CACHE_TTL_SECONDS", "30"))
+USER_CACHE_REDIS_ENABLED = (
+    os.getenv("USER_CACHE_REDIS_ENABLED", "False").lower() == "true"
+)
+USER_CACHE_INVALIDATION_CHANNEL = os.getenv(
+    "USER_CACHE_INVALIDATION_CHANNEL", "user-cache-invalidations"
+)
+
+# Login Log Write-Behind Buffer
+LOGIN_LOG_BUFFER_ENABLED = (
+    os.getenv("LOGIN_LOG_BUFFER_ENABLED", "False").lower() == "true"
+)
+LOGIN_LOG_BUFFER_FLUSH_SIZE = int(os.getenv("LOGIN_LOG_BUFFER_FLUSH_SIZE", "500"))
+LOGIN_LOG_BUFFER_FLUSH_INTERVAL_MS = int(
+    os.getenv("LOGIN_LOG_BUFFER_FLUSH_INTERVAL_MS", "200")
+)
+LOGIN_LOG_BUFFER_MAX_ROWS = int(os.getenv("LOGIN_LOG_BUFFER_MAX_ROWS", "100000"))
+LOGIN_LOG_BUFFER_SPOOL_PATH = os.getenv("LOGIN_LOG_BUFFER_SPOOL_PATH", "")
+LOGIN_EVENTS_VIA_CELERY = (
+    os.getenv("LOGIN_EVENTS_VIA_CELERY", "False").lower() == "true"
+)
+
+# Prime Engine Configuration
+MAX_PRIME_COUNT = int(os.getenv("MAX_PRIME_COUNT", "10000"))
+MAX_PRIME_RANGE_SIZE = int(os.getenv("MAX_PRIME_RANGE_SIZE", "1000000"))
+# Measured at these caps, the pure-Python engine answers a range window,
+# nth prime or prime count in under a second; raise them with NumPy.
+MAX_PRIME_RANGE_BOUND = int(os.getenv("MAX_PRIME_RANGE_BOUND", "10000000000000"))
+MAX_PRIMALITY_CHECK_BATCH = int(os.getenv("MAX_PRIMALITY_CHECK_BATCH", "10000"))
+MAX_NTH_PRIME_INDEX = int(os.getenv("MAX_NTH_PRIME_INDEX", "50000000"))
+MAX_PRIME_COUNTING_BOUND = int(os.getenv("MAX_PRIME_COUNTING_BOUND", "1000000000"))
+PRIME_SIEVE_BACKEND = os.getenv("PRIME_SIEVE_BACKEND", "python")
+PRIME_TABLE_PATH = os.getenv("PRIME_TABLE_PATH", "./primes.bin")
+PRIME_TABLE_STORAGE = os.getenv("PRIME_TABLE_STORAGE", "array")
+PRIME_TABLE_INITIAL_COUNT = int(os.getenv("PRIME_TABLE_INITIAL_COUNT", "1000"))
+PRIME_TABLE_PRELOAD = os.getenv("PRIME_TABLE_PRELOAD", "True").lower() == "true"
+PRIME_COMPRESSION_MIN_BYTES = int(os.getenv("PRIME_COMPRESSION_MIN_BYTES", "1024"))
+PRIME_RESPONSE_CACHE_MAX_BYTES = int(
+    os.getenv("PRIME_RESPONSE_CACHE_MAX_BYTES", "16777216")
+)
+PRIME_WORKER_COUNT = int(os.getenv("PRIME_WORKER_COUNT", "2"))
+PRIME_PARALLEL_SIEVE_THRESHOLD = int(
+    os.getenv("PRIME_PARALLEL_SIEVE_THRESHOLD", "2000000")
+)
+PRIME_REQUEST_TIMEOUT_SECONDS = float(os.getenv("PRIME_REQUEST_TIMEOUT_SECONDS", "30"))
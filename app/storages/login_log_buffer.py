@@ -0,0 +1,338 @@
+import fcntl
+import glob
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Any, Optional, TextIO
+from uuid import uuid4
+
+from sqlalchemy import insert, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import IntegrityError
+
+from app import settings
+from app.models import LoginLog
+from app.observability.custom_metrics import (
+    record_login_log_dropped,
+    record_login_log_flush,
+)
+
+logger = logging.getLogger(__name__)
+
+_INFLIGHT_SUFFIX = ".inflight"
+_LOCK_SUFFIX = ".lock"
+
+
+class LoginLogBuffer:
+    """Write-behind buffer that batches login logs into multi-row INSERTs.
+
+    A background thread flushes every ``flush_size`` rows or every
+    ``flush_interval_ms``, whichever comes first. A batch the database
+    rejects is retried row by row and the offending rows are dropped;
+    after any other error the batch is put back and retried on the next
+    flush. At most ``max_rows`` rows are held, and rows past that are
+    dropped and counted in ``auth.login_log.dropped``.
+
+    Without a spool, rows still buffered when the process dies are lost.
+    With ``spool_path`` every row is appended to a JSON-lines file before
+    ``add`` returns. Each process spools to its own ``<spool_path>.<tag>``
+    file and holds a lock on ``<spool_path>.<tag>.lock`` while running, so
+    workers sharing a ``spool_path`` never touch each other's rows. On
+    start, spools whose lock is free were left by a dead process and are
+    replayed. The spool survives a process crash, not a host crash, since
+    it is never fsynced.
+    """
+
+    def __init__(
+        self,
+        engine: Engine,
+        flush_size: int,
+        flush_interval_ms: float,
+        max_rows: int,
+        spool_path: Optional[str] = None,
+    ):
+        self.engine = engine
+        self.flush_size = max(flush_size, 1)
+        self.flush_interval_ms = flush_interval_ms
+        self.max_rows = max(max_rows, self.flush_size)
+        self.spool_path = spool_path or None
+        self._rows: list[dict[str, Any]] = []
+        self._condition = threading.Condition()
+        self._flush_lock = threading.Lock()
+        self._spool = None
+        self._spool_file_path: Optional[str] = None
+        self._spool_lock = None
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = False
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+
+        if self.spool_path is not None:
+            self._open_spool()
+            self._replay_spools()
+
+        self._stopping = False
+        self._thread = threading.Thread(
+            target=self._run, name="login-log-flusher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the flusher once everything buffered has been written."""
+        if self._thread is None:
+            return
+
+        with self._condition:
+            self._stopping = True
+            self._condition.notify()
+        self._thread.join()
+        self._thread = None
+
+        if self._spool is not None:
+            self._close_spool()
+
+    def add(self, login_log: LoginLog) -> None:
+        row = {
+            "id": login_log.id,
+            "user_id": login_log.user_id,
+            "ip_address": login_log.ip_address,
+            "user_agent": login_log.user_agent,
+            "login_timestamp": login_log.login_timestamp,
+        }
+        with self._condition:
+            if len(self._rows) >= self.max_rows:
+                logger.warning("Login log buffer is full; dropping login %s", row["id"])
+                record_login_log_dropped(rows=1, reason="overflow")
+                return
+            self._rows.append(row)
+            self._write_spool(rows=[row])
+            if len(self._rows) >= self.flush_size:
+                self._condition.notify()
+
+    def flush(self) -> int:
+        """Write everything buffered so far and return the number of rows written."""
+        with self._flush_lock:
+            with self._condition:
+                rows, self._rows = self._rows, []
+                inflight_path = self._rotate_spool() if rows else None
+
+            if not rows:
+                return 0
+
+            started_at = time.perf_counter()
+            try:
+                written, unwritten = self._write(rows=rows)
+                if unwritten:
+                    self._requeue(rows=unwritten)
+            finally:
+                if inflight_path is not None:
+                    os.remove(inflight_path)
+
+            record_login_log_flush(
+                rows=len(rows),
+                duration_ms=(time.perf_counter() - started_at) * 1000,
+                success=not unwritten,
+            )
+            return written
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                if not self._stopping and len(self._rows) < self.flush_size:
+                    self._condition.wait(timeout=self.flush_interval_ms / 1000)
+                stopping = self._stopping
+
+            self.flush()
+            if stopping:
+                return
+
+    def _write(self, rows: list[dict[str, Any]]) -> tuple[int, list[dict[str, Any]]]:
+        """Insert ``rows`` and return how many were written and which to retry."""
+        try:
+            self._insert(rows=rows)
+            return len(rows), []
+        except IntegrityError:
+            logger.warning(
+                "Database rejected %d login logs; retrying one by one", len(rows)
+            )
+        except Exception:
+            logger.exception("Failed to write %d buffered login logs", len(rows))
+            return 0, rows
+
+        written = 0
+        for index, row in enumerate(rows):
+            try:
+                self._insert(rows=[row])
+                written += 1
+            except IntegrityError as e:
+                logger.error("Dropping login log %s: %s", row["id"], e.orig)
+                record_login_log_dropped(rows=1, reason="rejected")
+            except Exception:
+                logger.exception("Failed to write %d buffered login logs", len(rows))
+                return written, rows[index:]
+        return written, []
+
+    def _requeue(self, rows: list[dict[str, Any]]) -> None:
+        with self._condition:
+            kept = rows[: max(self.max_rows - len(self._rows), 0)]
+            if len(kept) < len(rows):
+                logger.warning(
+                    "Login log buffer is full; dropping %d logins",
+                    len(rows) - len(kept),
+                )
+                record_login_log_dropped(rows=len(rows) - len(kept), reason="overflow")
+            self._rows[:0] = kept
+            self._write_spool(rows=kept)
+
+    def _insert(self, rows: list[dict[str, Any]]) -> None:
+        with self.engine.begin() as connection:
+            connection.execute(insert(LoginLog).values(rows))
+
+    def _write_spool(self, rows: list[dict[str, Any]]) -> None:
+        if self._spool is None:
+            return
+        for row in rows:
+            self._spool.write(_dump_row(row=row) + "\n")
+        self._spool.flush()
+
+    def _rotate_spool(self) -> Optional[str]:
+        # The rows being flushed move to their own file, so rows added
+        # meanwhile land in a fresh spool and the old one can be dropped
+        # as soon as the INSERT commits.
+        if self._spool is None:
+            return None
+
+        self._spool.close()
+        inflight_path = self._spool_file_path + _INFLIGHT_SUFFIX
+        os.replace(self._spool_file_path, inflight_path)
+        self._spool = open(self._spool_file_path, "a", encoding="utf-8")
+        return inflight_path
+
+    def _open_spool(self) -> None:
+        spool_file_path = f"{self.spool_path}.{os.getpid()}-{uuid4().hex[:8]}"
+        self._spool_lock = _try_lock(path=spool_file_path + _LOCK_SUFFIX)
+        self._spool_file_path = spool_file_path
+        self._spool = open(spool_file_path, "a", encoding="utf-8")
+
+    def _close_spool(self) -> None:
+        # A failed final flush leaves its rows in the spool for the next start.
+        self._spool.close()
+        self._spool = None
+        if os.path.getsize(self._spool_file_path) == 0:
+            os.remove(self._spool_file_path)
+        os.remove(self._spool_file_path + _LOCK_SUFFIX)
+        self._spool_lock.close()
+        self._spool_lock = None
+
+    def _replay_spools(self) -> None:
+        for spool_file_path in _find_spool_files(spool_path=self.spool_path):
+            if spool_file_path == self._spool_file_path:
+                continue
+
+            lock_path = spool_file_path + _LOCK_SUFFIX
+            lock = _try_lock(path=lock_path)
+            if lock is None:
+                continue  # Still owned by a running worker.
+
+            try:
+                for path in (spool_file_path + _INFLIGHT_SUFFIX, spool_file_path):
+                    if os.path.exists(path):
+                        self._replay_file(path=path)
+                        os.remove(path)
+                os.remove(lock_path)
+            finally:
+                lock.close()
+
+    def _replay_file(self, path: str) -> None:
+        with open(path, encoding="utf-8") as spool:
+            rows = [_load_row(data=line) for line in spool if line.strip()]
+
+        for start in range(0, len(rows), self.flush_size):
+            batch = self._skip_committed(rows=rows[start : start + self.flush_size])
+            if batch:
+                _, unwritten = self._write(rows=batch)
+                if unwritten:
+                    self._requeue(rows=unwritten)
+        logger.info("Replayed %d spooled login logs from %s", len(rows), path)
+
+    def _skip_committed(self, rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        # A crash mid-flush can leave spooled rows that were already committed.
+        with self.engine.connect() as connection:
+            existing = set(
+                connection.scalars(
+                    select(LoginLog.id).where(
+                        LoginLog.id.in_([row["id"] for row in rows])
+                    )
+                )
+            )
+        return [row for row in rows if row["id"] not in existing]
+
+
+_login_log_buffer: Optional[LoginLogBuffer] = None
+
+
+def get_login_log_buffer() -> Optional[LoginLogBuffer]:
+    return _login_log_buffer
+
+
+def start_login_log_buffer(engine: Engine) -> Optional[LoginLogBuffer]:
+    global _login_log_buffer
+
+    if _login_log_buffer is None and settings.LOGIN_LOG_BUFFER_ENABLED:
+        login_log_buffer = LoginLogBuffer(
+            engine=engine,
+            flush_size=settings.LOGIN_LOG_BUFFER_FLUSH_SIZE,
+            flush_interval_ms=settings.LOGIN_LOG_BUFFER_FLUSH_INTERVAL_MS,
+            max_rows=settings.LOGIN_LOG_BUFFER_MAX_ROWS,
+            spool_path=settings.LOGIN_LOG_BUFFER_SPOOL_PATH,
+        )
+        login_log_buffer.start()
+        _login_log_buffer = login_log_buffer
+    return _login_log_buffer
+
+
+def stop_login_log_buffer() -> None:
+    global _login_log_buffer
+
+    if _login_log_buffer is not None:
+        _login_log_buffer.stop()
+        _login_log_buffer = None
+
+
+def _find_spool_files(spool_path: str) -> set[str]:
+    prefix = glob.escape(spool_path) + "."
+    spool_file_paths = set()
+    for path in glob.glob(prefix + "*"):
+        for suffix in (_INFLIGHT_SUFFIX, _LOCK_SUFFIX):
+            if path.endswith(suffix):
+                path = path[: -len(suffix)]
+        spool_file_paths.add(path)
+    return spool_file_paths
+
+
+def _try_lock(path: str) -> Optional[TextIO]:
+    lock = open(path, "a")
+    try:
+        fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        lock.close()
+        return None
+    return lock
+
+
+def _dump_row(row: dict[str, Any]) -> str:
+    return json.dumps({**row, "login_timestamp": row["login_timestamp"].isoformat()})
+
+
+def _load_row(data: str) -> dict[str, Any]:
+    row = json.loads(data)
+    row["login_timestamp"] = datetime.fromisoformat(row["login_timestamp"])
+    return row
@@ -1,12 +1,21 @@
 from datetime import datetime
 from typing import Optional
 
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import insert
 from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.dtos import LoginLogDTO, UserDTO
-from app.interactos.storage_interface import ILoginLogStorage, IUserStorage
+from app.interactos.storage_interface import (
+    IAsyncLoginLogStorage,
+    IAsyncUserStorage,
+    ILoginLogStorage,
+    IUserStorage,
+)
 from app.models import LoginLog, User
 from app.observability.metric_decorators import track_db_query
+from app.storages.login_log_buffer import LoginLogBuffer
 
 
 class UserStorage(IUserStorage):
@@ -17,20 +26,12 @@ class UserStorage(IUserStorage):
     def get_by_username(self, username: str) -> Optional[UserDTO]:
         statement = select(User).where(User.username == username)
         user = self.session.exec(statement=statement).first()
-        return self._map_to_dto(user=user) if user else None
-
-    def _map_to_dto(self, user: User) -> UserDTO:
-        return UserDTO(
-            id=user.id,
-            username=user.username,
-            email=user.email,
-            name=user.name,
-            profile_pic_url=user.profile_pic_url,
-            password_hash=user.password_hash,
-            is_active=user.is_active,
-            created_at=user.created_at,
-            updated_at=user.updated_at,
-        )
+        return _map_user_to_dto(user=user) if user else None
+
+    @track_db_query(operation="select")
+    def get_by_id(self, user_id: str) -> Optional[UserDTO]:
+        user = self.session.get(User, user_id)
+        return _map_user_to_dto(user=user) if user else None
 
 
 class LoginLogStorage(ILoginLogStorage):
@@ -39,22 +40,141 @@ class LoginLogStorage(ILoginLogStorage):
 
     @track_db_query(operation="insert")
     def create(self, login_log_dto: LoginLogDTO) -> LoginLogDTO:
-        login_log = LoginLog(
-            user_id=login_log_dto.user_id,
-            ip_address=login_log_dto.ip_address,
-            user_agent=login_log_dto.user_agent,
-            login_timestamp=datetime.utcnow(),
-        )
+        login_log = _build_login_log(login_log_dto=login_log_dto)
+        # Every column is generated client-side, so the DTO is mapped before
+        # the commit expires the instance and no refresh SELECT is needed.
+        result = _map_login_log_to_dto(login_log=login_log)
         self.session.add(instance=login_log)
         self.session.commit()
-        self.session.refresh(instance=login_log)
-        return self._map_to_dto(login_log=login_log)
-
-    def _map_to_dto(self, login_log: LoginLog) -> LoginLogDTO:
-        return LoginLogDTO(
-            id=login_log.id,
-            user_id=login_log.user_id,
-            ip_address=login_log.ip_address,
-            user_agent=login_log.user_agent,
-            login_timestamp=login_log.login_timestamp,
+        return result
+
+    @track_db_query(operation="insert")
+    def create_many(self, login_log_dtos: list[LoginLogDTO]) -> None:
+        if not login_log_dtos:
+            return
+        self.session.exec(
+            insert(LoginLog),
+            params=_build_login_log_rows(login_log_dtos=login_log_dtos),
+        )
+        self.session.commit()
+
+
+class AsyncUserStorage(IAsyncUserStorage):
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    @track_db_query(operation="select")
+    async def get_by_username(self, username: str) -> Optional[UserDTO]:
+        statement = select(User).where(User.username == username)
+        user = (await self.session.exec(statement=statement)).first()
+        return _map_user_to_dto(user=user) if user else None
+
+    @track_db_query(operation="select")
+    async def get_by_id(self, user_id: str) -> Optional[UserDTO]:
+        user = await self.session.get(User, user_id)
+        return _map_user_to_dto(user=user) if user else None
+
+
+class AsyncLoginLogStorage(IAsyncLoginLogStorage):
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    @track_db_query(operation="insert")
+    async def create(self, login_log_dto: LoginLogDTO) -> LoginLogDTO:
+        login_log = _build_login_log(login_log_dto=login_log_dto)
+        result = _map_login_log_to_dto(login_log=login_log)
+        self.session.add(instance=login_log)
+        await self.session.commit()
+        return result
+
+    @track_db_query(operation="insert")
+    async def create_many(self, login_log_dtos: list[LoginLogDTO]) -> None:
+        if not login_log_dtos:
+            return
+        await self.session.exec(
+            insert(LoginLog),
+            params=_build_login_log_rows(login_log_dtos=login_log_dtos),
         )
+        await self.session.commit()
+
+
+class ThreadedUserStorage(IAsyncUserStorage):
+    """Serves a sync user storage to async callers from the threadpool."""
+
+    def __init__(self, storage: IUserStorage):
+        self.storage = storage
+
+    async def get_by_username(self, username: str) -> Optional[UserDTO]:
+        return await run_in_threadpool(self.storage.get_by_username, username=username)
+
+    async def get_by_id(self, user_id: str) -> Optional[UserDTO]:
+        return await run_in_threadpool(self.storage.get_by_id, user_id=user_id)
+
+
+class ThreadedLoginLogStorage(IAsyncLoginLogStorage):
+    """Serves a sync login-log storage to async callers from the threadpool."""
+
+    def __init__(self, storage: ILoginLogStorage):
+        self.storage = storage
+
+    async def create(self, login_log_dto: LoginLogDTO) -> LoginLogDTO:
+        return await run_in_threadpool(self.storage.create, login_log_dto=login_log_dto)
+
+    async def create_many(self, login_log_dtos: list[LoginLogDTO]) -> None:
+        await run_in_threadpool(self.storage.create_many, login_log_dtos=login_log_dtos)
+
+
+class BufferedLoginLogStorage(IAsyncLoginLogStorage):
+    def __init__(self, buffer: LoginLogBuffer):
+        self.buffer = buffer
+
+    async def create(self, login_log_dto: LoginLogDTO) -> LoginLogDTO:
+        # Id and timestamp are generated client-side, so the returned DTO
+        # is complete before the row is written.
+        login_log = _build_login_log(login_log_dto=login_log_dto)
+        self.buffer.add(login_log=login_log)
+        return _map_login_log_to_dto(login_log=login_log)
+
+    async def create_many(self, login_log_dtos: list[LoginLogDTO]) -> None:
+        for login_log_dto in login_log_dtos:
+            self.buffer.add(login_log=_build_login_log(login_log_dto=login_log_dto))
+
+
+def _build_login_log(login_log_dto: LoginLogDTO) -> LoginLog:
+    return LoginLog(
+        user_id=login_log_dto.user_id,
+        ip_address=login_log_dto.ip_address,
+        user_agent=login_log_dto.user_agent,
+        login_timestamp=datetime.utcnow(),
+    )
+
+
+def _build_login_log_rows(login_log_dtos: list[LoginLogDTO]) -> list[dict]:
+    return [
+        _build_login_log(login_log_dto=login_log_dto).model_dump()
+        for login_log_dto in login_log_dtos
+    ]
+
+
+def _map_user_to_dto(user: User) -> UserDTO:
+    return UserDTO(
+        id=user.id,
+        username=user.username,
+        email=user.email,
+        name=user.name,
+        profile_pic_url=user.profile_pic_url,
+        password_hash=user.password_hash,
+        is_active=user.is_active,
+        created_at=user.created_at,
+        updated_at=user.updated_at,
+    )
+
+
+def _map_login_log_to_dto(login_log: LoginLog) -> LoginLogDTO:
+    return LoginLogDTO(
+        id=login_log.id,
+        user_id=login_log.user_id,
+        ip_address=login_log.ip_address,
+        user_agent=login_log.user_agent,
+        login_timestamp=login_log.login_timestamp,
+    )
@@ -0,0 +1,261 @@
+import asyncio
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict
+from datetime import datetime
+from typing import Callable, Optional
+
+import redis
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app import settings
+from app.dtos import UserDTO
+from app.models import User
+from app.observability.custom_metrics import record_user_cache_lookup
+
+logger = logging.getLogger(__name__)
+
+REDIS_KEY_PREFIX = "user-cache:"
+_PENDING_INVALIDATIONS_KEY = "user_cache_invalidations"
+_DATETIME_FIELDS = ("created_at", "updated_at")
+
+
+class RedisUserCacheTier:
+    """Shared second tier: snapshots in Redis, invalidations over pub/sub.
+
+    Redis errors are logged and treated as misses; the local TTL still
+    bounds how long a missed invalidation can go unnoticed.
+    """
+
+    def __init__(self, client: redis.Redis, ttl_seconds: float, channel: str):
+        self.client = client
+        self.ttl_seconds = ttl_seconds
+        self.channel = channel
+
+    def get(self, user_id: str) -> Optional[UserDTO]:
+        try:
+            data = self.client.get(REDIS_KEY_PREFIX + user_id)
+        except redis.RedisError as e:
+            logger.warning("User cache read failed: %s", e)
+            return None
+        return _load_snapshot(data=data) if data else None
+
+    def put(self, user: UserDTO) -> None:
+        try:
+            self.client.set(
+                REDIS_KEY_PREFIX + user.id,
+                _dump_snapshot(user=user),
+                ex=max(int(self.ttl_seconds), 1),
+            )
+        except redis.RedisError as e:
+            logger.warning("User cache write failed: %s", e)
+
+    def invalidate(self, user_id: str) -> None:
+        try:
+            self.client.delete(REDIS_KEY_PREFIX + user_id)
+            self.client.publish(self.channel, user_id)
+        except redis.RedisError as e:
+            logger.warning("User cache invalidation failed: %s", e)
+
+    def subscribe(self, on_invalidate: Callable[[str], None]):
+        pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(
+            **{self.channel: lambda message: on_invalidate(message["data"])}
+        )
+        return pubsub.run_in_thread(sleep_time=1.0, daemon=True)
+
+
+class UserCache:
+    """TTL-bounded LRU of active-user snapshots keyed by user id.
+
+    Snapshots never carry the password hash, and inactive users are never
+    cached, so a deactivation only has to evict the user to take effect.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl_seconds: float,
+        redis_tier: Optional[RedisUserCacheTier] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.redis_tier = redis_tier
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[float, UserDTO]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, user_id: str) -> Optional[UserDTO]:
+        user = self._get_local(user_id=user_id)
+        if user is None and self.redis_tier is not None:
+            user = self.redis_tier.get(user_id=user_id)
+            if user is not None:
+                self._put_local(user=user)
+
+        record_user_cache_lookup(hit=user is not None)
+        return user
+
+    def put(self, user: UserDTO) -> None:
+        if not user.is_active:
+            return
+
+        self._put_local(user=user)
+        if self.redis_tier is not None:
+            self.redis_tier.put(user=user)
+
+    async def get_async(self, user_id: str) -> Optional[UserDTO]:
+        """Like ``get``, but reads the Redis tier off the event loop."""
+        user = self._get_local(user_id=user_id)
+        if user is None and self.redis_tier is not None:
+            user = await asyncio.to_thread(self.redis_tier.get, user_id=user_id)
+            if user is not None:
+                self._put_local(user=user)
+
+        record_user_cache_lookup(hit=user is not None)
+        return user
+
+    async def put_async(self, user: UserDTO) -> None:
+        """Like ``put``, but writes the Redis tier off the event loop."""
+        if not user.is_active:
+            return
+
+        self._put_local(user=user)
+        if self.redis_tier is not None:
+            await asyncio.to_thread(self.redis_tier.put, user=user)
+
+    def invalidate(self, user_id: str) -> None:
+        self.evict(user_id=user_id)
+        if self.redis_tier is not None:
+            self.redis_tier.invalidate(user_id=user_id)
+
+    def evict(self, user_id: str) -> None:
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+    def _get_local(self, user_id: str) -> Optional[UserDTO]:
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                return None
+            expires_at, user = entry
+            if expires_at <= self._clock():
+                del self._entries[user_id]
+                return None
+            self._entries.move_to_end(user_id)
+            return user
+
+    def _put_local(self, user: UserDTO) -> None:
+        with self._lock:
+            self._entries.pop(user.id, None)
+            self._entries[user.id] = (self._clock() + self.ttl_seconds, user)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+
+_user_cache: Optional[UserCache] = None
+_user_cache_lock = threading.Lock()
+_invalidation_listener = None
+
+
+def get_user_cache() -> Optional[UserCache]:
+    global _user_cache
+
+    if settings.USER_CACHE_MAX_SIZE <= 0:
+        return None
+
+    if _user_cache is None:
+        with _user_cache_lock:
+            if _user_cache is None:
+                _user_cache = UserCache(
+                    max_size=settings.USER_CACHE_MAX_SIZE,
+                    ttl_seconds=settings.USER_CACHE_TTL_SECONDS,
+                    redis_tier=_get_redis_tier(),
+                )
+    return _user_cache
+
+
+def invalidate_cached_user(user_id: str) -> None:
+    """Drop ``user_id`` from this worker's cache and, with Redis, from every worker's.
+
+    User rows changed through the ORM are invalidated on commit; call this
+    after changing users any other way, e.g. with a bulk UPDATE.
+    """
+    user_cache = get_user_cache()
+    if user_cache is not None:
+        user_cache.invalidate(user_id=user_id)
+
+
+def start_user_cache_listener() -> None:
+    global _invalidation_listener
+
+    user_cache = get_user_cache()
+    if (
+        _invalidation_listener is None
+        and user_cache is not None
+        and user_cache.redis_tier is not None
+    ):
+        _invalidation_listener = user_cache.redis_tier.subscribe(
+            on_invalidate=lambda user_id: user_cache.evict(user_id=user_id)
+        )
+
+
+def stop_user_cache_listener() -> None:
+    global _invalidation_listener
+
+    if _invalidation_listener is not None:
+        _invalidation_listener.stop()
+        _invalidation_listener = None
+
+
+def _get_redis_tier() -> Optional[RedisUserCacheTier]:
+    if not settings.USER_CACHE_REDIS_ENABLED:
+        return None
+    return RedisUserCacheTier(
+        client=redis.from_url(settings.REDIS_URL, decode_responses=True),
+        ttl_seconds=settings.USER_CACHE_TTL_SECONDS,
+        channel=settings.USER_CACHE_INVALIDATION_CHANNEL,
+    )
+
+
+def _dump_snapshot(user: UserDTO) -> str:
+    snapshot = asdict(user)
+    snapshot.pop("password_hash")
+    for field in _DATETIME_FIELDS:
+        if snapshot[field] is not None:
+            snapshot[field] = snapshot[field].isoformat()
+    return json.dumps(snapshot)
+
+
+def _load_snapshot(data: str) -> UserDTO:
+    snapshot = json.loads(data)
+    for field in _DATETIME_FIELDS:
+        if snapshot.get(field) is not None:
+            snapshot[field] = datetime.fromisoformat(snapshot[field])
+    return UserDTO(**snapshot)
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _mark_user_changed(mapper, connection, target: User) -> None:
+    session = Session.object_session(target)
+    if session is not None:
+        session.info.setdefault(_PENDING_INVALIDATIONS_KEY, set()).add(target.id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_users(session: Session) -> None:
+    for user_id in session.info.pop(_PENDING_INVALIDATIONS_KEY, ()):
+        invalidate_cached_user(user_id=user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back_users(session: Session) -> None:
+    session.info.pop(_PENDING_INVALIDATIONS_KEY, None)
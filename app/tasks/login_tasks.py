@@ -1,9 +1,58 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy.exc import IntegrityError
 from sqlmodel import Session, select
 
 from app.celery_app import celery_app
 from app.database import engine
 from app.models import LoginLog, User
 
+RECENT_LOGIN_COUNT = 5
+
+
+@celery_app.task
+def record_login(login_event: dict):
+    """Persist a login log and check its location in one transaction.
+
+    The recent logins are read before the new row is written, so the check
+    needs no read-back. The event carries its own id, which makes a
+    redelivered event a no-op.
+    """
+    login_log = LoginLog(
+        id=login_event["id"],
+        user_id=login_event["user_id"],
+        ip_address=login_event["ip_address"],
+        user_agent=login_event["user_agent"],
+        login_timestamp=datetime.fromisoformat(login_event["login_timestamp"]),
+    )
+
+    with Session(engine) as session:
+        alert_email = None
+        recent_ips = []
+        if login_log.ip_address:
+            recent_ips = _get_recent_login_ips(
+                session=session,
+                user_id=login_log.user_id,
+                before=login_log.login_timestamp,
+            )
+            if recent_ips and login_log.ip_address not in recent_ips:
+                alert_email = _get_user_email(
+                    session=session, user_id=login_log.user_id
+                )
+
+        session.add(instance=login_log)
+        try:
+            session.commit()
+        except IntegrityError:
+            session.rollback()
+            return
+
+    if alert_email:
+        send_location_alert_email.delay(
+            alert_email, login_event["ip_address"], recent_ips
+        )
+
 
 @celery_app.task
 def check_login_location(user_id: str, current_ip: str):
@@ -12,11 +61,11 @@ def check_login_location(user_id: str, current_ip: str):
             select(LoginLog)
             .where(LoginLog.user_id == user_id)
             .order_by(LoginLog.login_timestamp.desc())
-            .limit(6)
+            .limit(RECENT_LOGIN_COUNT + 1)
         )
         all_logins = session.exec(statement).all()
 
-        recent_logins = all_logins[1:6] if len(all_logins) > 1 else []
+        recent_logins = all_logins[1 : RECENT_LOGIN_COUNT + 1]
         recent_ips = [login.ip_address for login in recent_logins if login.ip_address]
 
         if current_ip not in recent_ips and len(recent_ips) > 0:
@@ -35,3 +84,20 @@ def send_location_alert_email(email: str, current_ip: str, recent_ips: list[str]
         f"This IP is different from your recent login locations: {', '.join(recent_ips)}"
     )
     print(f"If this was not you, please secure your account immediately.")
+
+
+def _get_recent_login_ips(
+    session: Session, user_id: str, before: datetime
+) -> list[str]:
+    statement = (
+        select(LoginLog.ip_address)
+        .where(LoginLog.user_id == user_id, LoginLog.login_timestamp < before)
+        .order_by(LoginLog.login_timestamp.desc())
+        .limit(RECENT_LOGIN_COUNT)
+    )
+    return [ip_address for ip_address in session.exec(statement) if ip_address]
+
+
+def _get_user_email(session: Session, user_id: str) -> Optional[str]:
+    user = session.get(User, user_id)
+    return user.email if user else None
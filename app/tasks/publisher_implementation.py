@@ -0,0 +1,25 @@
+from dataclasses import replace
+from datetime import datetime
+
+from app.dtos import LoginLogDTO
+from app.interactos.publisher_interface import ILoginEventPublisher
+from app.models import generate_uuid_str
+from app.tasks.login_tasks import record_login
+
+
+class LoginEventPublisher(ILoginEventPublisher):
+    def publish_login(self, login_log_dto: LoginLogDTO) -> LoginLogDTO:
+        # The id is assigned here so a redelivered event maps to the same row.
+        login_log_dto = replace(
+            login_log_dto, id=generate_uuid_str(), login_timestamp=datetime.utcnow()
+        )
+        record_login.delay(
+            {
+                "id": login_log_dto.id,
+                "user_id": login_log_dto.user_id,
+                "ip_address": login_log_dto.ip_address,
+                "user_agent": login_log_dto.user_agent,
+                "login_timestamp": login_log_dto.login_timestamp.isoformat(),
+            }
+        )
+        return login_log_dto
@@ -1,3 +1,7 @@
+import base64
+import binascii
+import hashlib
+import hmac
 from datetime import datetime, timedelta
 from typing import Optional
 
@@ -46,3 +50,31 @@ def decode_jwt_token(token: str) -> Optional[dict]:
         return None
     except jwt.InvalidTokenError:
         return None
+
+
+def encode_prime_cursor(offset: int, lo: int) -> str:
+    position = f"{offset}:{lo}"
+    token = f"{position}:{_sign_prime_cursor(position=position)}".encode()
+    return base64.urlsafe_b64encode(token).rstrip(b"=").decode()
+
+
+def decode_prime_cursor(cursor: str) -> Optional[tuple[int, int]]:
+    # Cursors are signed so a client cannot pick an arbitrary lo.
+    try:
+        token = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        offset, lo, signature = token.decode().split(":")
+        # compare_digest only accepts ASCII str, so compare the bytes.
+        if not hmac.compare_digest(
+            signature.encode(), _sign_prime_cursor(position=f"{offset}:{lo}").encode()
+        ):
+            return None
+        return int(offset), int(lo)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        return None
+
+
+def _sign_prime_cursor(position: str) -> str:
+    digest = hmac.new(
+        settings.JWT_SECRET_KEY.encode(), position.encode(), hashlib.sha256
+    ).digest()
+    return base64.urlsafe_b64encode(digest[:16]).rstrip(b"=").decode()
@@ -0,0 +1,53 @@
+"""Render throughput of the first-N primes JSON payload.
+
+Compares Starlette's stdlib ``JSONResponse`` with ``FastJSONResponse``.
+Usage: python -m benchmarks.bench_json_response [count ...]
+"""
+import argparse
+import timeit
+
+from fastapi.responses import JSONResponse
+
+from app.presenters.json_response import ORJSON_AVAILABLE, FastJSONResponse
+from app.prime_engine.sieve import first_n_primes
+
+DEFAULT_COUNTS = [10**4, 10**5]
+REPEATS = 5
+
+
+def measure(response_class: type[JSONResponse], content: dict) -> tuple[float, int]:
+    number = max(1, 2000000 // len(content["primes"]))
+    best = min(
+        timeit.repeat(
+            lambda: response_class(content=content),
+            number=number,
+            repeat=REPEATS,
+        )
+    )
+    body_size = len(response_class(content=content).body)
+    return number / best, body_size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("counts", nargs="*", type=int, default=DEFAULT_COUNTS)
+    args = parser.parse_args()
+
+    print(f"orjson available: {ORJSON_AVAILABLE}")
+    print(
+        f"{'count':>8} {'response':>17} {'renders/s':>10} {'MB/s':>8} {'speed-up':>9}"
+    )
+    for count in args.counts:
+        content = {"count": count, "primes": list(first_n_primes(count=count))}
+        baseline = None
+        for response_class in (JSONResponse, FastJSONResponse):
+            rate, body_size = measure(response_class=response_class, content=content)
+            baseline = baseline or rate
+            print(
+                f"{count:>8} {response_class.__name__:>17} {rate:>10.1f} "
+                f"{rate * body_size / 1e6:>8.1f} {rate / baseline:>8.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
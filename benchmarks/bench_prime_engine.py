@@ -0,0 +1,58 @@
+"""Latency and peak RSS of first-N prime generation.
+
+Each size runs in a fresh interpreter so peak RSS is not inflated by
+earlier, larger runs. Usage: python -m benchmarks.bench_prime_engine
+"""
+import argparse
+import json
+import subprocess
+import sys
+
+DEFAULT_COUNTS = [10**4, 10**5, 10**6, 10**7]
+
+WORKER_SOURCE = """
+import json, resource, sys, time
+from app.prime_engine.sieve import first_n_primes
+
+count = int(sys.argv[1])
+baseline_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+start = time.perf_counter()
+primes = first_n_primes(count=count)
+elapsed_ms = (time.perf_counter() - start) * 1000
+peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({
+    "count": count,
+    "last_prime": primes[-1],
+    "latency_ms": elapsed_ms,
+    "peak_rss_mb": peak_kb / 1024,
+    "delta_rss_mb": (peak_kb - baseline_kb) / 1024,
+}))
+"""
+
+
+def run(count: int) -> dict:
+    output = subprocess.check_output(
+        [sys.executable, "-c", WORKER_SOURCE, str(count)], text=True
+    )
+    return json.loads(output)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("counts", nargs="*", type=int, default=DEFAULT_COUNTS)
+    args = parser.parse_args()
+
+    print(
+        f"{'count':>10} {'last prime':>12} {'latency ms':>12} {'peak MB':>9} {'delta MB':>9}"
+    )
+    for count in args.counts:
+        result = run(count=count)
+        print(
+            f"{result['count']:>10} {result['last_prime']:>12} "
+            f"{result['latency_ms']:>12.1f} {result['peak_rss_mb']:>9.1f} "
+            f"{result['delta_rss_mb']:>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,8 @@
 import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import create_async_engine
 from sqlmodel import Session, SQLModel, create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
 from sqlmodel.pool import StaticPool
 
 from app.models import User
@@ -51,3 +54,22 @@ def session_fixture(engine):
     session.close()
     transaction.rollback()
     connection.close()
+
+
+@pytest_asyncio.fixture(scope="function")
+async def async_engine():
+    engine = create_async_engine(
+        url="sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async with engine.begin() as connection:
+        await connection.run_sync(SQLModel.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture(name="async_session")
+async def async_session_fixture(async_engine):
+    async with AsyncSession(async_engine, expire_on_commit=False) as session:
+        yield session
@@ -4,9 +4,11 @@ import pytest
 from fastapi.responses import JSONResponse
 from freezegun import freeze_time
 
+from app.dtos import LoginLogDTO
 from app.interactos.login_interactor import LoginInteractor
 from app.interactos.presenter_interface import ILoginPresenter
-from app.interactos.storage_interface import ILoginLogStorage, IUserStorage
+from app.interactos.publisher_interface import ILoginEventPublisher
+from app.interactos.storage_interface import IAsyncLoginLogStorage, IAsyncUserStorage
 from tests.factories.dto_factories import (
     LoginLogDTOFactory,
     LoginRequestDTOFactory,
@@ -16,12 +18,12 @@ from tests.factories.dto_factories import (
 
 @pytest.fixture
 def mock_user_storage():
-    return create_autospec(spec=IUserStorage, instance=True)
+    return create_autospec(spec=IAsyncUserStorage, instance=True)
 
 
 @pytest.fixture
 def mock_login_log_storage():
-    return create_autospec(spec=ILoginLogStorage, instance=True)
+    return create_autospec(spec=IAsyncLoginLogStorage, instance=True)
 
 
 @pytest.fixture
@@ -79,10 +81,11 @@ def valid_login_request():
 
 
 class TestUserLoginWrapper:
+    @pytest.mark.asyncio
     @freeze_time("2025-01-01 12:00:00")
     @patch("app.interactos.login_interactor.create_jwt_token")
     @patch("app.interactos.login_interactor.verify_password")
-    def test_successful_login_with_valid_credentials(
+    async def test_successful_login_with_valid_credentials(
         self,
         mock_verify_password,
         mock_create_jwt_token,
@@ -108,7 +111,9 @@ class TestUserLoginWrapper:
 
         mock_login_log_storage.create.return_value = LoginLogDTOFactory()
 
-        response = login_interactor.user_login_wrapper(request_dto=valid_login_request)
+        response = await login_interactor.user_login_wrapper(
+            request_dto=valid_login_request
+        )
 
         assert response.status_code == expected_status_code
         mock_login_log_storage.create.assert_called_once()
@@ -128,7 +133,8 @@ class TestUserLoginWrapper:
         assert call_args.kwargs["result"].expires_in == expected_expires_in
         assert call_args.kwargs["result"].user.username == expected_username
 
-    def test_invalid_input_empty_username(self, login_interactor, mock_presenter):
+    @pytest.mark.asyncio
+    async def test_invalid_input_empty_username(self, login_interactor, mock_presenter):
         empty_username = ""
         valid_password = "password123"
         expected_status_code = 400
@@ -137,12 +143,15 @@ class TestUserLoginWrapper:
             username=empty_username, password=valid_password
         )
 
-        response = login_interactor.user_login_wrapper(request_dto=request)
+        response = await login_interactor.user_login_wrapper(request_dto=request)
 
         assert response.status_code == expected_status_code
         mock_presenter.get_invalid_input_response.assert_called_once()
 
-    def test_invalid_input_whitespace_username(self, login_interactor, mock_presenter):
+    @pytest.mark.asyncio
+    async def test_invalid_input_whitespace_username(
+        self, login_interactor, mock_presenter
+    ):
         whitespace_username = "   "
         valid_password = "password123"
         expected_status_code = 400
@@ -151,12 +160,13 @@ class TestUserLoginWrapper:
             username=whitespace_username, password=valid_password
         )
 
-        response = login_interactor.user_login_wrapper(request_dto=request)
+        response = await login_interactor.user_login_wrapper(request_dto=request)
 
         assert response.status_code == expected_status_code
         mock_presenter.get_invalid_input_response.assert_called_once()
 
-    def test_invalid_input_empty_password(self, login_interactor, mock_presenter):
+    @pytest.mark.asyncio
+    async def test_invalid_input_empty_password(self, login_interactor, mock_presenter):
         valid_username = "testuser"
         empty_password = ""
         expected_status_code = 400
@@ -165,12 +175,15 @@ class TestUserLoginWrapper:
             username=valid_username, password=empty_password
         )
 
-        response = login_interactor.user_login_wrapper(request_dto=request)
+        response = await login_interactor.user_login_wrapper(request_dto=request)
 
         assert response.status_code == expected_status_code
         mock_presenter.get_invalid_input_response.assert_called_once()
 
-    def test_invalid_input_whitespace_password(self, login_interactor, mock_presenter):
+    @pytest.mark.asyncio
+    async def test_invalid_input_whitespace_password(
+        self, login_interactor, mock_presenter
+    ):
         valid_username = "testuser"
         whitespace_password = "   "
         expected_status_code = 400
@@ -179,12 +192,13 @@ class TestUserLoginWrapper:
             username=valid_username, password=whitespace_password
         )
 
-        response = login_interactor.user_login_wrapper(request_dto=request)
+        response = await login_interactor.user_login_wrapper(request_dto=request)
 
         assert response.status_code == expected_status_code
         mock_presenter.get_invalid_input_response.assert_called_once()
 
-    def test_user_not_found(
+    @pytest.mark.asyncio
+    async def test_user_not_found(
         self, login_interactor, mock_user_storage, mock_presenter, valid_login_request
     ):
         expected_username = "testuser"
@@ -193,7 +207,9 @@ class TestUserLoginWrapper:
 
         mock_user_storage.get_by_username.return_value = user_not_found
 
-        response = login_interactor.user_login_wrapper(request_dto=valid_login_request)
+        response = await login_interactor.user_login_wrapper(
+            request_dto=valid_login_request
+        )
 
         assert response.status_code == expected_status_code
         mock_user_storage.get_by_username.assert_called_once_with(
@@ -201,8 +217,9 @@ class TestUserLoginWrapper:
         )
         mock_presenter.get_invalid_credentials_response.assert_called_once_with()
 
+    @pytest.mark.asyncio
     @patch("app.interactos.login_interactor.verify_password")
-    def test_invalid_password(
+    async def test_invalid_password(
         self,
         mock_verify_password,
         login_interactor,
@@ -220,7 +237,9 @@ class TestUserLoginWrapper:
         mock_user_storage.get_by_username.return_value = active_user_dto
         mock_verify_password.return_value = password_verification_result
 
-        response = login_interactor.user_login_wrapper(request_dto=valid_login_request)
+        response = await login_interactor.user_login_wrapper(
+            request_dto=valid_login_request
+        )
 
         assert response.status_code == expected_status_code
         mock_user_storage.get_by_username.assert_called_once_with(
@@ -232,8 +251,9 @@ class TestUserLoginWrapper:
         )
         mock_presenter.get_invalid_credentials_response.assert_called_once_with()
 
+    @pytest.mark.asyncio
     @patch("app.interactos.login_interactor.verify_password")
-    def test_inactive_account(
+    async def test_inactive_account(
         self,
         mock_verify_password,
         login_interactor,
@@ -250,7 +270,9 @@ class TestUserLoginWrapper:
         mock_user_storage.get_by_username.return_value = inactive_user_dto
         mock_verify_password.return_value = password_verification_result
 
-        response = login_interactor.user_login_wrapper(request_dto=valid_login_request)
+        response = await login_interactor.user_login_wrapper(
+            request_dto=valid_login_request
+        )
 
         assert response.status_code == expected_status_code
         mock_user_storage.get_by_username.assert_called_once_with(
@@ -258,10 +280,11 @@ class TestUserLoginWrapper:
         )
         mock_presenter.get_inactive_account_response.assert_called_once_with()
 
+    @pytest.mark.asyncio
     @freeze_time("2025-01-01 12:00:00")
     @patch("app.interactos.login_interactor.create_jwt_token")
     @patch("app.interactos.login_interactor.verify_password")
-    def test_successful_login_creates_login_log(
+    async def test_successful_login_creates_login_log(
         self,
         mock_verify_password,
         mock_create_jwt_token,
@@ -287,7 +310,9 @@ class TestUserLoginWrapper:
 
         mock_login_log_storage.create.return_value = LoginLogDTOFactory()
 
-        response = login_interactor.user_login_wrapper(request_dto=valid_login_request)
+        response = await login_interactor.user_login_wrapper(
+            request_dto=valid_login_request
+        )
 
         assert response.status_code == expected_status_code
         mock_login_log_storage.create.assert_called_once()
@@ -297,7 +322,8 @@ class TestUserLoginWrapper:
         assert call_args.kwargs["login_log_dto"].ip_address == expected_ip_address
         assert call_args.kwargs["login_log_dto"].user_agent == expected_user_agent
 
-    def test_failed_login_without_user_does_not_create_log(
+    @pytest.mark.asyncio
+    async def test_failed_login_without_user_does_not_create_log(
         self,
         login_interactor,
         mock_user_storage,
@@ -310,8 +336,107 @@ class TestUserLoginWrapper:
 
         mock_user_storage.get_by_username.return_value = user_not_found
 
-        response = login_interactor.user_login_wrapper(request_dto=valid_login_request)
+        response = await login_interactor.user_login_wrapper(
+            request_dto=valid_login_request
+        )
 
         assert response.status_code == expected_status_code
         mock_login_log_storage.create.assert_not_called()
         mock_login_log_storage.create.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch("app.interactos.login_interactor.check_login_location")
+    @patch("app.interactos.login_interactor.verify_password")
+    async def test_successful_login_awaits_storages(
+        self,
+        mock_verify_password,
+        mock_check_login_location,
+        login_interactor,
+        mock_user_storage,
+        mock_login_log_storage,
+        active_user_dto,
+        valid_login_request,
+    ):
+        mock_user_storage.get_by_username.return_value = active_user_dto
+        mock_verify_password.return_value = True
+        mock_login_log_storage.create.return_value = LoginLogDTOFactory()
+
+        response = await login_interactor.user_login_wrapper(
+            request_dto=valid_login_request
+        )
+
+        assert response.status_code == 200
+        mock_user_storage.get_by_username.assert_awaited_once_with(username="testuser")
+        mock_login_log_storage.create.assert_awaited_once()
+
+
+class TestUserLoginWrapperWithLoginEventPublisher:
+    @pytest.fixture
+    def mock_login_event_publisher(self):
+        return create_autospec(spec=ILoginEventPublisher, instance=True)
+
+    @pytest.fixture
+    def login_interactor(
+        self,
+        mock_user_storage,
+        mock_login_log_storage,
+        mock_presenter,
+        mock_login_event_publisher,
+    ):
+        return LoginInteractor(
+            user_storage=mock_user_storage,
+            login_log_storage=mock_login_log_storage,
+            presenter=mock_presenter,
+            login_event_publisher=mock_login_event_publisher,
+        )
+
+    @pytest.mark.asyncio
+    @patch("app.interactos.login_interactor.check_login_location")
+    @patch("app.interactos.login_interactor.verify_password")
+    async def test_successful_login_publishes_single_event(
+        self,
+        mock_verify_password,
+        mock_check_login_location,
+        login_interactor,
+        mock_user_storage,
+        mock_login_log_storage,
+        mock_login_event_publisher,
+        active_user_dto,
+        valid_login_request,
+    ):
+        mock_user_storage.get_by_username.return_value = active_user_dto
+        mock_verify_password.return_value = True
+
+        response = await login_interactor.user_login_wrapper(
+            request_dto=valid_login_request
+        )
+
+        assert response.status_code == 200
+        mock_login_event_publisher.publish_login.assert_called_once_with(
+            login_log_dto=LoginLogDTO(
+                user_id="user-123", ip_address="127.0.0.1", user_agent="Mozilla/5.0"
+            )
+        )
+        mock_login_log_storage.create.assert_not_called()
+        mock_check_login_location.delay.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch("app.interactos.login_interactor.verify_password")
+    async def test_failed_login_publishes_nothing(
+        self,
+        mock_verify_password,
+        login_interactor,
+        mock_user_storage,
+        mock_login_event_publisher,
+        active_user_dto,
+        valid_login_request,
+    ):
+        mock_user_storage.get_by_username.return_value = active_user_dto
+        mock_verify_password.return_value = False
+
+        response = await login_interactor.user_login_wrapper(
+            request_dto=valid_login_request
+        )
+
+        assert response.status_code == 401
+        mock_login_event_publisher.publish_login.assert_not_called()
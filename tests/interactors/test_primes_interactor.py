@@ -1,12 +1,33 @@
-from unittest.mock import create_autospec
+import base64
+from unittest.mock import AsyncMock, create_autospec, patch
 
 import pytest
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 
-from app.dtos import PrimeNumbersRequestDTO
-from app.exceptions import InvalidInputException
+from app.constants import (
+    MAX_NTH_PRIME_INDEX,
+    MAX_PRIMALITY_CHECK_BATCH,
+    MAX_PRIME_COUNT,
+    MAX_PRIME_COUNTING_BOUND,
+    MAX_PRIME_RANGE_BOUND,
+    MAX_PRIME_RANGE_SIZE,
+)
+from app.dtos import (
+    NthPrimeRequestDTO,
+    PrimalityCheckRequestDTO,
+    PrimeCountRequestDTO,
+    PrimeNumbersRequestDTO,
+    PrimePageRequestDTO,
+    PrimeRangeRequestDTO,
+)
+from app.exceptions import InvalidInputException, PrimeComputationTimeoutException
 from app.interactos.presenter_interface import IPrimeNumbersPresenter
 from app.interactos.primes_interactor import PrimeNumbersInteractor
+from app.prime_engine import SievePrimeEngine
+from app.prime_engine import factory as prime_factory
+from app.prime_engine import get_prime_engine
+from app.prime_engine.executor import run_parallel_first_n_primes
+from app.utils import decode_prime_cursor, encode_prime_cursor
 
 
 @pytest.fixture
@@ -15,15 +36,38 @@ def mock_presenter():
     presenter.get_success_response.return_value = JSONResponse(
         content={"success": True}, status_code=200
     )
+    presenter.get_page_success_response.return_value = JSONResponse(
+        content={"success": True}, status_code=200
+    )
+    presenter.get_range_success_response.return_value = JSONResponse(
+        content={"success": True}, status_code=200
+    )
+    presenter.get_check_success_response.return_value = JSONResponse(
+        content={"success": True}, status_code=200
+    )
+    presenter.get_nth_prime_success_response.return_value = JSONResponse(
+        content={"success": True}, status_code=200
+    )
+    presenter.get_prime_count_success_response.return_value = JSONResponse(
+        content={"success": True}, status_code=200
+    )
     presenter.get_invalid_input_response.return_value = JSONResponse(
         content={"error": "invalid"}, status_code=400
     )
+    presenter.is_not_modified.return_value = False
+    presenter.get_cached_success_response.return_value = None
+    presenter.get_not_modified_response.return_value = Response(status_code=304)
+    presenter.get_timeout_response.return_value = JSONResponse(
+        content={"error": "timeout"}, status_code=503
+    )
     return presenter
 
 
 @pytest.fixture
 def primes_interactor(mock_presenter):
-    return PrimeNumbersInteractor(presenter=mock_presenter)
+    return PrimeNumbersInteractor(
+        presenter=mock_presenter, prime_engine=SievePrimeEngine()
+    )
 
 
 class TestPrimeNumbersInteractor:
@@ -50,20 +94,24 @@ class TestPrimeNumbersInteractor:
         assert primes_interactor._is_prime(-5) is False
         assert primes_interactor._is_prime(-10) is False
 
-    def test_generate_n_primes_first_five(self, primes_interactor):
-        result = primes_interactor._generate_n_primes(5)
+    @pytest.mark.asyncio
+    async def test_generate_n_primes_first_five(self, primes_interactor):
+        result = list(await primes_interactor._generate_n_primes(5))
         assert result == [2, 3, 5, 7, 11]
 
-    def test_generate_n_primes_first_ten(self, primes_interactor):
-        result = primes_interactor._generate_n_primes(10)
+    @pytest.mark.asyncio
+    async def test_generate_n_primes_first_ten(self, primes_interactor):
+        result = list(await primes_interactor._generate_n_primes(10))
         assert result == [2, 3, 5, 7, 11, 13, 17, 19, 23, 29]
 
-    def test_generate_n_primes_one_prime(self, primes_interactor):
-        result = primes_interactor._generate_n_primes(1)
+    @pytest.mark.asyncio
+    async def test_generate_n_primes_one_prime(self, primes_interactor):
+        result = list(await primes_interactor._generate_n_primes(1))
         assert result == [2]
 
-    def test_generate_n_primes_twenty_primes(self, primes_interactor):
-        result = primes_interactor._generate_n_primes(20)
+    @pytest.mark.asyncio
+    async def test_generate_n_primes_twenty_primes(self, primes_interactor):
+        result = list(await primes_interactor._generate_n_primes(20))
         expected = [
             2,
             3,
@@ -111,44 +159,555 @@ class TestPrimeNumbersInteractor:
         request_dto = PrimeNumbersRequestDTO(count=10, user_id="user123")
         primes_interactor._validate_input(request_dto)
 
-    def test_execute_prime_generation_success(self, primes_interactor):
+    @pytest.mark.asyncio
+    async def test_execute_prime_generation_success(self, primes_interactor):
         request_dto = PrimeNumbersRequestDTO(count=5, user_id="user123")
-        result = primes_interactor._execute_prime_generation(request_dto)
+        result = await primes_interactor._execute_prime_generation(request_dto)
 
         assert result.count == 5
-        assert result.primes == [2, 3, 5, 7, 11]
+        assert list(result.primes) == [2, 3, 5, 7, 11]
 
-    def test_execute_prime_generation_invalid_input(self, primes_interactor):
-        request_dto = PrimeNumbersRequestDTO(count=0, user_id="user123")
-        with pytest.raises(InvalidInputException):
-            primes_interactor._execute_prime_generation(request_dto)
+    @pytest.mark.asyncio
+    async def test_generate_primes_wrapper_validates_once(self, primes_interactor):
+        request_dto = PrimeNumbersRequestDTO(count=5, user_id="user123")
 
-    def test_generate_primes_wrapper_success(self, primes_interactor, mock_presenter):
+        with patch.object(
+            primes_interactor,
+            "_validate_input",
+            wraps=primes_interactor._validate_input,
+        ) as validate_input:
+            await primes_interactor.generate_primes_wrapper(request_dto)
+
+        validate_input.assert_called_once_with(request_dto=request_dto)
+
+    @pytest.mark.asyncio
+    async def test_generate_primes_wrapper_success(
+        self, primes_interactor, mock_presenter
+    ):
         request_dto = PrimeNumbersRequestDTO(count=3, user_id="user123")
-        response = primes_interactor.generate_primes_wrapper(request_dto)
+        response = await primes_interactor.generate_primes_wrapper(request_dto)
 
         mock_presenter.get_success_response.assert_called_once()
         call_args = mock_presenter.get_success_response.call_args[1]
         result = call_args["result"]
 
         assert result.count == 3
-        assert result.primes == [2, 3, 5]
+        assert list(result.primes) == [2, 3, 5]
         assert response.status_code == 200
 
-    def test_generate_primes_wrapper_invalid_input(
+    @pytest.mark.asyncio
+    async def test_generate_primes_wrapper_invalid_input(
         self, primes_interactor, mock_presenter
     ):
         request_dto = PrimeNumbersRequestDTO(count=-1, user_id="user123")
-        response = primes_interactor.generate_primes_wrapper(request_dto)
+        response = await primes_interactor.generate_primes_wrapper(request_dto)
 
         mock_presenter.get_invalid_input_response.assert_called_once()
         assert response.status_code == 400
 
-    def test_generate_primes_wrapper_exceeds_limit(
+    @pytest.mark.asyncio
+    async def test_generate_primes_wrapper_exceeds_limit(
         self, primes_interactor, mock_presenter
     ):
         request_dto = PrimeNumbersRequestDTO(count=20000, user_id="user123")
-        response = primes_interactor.generate_primes_wrapper(request_dto)
+        response = await primes_interactor.generate_primes_wrapper(request_dto)
+
+        mock_presenter.get_invalid_input_response.assert_called_once()
+        assert response.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_generate_primes_wrapper_not_modified(
+        self, primes_interactor, mock_presenter, monkeypatch
+    ):
+        async def fail(*args, **kwargs):
+            raise AssertionError("primes should not be generated")
+
+        monkeypatch.setattr("app.interactos.primes_interactor.run_prime_engine", fail)
+        mock_presenter.is_not_modified.return_value = True
+        request_dto = PrimeNumbersRequestDTO(count=3, user_id="user123")
+
+        response = await primes_interactor.generate_primes_wrapper(request_dto)
+
+        mock_presenter.is_not_modified.assert_called_once_with(count=3)
+        mock_presenter.get_not_modified_response.assert_called_once_with(count=3)
+        mock_presenter.get_success_response.assert_not_called()
+        assert response.status_code == 304
+
+    @pytest.mark.asyncio
+    async def test_generate_primes_wrapper_returns_cached_body(
+        self, primes_interactor, mock_presenter, monkeypatch
+    ):
+        async def fail(*args, **kwargs):
+            raise AssertionError("primes should not be generated")
+
+        monkeypatch.setattr("app.interactos.primes_interactor.run_prime_engine", fail)
+        cached_response = Response(content=b"cached", status_code=200)
+        mock_presenter.get_cached_success_response.return_value = cached_response
+        request_dto = PrimeNumbersRequestDTO(count=3, user_id="user123")
+
+        response = await primes_interactor.generate_primes_wrapper(request_dto)
+
+        mock_presenter.get_cached_success_response.assert_called_once_with(count=3)
+        mock_presenter.get_success_response.assert_not_called()
+        assert response is cached_response
+
+    @pytest.mark.asyncio
+    async def test_generate_primes_wrapper_validates_before_etag_check(
+        self, primes_interactor, mock_presenter
+    ):
+        mock_presenter.is_not_modified.return_value = True
+        request_dto = PrimeNumbersRequestDTO(count=0, user_id="user123")
+
+        response = await primes_interactor.generate_primes_wrapper(request_dto)
+
+        mock_presenter.is_not_modified.assert_not_called()
+        assert response.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_generate_primes_wrapper_timeout(
+        self, primes_interactor, mock_presenter, monkeypatch
+    ):
+        async def time_out(*args, **kwargs):
+            raise PrimeComputationTimeoutException()
+
+        monkeypatch.setattr(
+            "app.interactos.primes_interactor.run_prime_engine", time_out
+        )
+        request_dto = PrimeNumbersRequestDTO(count=3, user_id="user123")
+        response = await primes_interactor.generate_primes_wrapper(request_dto)
+
+        mock_presenter.get_timeout_response.assert_called_once()
+        mock_presenter.get_success_response.assert_not_called()
+        assert response.status_code == 503
+
+    @pytest.mark.asyncio
+    async def test_generate_n_primes_above_threshold_uses_parallel_sieve(
+        self, primes_interactor, monkeypatch
+    ):
+        async def parallel_first_n_primes(prime_engine, count):
+            return [2, 3, 5]
+
+        monkeypatch.setattr(
+            "app.interactos.primes_interactor.PRIME_PARALLEL_SIEVE_THRESHOLD", 3
+        )
+        monkeypatch.setattr(
+            "app.interactos.primes_interactor.run_parallel_first_n_primes",
+            parallel_first_n_primes,
+        )
+
+        assert await primes_interactor._generate_n_primes(3) == [2, 3, 5]
+        assert list(await primes_interactor._generate_n_primes(2)) == [2, 3]
+
+    @pytest.mark.asyncio
+    async def test_generate_n_primes_sieves_uncached_counts_in_parallel(
+        self, mock_presenter, monkeypatch, tmp_path
+    ):
+        monkeypatch.setattr(prime_factory, "_prime_table", None)
+        monkeypatch.setattr(
+            prime_factory.settings, "PRIME_TABLE_PATH", str(tmp_path / "missing.bin")
+        )
+        monkeypatch.setattr(
+            "app.interactos.primes_interactor.PRIME_PARALLEL_SIEVE_THRESHOLD", 2000
+        )
+        parallel_first_n_primes = AsyncMock(wraps=run_parallel_first_n_primes)
+        monkeypatch.setattr(
+            "app.interactos.primes_interactor.run_parallel_first_n_primes",
+            parallel_first_n_primes,
+        )
+        primes_interactor = PrimeNumbersInteractor(
+            presenter=mock_presenter, prime_engine=get_prime_engine()
+        )
+
+        primes = await primes_interactor._generate_n_primes(5000)
+        parallel_first_n_primes.assert_awaited_once()
+
+        # The table now holds the first 5000 primes, so smaller counts are slices.
+        cached = await primes_interactor._generate_n_primes(3000)
+        parallel_first_n_primes.assert_awaited_once()
+        assert list(cached) == list(primes[:3000])
+        assert primes[-1] == 48611
+
+
+class TestPrimePage:
+    @pytest.mark.asyncio
+    async def test_first_page(self, primes_interactor, mock_presenter):
+        request_dto = PrimePageRequestDTO(offset=0, limit=5, user_id="user123")
+
+        response = await primes_interactor.get_prime_page_wrapper(request_dto)
+
+        result = mock_presenter.get_page_success_response.call_args[1]["result"]
+        assert result.offset == 0
+        assert list(result.primes) == [2, 3, 5, 7, 11]
+        assert decode_prime_cursor(cursor=result.next_cursor) == (5, 12)
+        assert response.status_code == 200
+
+    @pytest.mark.asyncio
+    async def test_page_at_offset(self, primes_interactor, mock_presenter):
+        request_dto = PrimePageRequestDTO(offset=9999, limit=3, user_id="user123")
+
+        await primes_interactor.get_prime_page_wrapper(request_dto)
+
+        result = mock_presenter.get_page_success_response.call_args[1]["result"]
+        assert result.offset == 9999
+        assert list(result.primes) == [104729, 104743, 104759]
+
+    @pytest.mark.asyncio
+    async def test_cursor_continues_without_nth_prime(
+        self, primes_interactor, mock_presenter
+    ):
+        request_dto = PrimePageRequestDTO(
+            offset=0,
+            limit=3,
+            user_id="user123",
+            cursor=encode_prime_cursor(offset=9999, lo=104724),
+        )
+        primes_interactor.prime_engine = create_autospec(
+            spec=SievePrimeEngine, instance=True, wraps=SievePrimeEngine()
+        )
+        primes_interactor.prime_engine.primes_from.return_value = [104729]
+
+        await primes_interactor.get_prime_page_wrapper(request_dto)
+
+        result = mock_presenter.get_page_success_response.call_args[1]["result"]
+        assert result.offset == 9999
+        primes_interactor.prime_engine.nth_prime.assert_not_called()
+        primes_interactor.prime_engine.primes_from.assert_called_once_with(
+            lo=104724, count=3
+        )
+
+    @pytest.mark.asyncio
+    async def test_pages_chain_through_cursors(self, primes_interactor, mock_presenter):
+        cursor = None
+        pages = []
+        for _ in range(3):
+            request_dto = PrimePageRequestDTO(
+                offset=0, limit=4, user_id="user123", cursor=cursor
+            )
+            await primes_interactor.get_prime_page_wrapper(request_dto)
+            result = mock_presenter.get_page_success_response.call_args[1]["result"]
+            pages.extend(result.primes)
+            cursor = result.next_cursor
+
+        assert pages == [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37]
+
+    @pytest.mark.asyncio
+    async def test_invalid_cursor(self, primes_interactor, mock_presenter):
+        request_dto = PrimePageRequestDTO(
+            offset=0, limit=5, user_id="user123", cursor="not-a-cursor"
+        )
+
+        response = await primes_interactor.get_prime_page_wrapper(request_dto)
+
+        mock_presenter.get_invalid_input_response.assert_called_once()
+        assert response.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_rejects_unsigned_cursor(self, primes_interactor, mock_presenter):
+        forged = base64.urlsafe_b64encode(f"5:{2**64 - 100}".encode()).decode()
+        request_dto = PrimePageRequestDTO(
+            offset=0, limit=5, user_id="user123", cursor=forged
+        )
+
+        response = await primes_interactor.get_prime_page_wrapper(request_dto)
+
+        assert response.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_rejects_cursor_with_tampered_lo(
+        self, primes_interactor, mock_presenter
+    ):
+        offset, lo, signature = (
+            base64.urlsafe_b64decode(encode_prime_cursor(offset=5, lo=12) + "==")
+            .decode()
+            .split(":")
+        )
+        tampered = base64.urlsafe_b64encode(f"{offset}:13:{signature}".encode())
+        request_dto = PrimePageRequestDTO(
+            offset=0, limit=5, user_id="user123", cursor=tampered.decode()
+        )
+
+        response = await primes_interactor.get_prime_page_wrapper(request_dto)
+
+        assert response.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_rejects_cursor_with_non_ascii_signature(
+        self, primes_interactor, mock_presenter
+    ):
+        malformed = base64.urlsafe_b64encode("1:2:é".encode()).decode()
+        request_dto = PrimePageRequestDTO(
+            offset=0, limit=5, user_id="user123", cursor=malformed
+        )
+
+        response = await primes_interactor.get_prime_page_wrapper(request_dto)
+
+        assert response.status_code == 400
+
+    def test_validate_page_input_rejects_cursor_at_range_bound(self, primes_interactor):
+        request_dto = PrimePageRequestDTO(offset=0, limit=5, user_id="u")
+
+        with pytest.raises(InvalidInputException):
+            primes_interactor._validate_page_input(
+                request_dto=request_dto, offset=3, lo=MAX_PRIME_RANGE_BOUND
+            )
+
+    @pytest.mark.parametrize(
+        "offset, limit",
+        [(-1, 5), (MAX_NTH_PRIME_INDEX, 5), (0, 0), (0, MAX_PRIME_COUNT + 1)],
+    )
+    def test_validate_page_input_out_of_range(self, primes_interactor, offset, limit):
+        request_dto = PrimePageRequestDTO(offset=offset, limit=limit, user_id="u")
+
+        with pytest.raises(InvalidInputException):
+            primes_interactor._validate_page_input(
+                request_dto=request_dto, offset=offset, lo=None
+            )
+
+    def test_validate_page_input_rejects_negative_cursor_bound(self, primes_interactor):
+        request_dto = PrimePageRequestDTO(offset=0, limit=5, user_id="u")
+
+        with pytest.raises(InvalidInputException):
+            primes_interactor._validate_page_input(
+                request_dto=request_dto, offset=3, lo=-1
+            )
+
+
+class TestPrimeRangeGeneration:
+    @pytest.mark.asyncio
+    async def test_generate_primes_in_range_returns_window(self, primes_interactor):
+        result = list(await primes_interactor._generate_primes_in_range(lo=90, hi=110))
+
+        assert result == [97, 101, 103, 107, 109]
+
+    @pytest.mark.asyncio
+    async def test_generate_primes_in_range_far_from_zero(self, primes_interactor):
+        lo = 10**12
+        hi = 10**12 + 100
+
+        result = list(await primes_interactor._generate_primes_in_range(lo=lo, hi=hi))
+
+        assert result == [1000000000039, 1000000000061, 1000000000063, 1000000000091]
+
+    def test_validate_range_input_with_negative_lo(self, primes_interactor):
+        request_dto = PrimeRangeRequestDTO(lo=-1, hi=10, user_id="user123")
+        with pytest.raises(InvalidInputException):
+            primes_interactor._validate_range_input(request_dto)
+
+    def test_validate_range_input_with_empty_range(self, primes_interactor):
+        request_dto = PrimeRangeRequestDTO(lo=10, hi=10, user_id="user123")
+        with pytest.raises(InvalidInputException):
+            primes_interactor._validate_range_input(request_dto)
+
+    def test_validate_range_input_exceeds_max_size(self, primes_interactor):
+        request_dto = PrimeRangeRequestDTO(
+            lo=0, hi=MAX_PRIME_RANGE_SIZE + 1, user_id="user123"
+        )
+        with pytest.raises(InvalidInputException):
+            primes_interactor._validate_range_input(request_dto)
+
+    def test_validate_range_input_exceeds_uint64(self, primes_interactor):
+        request_dto = PrimeRangeRequestDTO(
+            lo=2**64 - 10, hi=2**64 + 1, user_id="user123"
+        )
+        with pytest.raises(InvalidInputException):
+            primes_interactor._validate_range_input(request_dto)
+
+    def test_validate_range_input_above_bound(self, primes_interactor):
+        request_dto = PrimeRangeRequestDTO(
+            lo=MAX_PRIME_RANGE_BOUND - 10,
+            hi=MAX_PRIME_RANGE_BOUND + 1,
+            user_id="user123",
+        )
+        with pytest.raises(InvalidInputException):
+            primes_interactor._validate_range_input(request_dto)
+
+    @pytest.mark.asyncio
+    async def test_range_just_below_bound_is_answered(
+        self, primes_interactor, mock_presenter
+    ):
+        request_dto = PrimeRangeRequestDTO(
+            lo=MAX_PRIME_RANGE_BOUND - 1000, hi=MAX_PRIME_RANGE_BOUND, user_id="user123"
+        )
+
+        await primes_interactor.generate_primes_in_range_wrapper(request_dto)
+
+        result = mock_presenter.get_range_success_response.call_args[1]["result"]
+        assert result.primes
+        assert all(
+            MAX_PRIME_RANGE_BOUND - 1000 <= p < MAX_PRIME_RANGE_BOUND
+            for p in result.primes
+        )
+
+    def test_validate_range_input_at_max_size(self, primes_interactor):
+        request_dto = PrimeRangeRequestDTO(
+            lo=0, hi=MAX_PRIME_RANGE_SIZE, user_id="user123"
+        )
+        primes_interactor._validate_range_input(request_dto)
+
+    @pytest.mark.asyncio
+    async def test_generate_primes_in_range_wrapper_success(
+        self, primes_interactor, mock_presenter
+    ):
+        request_dto = PrimeRangeRequestDTO(lo=10, hi=20, user_id="user123")
+        response = await primes_interactor.generate_primes_in_range_wrapper(request_dto)
+
+        mock_presenter.get_range_success_response.assert_called_once()
+        result = mock_presenter.get_range_success_response.call_args[1]["result"]
+
+        assert result.lo == 10
+        assert result.hi == 20
+        assert result.count == 4
+        assert list(result.primes) == [11, 13, 17, 19]
+        assert response.status_code == 200
+
+    @pytest.mark.asyncio
+    async def test_generate_primes_in_range_wrapper_invalid_input(
+        self, primes_interactor, mock_presenter
+    ):
+        request_dto = PrimeRangeRequestDTO(lo=20, hi=10, user_id="user123")
+        response = await primes_interactor.generate_primes_in_range_wrapper(request_dto)
+
+        mock_presenter.get_invalid_input_response.assert_called_once()
+        assert response.status_code == 400
+
+
+class TestPrimalityCheck:
+    @pytest.mark.asyncio
+    async def test_check_primality_returns_result_per_number(self, primes_interactor):
+        numbers = [0, 1, 2, 15, 97, 18446744073709551557]
+
+        result = await primes_interactor._check_primality(numbers=numbers)
+
+        assert result == [False, False, True, False, True, True]
+
+    def test_validate_check_input_with_empty_batch(self, primes_interactor):
+        request_dto = PrimalityCheckRequestDTO(numbers=[], user_id="user123")
+        with pytest.raises(InvalidInputException):
+            primes_interactor._validate_check_input(request_dto)
+
+    def test_validate_check_input_exceeds_max_batch(self, primes_interactor):
+        request_dto = PrimalityCheckRequestDTO(
+            numbers=[7] * (MAX_PRIMALITY_CHECK_BATCH + 1), user_id="user123"
+        )
+        with pytest.raises(InvalidInputException):
+            primes_interactor._validate_check_input(request_dto)
+
+    def test_validate_check_input_with_negative_number(self, primes_interactor):
+        request_dto = PrimalityCheckRequestDTO(numbers=[7, -7], user_id="user123")
+        with pytest.raises(InvalidInputException):
+            primes_interactor._validate_check_input(request_dto)
+
+    def test_validate_check_input_exceeds_uint64(self, primes_interactor):
+        request_dto = PrimalityCheckRequestDTO(numbers=[2**64], user_id="user123")
+        with pytest.raises(InvalidInputException):
+            primes_interactor._validate_check_input(request_dto)
+
+    def test_validate_check_input_at_max_batch(self, primes_interactor):
+        request_dto = PrimalityCheckRequestDTO(
+            numbers=[2**64 - 1] * MAX_PRIMALITY_CHECK_BATCH, user_id="user123"
+        )
+        primes_interactor._validate_check_input(request_dto)
+
+    @pytest.mark.asyncio
+    async def test_check_primality_wrapper_success(
+        self, primes_interactor, mock_presenter
+    ):
+        request_dto = PrimalityCheckRequestDTO(numbers=[4, 5], user_id="user123")
+        response = await primes_interactor.check_primality_wrapper(request_dto)
+
+        mock_presenter.get_check_success_response.assert_called_once()
+        result = mock_presenter.get_check_success_response.call_args[1]["result"]
+
+        assert result.numbers == [4, 5]
+        assert result.results == [False, True]
+        assert response.status_code == 200
+
+    @pytest.mark.asyncio
+    async def test_check_primality_wrapper_invalid_input(
+        self, primes_interactor, mock_presenter
+    ):
+        request_dto = PrimalityCheckRequestDTO(numbers=[], user_id="user123")
+        response = await primes_interactor.check_primality_wrapper(request_dto)
+
+        mock_presenter.get_invalid_input_response.assert_called_once()
+        assert response.status_code == 400
+
+
+class TestNthPrime:
+    @pytest.mark.asyncio
+    async def test_find_nth_prime(self, primes_interactor):
+        assert await primes_interactor._find_nth_prime(n=1) == 2
+        assert await primes_interactor._find_nth_prime(n=10000) == 104729
+
+    def test_validate_nth_prime_input_with_zero(self, primes_interactor):
+        request_dto = NthPrimeRequestDTO(n=0, user_id="user123")
+        with pytest.raises(InvalidInputException):
+            primes_interactor._validate_nth_prime_input(request_dto)
+
+    def test_validate_nth_prime_input_exceeds_maximum(self, primes_interactor):
+        request_dto = NthPrimeRequestDTO(n=MAX_NTH_PRIME_INDEX + 1, user_id="user123")
+        with pytest.raises(InvalidInputException):
+            primes_interactor._validate_nth_prime_input(request_dto)
+
+    @pytest.mark.asyncio
+    async def test_get_nth_prime_wrapper_success(
+        self, primes_interactor, mock_presenter
+    ):
+        request_dto = NthPrimeRequestDTO(n=6, user_id="user123")
+        response = await primes_interactor.get_nth_prime_wrapper(request_dto)
+
+        result = mock_presenter.get_nth_prime_success_response.call_args[1]["result"]
+        assert result.n == 6
+        assert result.prime == 13
+        assert response.status_code == 200
+
+    @pytest.mark.asyncio
+    async def test_get_nth_prime_wrapper_invalid_input(
+        self, primes_interactor, mock_presenter
+    ):
+        request_dto = NthPrimeRequestDTO(n=-1, user_id="user123")
+        response = await primes_interactor.get_nth_prime_wrapper(request_dto)
+
+        mock_presenter.get_invalid_input_response.assert_called_once()
+        assert response.status_code == 400
+
+
+class TestPrimeCount:
+    @pytest.mark.asyncio
+    async def test_count_primes(self, primes_interactor):
+        assert await primes_interactor._count_primes(x=1) == 0
+        assert await primes_interactor._count_primes(x=10**6) == 78498
+
+    def test_validate_prime_count_input_with_negative_x(self, primes_interactor):
+        request_dto = PrimeCountRequestDTO(x=-1, user_id="user123")
+        with pytest.raises(InvalidInputException):
+            primes_interactor._validate_prime_count_input(request_dto)
+
+    def test_validate_prime_count_input_exceeds_maximum(self, primes_interactor):
+        request_dto = PrimeCountRequestDTO(
+            x=MAX_PRIME_COUNTING_BOUND + 1, user_id="user123"
+        )
+        with pytest.raises(InvalidInputException):
+            primes_interactor._validate_prime_count_input(request_dto)
+
+    @pytest.mark.asyncio
+    async def test_count_primes_wrapper_success(
+        self, primes_interactor, mock_presenter
+    ):
+        request_dto = PrimeCountRequestDTO(x=100, user_id="user123")
+        response = await primes_interactor.count_primes_wrapper(request_dto)
+
+        result = mock_presenter.get_prime_count_success_response.call_args[1]["result"]
+        assert result.x == 100
+        assert result.count == 25
+        assert response.status_code == 200
+
+    @pytest.mark.asyncio
+    async def test_count_primes_wrapper_invalid_input(
+        self, primes_interactor, mock_presenter
+    ):
+        request_dto = PrimeCountRequestDTO(x=-5, user_id="user123")
+        response = await primes_interactor.count_primes_wrapper(request_dto)
 
         mock_presenter.get_invalid_input_response.assert_called_once()
         assert response.status_code == 400
@@ -0,0 +1,102 @@
+import gzip
+from unittest.mock import patch
+
+import pytest
+
+from app.presenters.compression import (
+    BROTLI_ENCODING,
+    GZIP_ENCODING,
+    SUPPORTED_ENCODINGS,
+    ZSTD_ENCODING,
+    brotli,
+    compress_body,
+    negotiate_content_encoding,
+    zstandard,
+)
+
+BODY = b'{"count":1000,"primes":[' + b",".join(b"%d" % n for n in range(1000)) + b"]}"
+
+
+class TestNegotiateContentEncoding:
+    @pytest.mark.parametrize("accept_encoding", [None, "", "identity"])
+    def test_defaults_to_identity(self, accept_encoding):
+        assert negotiate_content_encoding(accept_encoding=accept_encoding) == (
+            "identity"
+        )
+
+    def test_picks_gzip(self):
+        assert negotiate_content_encoding(accept_encoding="gzip") == "gzip"
+
+    def test_respects_quality_values(self):
+        accept_encoding = ", ".join(
+            f"{encoding};q={0.5 if encoding == GZIP_ENCODING else 0.1}"
+            for encoding in SUPPORTED_ENCODINGS
+        )
+
+        assert negotiate_content_encoding(accept_encoding=accept_encoding) == "gzip"
+
+    def test_skips_refused_encodings(self):
+        assert negotiate_content_encoding(accept_encoding="*, gzip;q=0") in (
+            ZSTD_ENCODING,
+            BROTLI_ENCODING,
+            "identity",
+        )
+        assert negotiate_content_encoding(accept_encoding="gzip;q=0") == "identity"
+
+    def test_wildcard_selects_preferred_encoding(self):
+        assert negotiate_content_encoding(accept_encoding="*") == (
+            SUPPORTED_ENCODINGS[0]
+        )
+
+    def test_ignores_unknown_encodings(self):
+        assert negotiate_content_encoding(accept_encoding="compress, x-foo") == (
+            "identity"
+        )
+
+    def test_prefers_brotli_when_available(self):
+        if brotli is None:
+            pytest.skip("brotli is not installed")
+
+        assert negotiate_content_encoding(accept_encoding="gzip, deflate, br") == "br"
+
+
+class TestCompressBody:
+    def test_gzip_round_trip(self):
+        compressed = compress_body(body=BODY, encoding=GZIP_ENCODING)
+
+        assert len(compressed) < len(BODY)
+        assert gzip.decompress(compressed) == BODY
+
+    def test_gzip_output_is_deterministic(self):
+        assert compress_body(body=BODY, encoding=GZIP_ENCODING) == compress_body(
+            body=BODY, encoding=GZIP_ENCODING
+        )
+
+    def test_brotli_round_trip(self):
+        if brotli is None:
+            pytest.skip("brotli is not installed")
+
+        compressed = compress_body(body=BODY, encoding=BROTLI_ENCODING)
+
+        assert brotli.decompress(compressed) == BODY
+
+    def test_zstd_round_trip(self):
+        if zstandard is None:
+            pytest.skip("zstandard is not installed")
+
+        compressed = compress_body(body=BODY, encoding=ZSTD_ENCODING)
+
+        assert zstandard.ZstdDecompressor().decompress(compressed) == BODY
+
+    def test_records_ratio_and_duration(self):
+        with patch("app.presenters.compression.record_compression") as record:
+            compressed = compress_body(body=BODY, encoding=GZIP_ENCODING)
+
+        kwargs = record.call_args.kwargs
+        assert kwargs["encoding"] == "gzip"
+        assert kwargs["ratio"] == len(BODY) / len(compressed)
+        assert kwargs["duration_ms"] >= 0
+
+    def test_rejects_unknown_encoding(self):
+        with pytest.raises(ValueError):
+            compress_body(body=BODY, encoding="compress")
@@ -0,0 +1,46 @@
+import pytest
+
+from app.presenters.http_cache import etag_matches, prime_etag
+from app.presenters.prime_formats import (
+    BINARY_MEDIA_TYPE,
+    JSON_MEDIA_TYPE,
+    NDJSON_MEDIA_TYPE,
+)
+
+
+class TestPrimeEtag:
+    def test_is_strong_quoted_etag(self):
+        result = prime_etag(count=10, media_type=JSON_MEDIA_TYPE)
+
+        assert result == '"primes-v1-10-json"'
+
+    def test_differs_by_count_and_media_type(self):
+        etags = {
+            prime_etag(count=count, media_type=media_type)
+            for count in (10, 11)
+            for media_type in (JSON_MEDIA_TYPE, NDJSON_MEDIA_TYPE, BINARY_MEDIA_TYPE)
+        }
+
+        assert len(etags) == 6
+
+
+class TestEtagMatches:
+    etag = '"primes-v1-10-json"'
+
+    @pytest.mark.parametrize(
+        "if_none_match",
+        [
+            '"primes-v1-10-json"',
+            'W/"primes-v1-10-json"',
+            '"other", "primes-v1-10-json"',
+            "*",
+        ],
+    )
+    def test_matches(self, if_none_match):
+        assert etag_matches(if_none_match=if_none_match, etag=self.etag) is True
+
+    @pytest.mark.parametrize(
+        "if_none_match", [None, "", '"primes-v1-11-json"', "primes-v1-10-json"]
+    )
+    def test_does_not_match(self, if_none_match):
+        assert etag_matches(if_none_match=if_none_match, etag=self.etag) is False
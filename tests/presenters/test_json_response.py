@@ -0,0 +1,39 @@
+from unittest.mock import patch
+
+import pytest
+from fastapi.responses import JSONResponse
+
+from app.presenters.json_response import FastJSONResponse, dumps_json
+
+CONTENTS = [
+    {"count": 5, "primes": [2, 3, 5, 7, 11]},
+    {"error": {"code": "INVALID_INPUT"}},
+    {"user": {"name": "Zoë", "profile_pic_url": None}, "expires_in": 3600},
+    {"numbers": [4, 5], "results": [False, True]},
+]
+
+
+class TestDumpsJson:
+    @pytest.mark.parametrize("content", CONTENTS)
+    def test_matches_stdlib_json_response(self, content):
+        assert dumps_json(content=content) == JSONResponse(content=content).body
+
+    @pytest.mark.parametrize("content", CONTENTS)
+    def test_falls_back_without_orjson(self, content):
+        with patch("app.presenters.json_response.orjson", None):
+            body = dumps_json(content=content)
+
+        assert body == JSONResponse(content=content).body
+
+
+class TestFastJSONResponse:
+    def test_renders_body_and_headers(self):
+        response = FastJSONResponse(
+            content={"error": {"code": "INACTIVE_ACCOUNT"}}, status_code=403
+        )
+
+        assert isinstance(response, JSONResponse)
+        assert response.status_code == 403
+        assert response.media_type == "application/json"
+        assert response.body == b'{"error":{"code":"INACTIVE_ACCOUNT"}}'
+        assert response.headers["content-length"] == str(len(response.body))
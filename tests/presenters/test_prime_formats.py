@@ -0,0 +1,73 @@
+import struct
+from array import array
+
+import pytest
+
+from app.presenters.prime_formats import (
+    BINARY_MEDIA_TYPE,
+    JSON_MEDIA_TYPE,
+    NDJSON_MEDIA_TYPE,
+    negotiate_prime_media_type,
+    pack_primes,
+)
+
+
+class TestNegotiatePrimeMediaType:
+    @pytest.mark.parametrize("accept", [None, "", "*/*", "text/html"])
+    def test_defaults_to_json(self, accept):
+        assert negotiate_prime_media_type(accept=accept) == JSON_MEDIA_TYPE
+
+    def test_selects_ndjson(self):
+        result = negotiate_prime_media_type(accept="application/x-ndjson")
+
+        assert result == NDJSON_MEDIA_TYPE
+
+    def test_selects_binary(self):
+        result = negotiate_prime_media_type(accept="application/octet-stream")
+
+        assert result == BINARY_MEDIA_TYPE
+
+    def test_prefers_highest_quality(self):
+        accept = "application/json;q=0.5, application/octet-stream;q=0.9"
+
+        result = negotiate_prime_media_type(accept=accept)
+
+        assert result == BINARY_MEDIA_TYPE
+
+    def test_prefers_first_listed_on_equal_quality(self):
+        accept = "application/x-ndjson, application/json"
+
+        result = negotiate_prime_media_type(accept=accept)
+
+        assert result == NDJSON_MEDIA_TYPE
+
+    def test_ignores_zero_quality(self):
+        result = negotiate_prime_media_type(accept="application/x-ndjson;q=0")
+
+        assert result == JSON_MEDIA_TYPE
+
+
+class TestPackPrimes:
+    def test_packs_small_primes_as_uint32(self):
+        body, item_size = pack_primes(primes=[2, 3, 5])
+
+        assert item_size == 4
+        assert body == struct.pack("<3I", 2, 3, 5)
+
+    def test_packs_large_primes_as_uint64(self):
+        large_prime = 2**32 + 15
+
+        body, item_size = pack_primes(primes=[large_prime])
+
+        assert item_size == 8
+        assert body == struct.pack("<Q", large_prime)
+
+    def test_packs_array_and_memoryview(self):
+        primes = array("I", [2, 3, 5])
+        expected = struct.pack("<3I", 2, 3, 5)
+
+        assert pack_primes(primes=primes) == (expected, 4)
+        assert pack_primes(primes=memoryview(primes)) == (expected, 4)
+
+    def test_packs_empty_sequence(self):
+        assert pack_primes(primes=[]) == (b"", 4)
@@ -0,0 +1,426 @@
+import asyncio
+import gzip
+import json
+import struct
+from array import array
+from unittest.mock import patch
+
+import pytest
+from fastapi.responses import StreamingResponse
+
+from app.dtos import (
+    NthPrimeResultDTO,
+    PrimalityCheckResultDTO,
+    PrimeCountResultDTO,
+    PrimeNumbersResultDTO,
+    PrimePageResultDTO,
+    PrimeRangeResultDTO,
+)
+from app.presenters.compression import GZIP_ENCODING, compress_body
+from app.presenters.presenter_implementation import (
+    STREAM_CHUNK_SIZE,
+    PrimeNumbersPresenter,
+)
+from app.presenters.prime_formats import (
+    BINARY_MEDIA_TYPE,
+    JSON_MEDIA_TYPE,
+    NDJSON_MEDIA_TYPE,
+)
+from app.presenters.response_cache import ResponseBodyCache
+
+
+def read_streaming_body(response: StreamingResponse) -> bytes:
+    async def consume() -> bytes:
+        return b"".join([chunk async for chunk in response.body_iterator])
+
+    return asyncio.run(consume())
+
+
+@pytest.fixture
+def result():
+    return PrimeNumbersResultDTO(count=5, primes=array("I", [2, 3, 5, 7, 11]))
+
+
+class TestGetSuccessResponse:
+    def test_returns_json_response_by_default(self, result):
+        presenter = PrimeNumbersPresenter()
+
+        response = presenter.get_success_response(result=result)
+
+        assert response.media_type == "application/json"
+        assert response.status_code == 200
+        assert json.loads(response.body) == {"count": 5, "primes": [2, 3, 5, 7, 11]}
+
+    def test_streams_same_json_when_enabled(self, result):
+        presenter = PrimeNumbersPresenter(stream=True)
+
+        response = presenter.get_success_response(result=result)
+
+        assert isinstance(response, StreamingResponse)
+        assert response.status_code == 200
+        assert response.media_type == "application/json"
+        assert json.loads(read_streaming_body(response)) == {
+            "count": 5,
+            "primes": [2, 3, 5, 7, 11],
+        }
+
+    def test_streams_large_results_in_chunks(self):
+        primes = list(range(2 * STREAM_CHUNK_SIZE + 1))
+        presenter = PrimeNumbersPresenter(stream=True)
+
+        chunks = list(
+            presenter._iter_json_chunks(fields={"count": len(primes)}, primes=primes)
+        )
+
+        assert len(chunks) == 5
+        assert json.loads(b"".join(chunks))["primes"] == primes
+
+    def test_streams_memoryview_results(self):
+        primes = memoryview(array("I", [2, 3, 5]))
+        result = PrimeNumbersResultDTO(count=3, primes=primes)
+        presenter = PrimeNumbersPresenter(stream=True)
+
+        body = read_streaming_body(presenter.get_success_response(result=result))
+
+        assert json.loads(body) == {"count": 3, "primes": [2, 3, 5]}
+
+    def test_streams_ndjson_one_prime_per_line(self, result):
+        presenter = PrimeNumbersPresenter(media_type=NDJSON_MEDIA_TYPE)
+
+        response = presenter.get_success_response(result=result)
+
+        assert isinstance(response, StreamingResponse)
+        assert response.media_type == NDJSON_MEDIA_TYPE
+        assert response.headers["X-Prime-Count"] == "5"
+        assert read_streaming_body(response) == b"2\n3\n5\n7\n11\n"
+
+    def test_returns_packed_binary(self, result):
+        presenter = PrimeNumbersPresenter(media_type=BINARY_MEDIA_TYPE)
+
+        response = presenter.get_success_response(result=result)
+
+        assert response.status_code == 200
+        assert response.media_type == BINARY_MEDIA_TYPE
+        assert response.headers["X-Prime-Count"] == "5"
+        assert response.headers["X-Prime-Item-Size"] == "4"
+        assert response.body == struct.pack("<5I", 2, 3, 5, 7, 11)
+
+
+class TestHttpCaching:
+    def test_success_response_is_cacheable(self, result):
+        response = PrimeNumbersPresenter().get_success_response(result=result)
+
+        assert response.headers["etag"] == '"primes-v1-5-json"'
+        assert response.headers["cache-control"] == (
+            "public, max-age=31536000, immutable"
+        )
+        assert response.headers["vary"] == "Accept, Accept-Encoding"
+
+    @pytest.mark.parametrize("stream", [False, True])
+    def test_etag_depends_on_media_type_not_streaming(self, result, stream):
+        json_response = PrimeNumbersPresenter(stream=stream).get_success_response(
+            result=result
+        )
+        binary_response = PrimeNumbersPresenter(
+            media_type=BINARY_MEDIA_TYPE, stream=stream
+        ).get_success_response(result=result)
+
+        assert json_response.headers["etag"] == '"primes-v1-5-json"'
+        assert binary_response.headers["etag"] == '"primes-v1-5-octet-stream"'
+
+    def test_is_not_modified_when_etag_matches(self):
+        presenter = PrimeNumbersPresenter(if_none_match='"primes-v1-5-json"')
+
+        assert presenter.is_not_modified(count=5) is True
+        assert presenter.is_not_modified(count=6) is False
+
+    def test_is_modified_without_if_none_match(self):
+        assert PrimeNumbersPresenter().is_not_modified(count=5) is False
+
+    def test_not_modified_response_has_no_body(self):
+        response = PrimeNumbersPresenter().get_not_modified_response(count=5)
+
+        assert response.status_code == 304
+        assert response.body == b""
+        assert response.headers["etag"] == '"primes-v1-5-json"'
+        assert response.headers["vary"] == "Accept, Accept-Encoding"
+
+
+class TestResponseBodyCaching:
+    @pytest.fixture
+    def response_cache(self):
+        return ResponseBodyCache(max_bytes=1 << 20)
+
+    def test_without_cache_returns_no_cached_response(self):
+        assert PrimeNumbersPresenter().get_cached_success_response(count=5) is None
+
+    def test_miss_before_first_success_response(self, response_cache):
+        presenter = PrimeNumbersPresenter(response_cache=response_cache)
+
+        assert presenter.get_cached_success_response(count=5) is None
+
+    @pytest.mark.parametrize("media_type", [JSON_MEDIA_TYPE, BINARY_MEDIA_TYPE])
+    def test_serves_encoded_body_after_success_response(
+        self, result, response_cache, media_type
+    ):
+        presenter = PrimeNumbersPresenter(
+            media_type=media_type, response_cache=response_cache
+        )
+        response = presenter.get_success_response(result=result)
+
+        cached_response = presenter.get_cached_success_response(count=5)
+
+        assert cached_response.status_code == 200
+        assert cached_response.body == response.body
+        assert cached_response.media_type == media_type
+        assert dict(cached_response.headers) == dict(response.headers)
+
+    def test_json_body_matches_json_response(self, result, response_cache):
+        cached = PrimeNumbersPresenter(response_cache=response_cache)
+
+        response = cached.get_success_response(result=result)
+
+        assert (
+            response.body
+            == PrimeNumbersPresenter().get_success_response(result=result).body
+        )
+
+    def test_keys_by_media_type(self, result, response_cache):
+        PrimeNumbersPresenter(response_cache=response_cache).get_success_response(
+            result=result
+        )
+        presenter = PrimeNumbersPresenter(
+            media_type=BINARY_MEDIA_TYPE, response_cache=response_cache
+        )
+
+        assert presenter.get_cached_success_response(count=5) is None
+
+    @pytest.mark.parametrize(
+        "media_type, stream", [(NDJSON_MEDIA_TYPE, False), (JSON_MEDIA_TYPE, True)]
+    )
+    def test_streamed_responses_bypass_cache(
+        self, result, response_cache, media_type, stream
+    ):
+        presenter = PrimeNumbersPresenter(
+            media_type=media_type, stream=stream, response_cache=response_cache
+        )
+
+        response = presenter.get_success_response(result=result)
+
+        assert isinstance(response, StreamingResponse)
+        assert presenter.get_cached_success_response(count=5) is None
+        assert len(response_cache) == 0
+
+
+class TestCompression:
+    @pytest.fixture
+    def large_result(self):
+        return PrimeNumbersResultDTO(count=1000, primes=array("I", range(1000)))
+
+    def test_compresses_bodies_over_threshold(self, large_result):
+        presenter = PrimeNumbersPresenter(content_encoding=GZIP_ENCODING)
+
+        response = presenter.get_success_response(result=large_result)
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["etag"] == 'W/"primes-v1-1000-json"'
+        assert json.loads(gzip.decompress(response.body)) == {
+            "count": 1000,
+            "primes": list(range(1000)),
+        }
+
+    def test_leaves_small_bodies_uncompressed(self, result):
+        presenter = PrimeNumbersPresenter(content_encoding=GZIP_ENCODING)
+
+        response = presenter.get_success_response(result=result)
+
+        assert "content-encoding" not in response.headers
+        assert response.headers["etag"] == 'W/"primes-v1-5-json"'
+        assert json.loads(response.body)["primes"] == [2, 3, 5, 7, 11]
+
+    def test_not_modified_etag_matches_compressed_response(self, large_result):
+        presenter = PrimeNumbersPresenter(content_encoding=GZIP_ENCODING)
+
+        response = presenter.get_success_response(result=large_result)
+        not_modified = presenter.get_not_modified_response(count=1000)
+
+        assert not_modified.status_code == 304
+        assert not_modified.headers["etag"] == response.headers["etag"]
+        assert not_modified.headers["etag"] == 'W/"primes-v1-1000-json"'
+
+    def test_identity_etag_stays_strong(self, large_result):
+        presenter = PrimeNumbersPresenter()
+
+        response = presenter.get_success_response(result=large_result)
+        not_modified = presenter.get_not_modified_response(count=1000)
+
+        assert response.headers["etag"] == '"primes-v1-1000-json"'
+        assert not_modified.headers["etag"] == '"primes-v1-1000-json"'
+
+    def test_identity_is_not_compressed(self, large_result):
+        response = PrimeNumbersPresenter().get_success_response(result=large_result)
+
+        assert "content-encoding" not in response.headers
+        assert json.loads(response.body)["count"] == 1000
+
+    def test_streamed_responses_are_not_compressed(self, large_result):
+        presenter = PrimeNumbersPresenter(stream=True, content_encoding=GZIP_ENCODING)
+
+        response = presenter.get_success_response(result=large_result)
+
+        assert isinstance(response, StreamingResponse)
+        assert "content-encoding" not in response.headers
+
+    def test_caches_compressed_body_once(self, large_result):
+        response_cache = ResponseBodyCache(max_bytes=1 << 20)
+        presenter = PrimeNumbersPresenter(
+            response_cache=response_cache, content_encoding=GZIP_ENCODING
+        )
+
+        with patch(
+            "app.presenters.presenter_implementation.compress_body",
+            wraps=compress_body,
+        ) as compress:
+            response = presenter.get_success_response(result=large_result)
+            cached_response = presenter.get_cached_success_response(count=1000)
+
+        compress.assert_called_once()
+        assert cached_response.body == response.body
+        assert cached_response.headers["content-encoding"] == "gzip"
+        assert (
+            PrimeNumbersPresenter(
+                response_cache=response_cache
+            ).get_cached_success_response(count=1000)
+            is None
+        )
+
+    def test_compresses_check_response(self):
+        numbers = list(range(200))
+        result = PrimalityCheckResultDTO(
+            numbers=numbers, results=[False] * len(numbers)
+        )
+        presenter = PrimeNumbersPresenter(content_encoding=GZIP_ENCODING)
+
+        response = presenter.get_check_success_response(result=result)
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert len(json.loads(gzip.decompress(response.body))["results"]) == 200
+
+
+class TestGetRangeSuccessResponse:
+    @pytest.fixture
+    def range_result(self):
+        return PrimeRangeResultDTO(
+            lo=100, hi=120, count=5, primes=array("I", [101, 103, 107, 109, 113])
+        )
+
+    def test_returns_window_and_primes(self, range_result):
+        presenter = PrimeNumbersPresenter()
+
+        response = presenter.get_range_success_response(result=range_result)
+
+        assert response.status_code == 200
+        assert json.loads(response.body) == {
+            "lo": 100,
+            "hi": 120,
+            "count": 5,
+            "primes": [101, 103, 107, 109, 113],
+        }
+
+    def test_streams_same_json_when_enabled(self, range_result):
+        presenter = PrimeNumbersPresenter(stream=True)
+
+        response = presenter.get_range_success_response(result=range_result)
+
+        assert json.loads(read_streaming_body(response)) == {
+            "lo": 100,
+            "hi": 120,
+            "count": 5,
+            "primes": [101, 103, 107, 109, 113],
+        }
+
+    def test_returns_packed_binary(self, range_result):
+        presenter = PrimeNumbersPresenter(media_type=BINARY_MEDIA_TYPE)
+
+        response = presenter.get_range_success_response(result=range_result)
+
+        assert response.headers["X-Prime-Count"] == "5"
+        assert response.body == struct.pack("<5I", 101, 103, 107, 109, 113)
+
+
+class TestGetCheckSuccessResponse:
+    def test_returns_result_per_number(self):
+        result = PrimalityCheckResultDTO(numbers=[4, 5], results=[False, True])
+        presenter = PrimeNumbersPresenter()
+
+        response = presenter.get_check_success_response(result=result)
+
+        assert response.status_code == 200
+        assert json.loads(response.body) == {
+            "count": 2,
+            "results": [
+                {"number": 4, "is_prime": False},
+                {"number": 5, "is_prime": True},
+            ],
+        }
+
+
+class TestGetPageSuccessResponse:
+    def test_returns_offset_primes_and_cursor(self):
+        result = PrimePageResultDTO(
+            offset=4, primes=array("I", [11, 13, 17]), next_cursor="NzoxOA"
+        )
+
+        response = PrimeNumbersPresenter().get_page_success_response(result=result)
+
+        assert response.status_code == 200
+        assert response.media_type == "application/json"
+        assert json.loads(response.body) == {
+            "offset": 4,
+            "count": 3,
+            "primes": [11, 13, 17],
+            "next_cursor": "NzoxOA",
+        }
+
+
+class TestGetNthPrimeSuccessResponse:
+    def test_returns_index_and_prime(self):
+        result = NthPrimeResultDTO(n=6, prime=13)
+
+        response = PrimeNumbersPresenter().get_nth_prime_success_response(result=result)
+
+        assert response.status_code == 200
+        assert json.loads(response.body) == {"n": 6, "prime": 13}
+
+
+class TestGetPrimeCountSuccessResponse:
+    def test_returns_bound_and_count(self):
+        result = PrimeCountResultDTO(x=100, count=25)
+
+        response = PrimeNumbersPresenter().get_prime_count_success_response(
+            result=result
+        )
+
+        assert response.status_code == 200
+        assert json.loads(response.body) == {"x": 100, "count": 25}
+
+
+class TestGetInvalidInputResponse:
+    def test_returns_invalid_input_error(self):
+        presenter = PrimeNumbersPresenter()
+
+        response = presenter.get_invalid_input_response(message="")
+
+        assert response.status_code == 400
+        assert json.loads(response.body) == {"error": {"code": "INVALID_INPUT"}}
+
+
+class TestGetTimeoutResponse:
+    def test_returns_service_unavailable(self):
+        response = PrimeNumbersPresenter().get_timeout_response()
+
+        assert response.status_code == 503
+        assert json.loads(response.body) == {
+            "error": {"code": "PRIME_COMPUTATION_TIMEOUT"}
+        }
@@ -0,0 +1,66 @@
+from unittest.mock import patch
+
+import pytest
+
+from app.presenters.response_cache import CachedResponseBody, ResponseBodyCache
+
+
+def entry(size):
+    return CachedResponseBody(body=b"x" * size, headers={})
+
+
+@pytest.fixture
+def cache():
+    return ResponseBodyCache(max_bytes=100)
+
+
+class TestResponseBodyCache:
+    def test_returns_stored_entry(self, cache):
+        stored = entry(size=10)
+        cache.put(key=(10, "application/json", "identity"), entry=stored)
+
+        result = cache.get(key=(10, "application/json", "identity"))
+
+        assert result is stored
+
+    def test_returns_none_for_missing_key(self, cache):
+        assert cache.get(key=(10, "application/json", "identity")) is None
+
+    def test_evicts_least_recently_used_by_total_bytes(self, cache):
+        cache.put(key=(1, "json", "identity"), entry=entry(size=40))
+        cache.put(key=(2, "json", "identity"), entry=entry(size=40))
+        cache.get(key=(1, "json", "identity"))
+
+        cache.put(key=(3, "json", "identity"), entry=entry(size=40))
+
+        assert cache.get(key=(1, "json", "identity")) is not None
+        assert cache.get(key=(2, "json", "identity")) is None
+        assert cache.get(key=(3, "json", "identity")) is not None
+        assert cache.size == 80
+
+    def test_replacing_entry_updates_size(self, cache):
+        cache.put(key=(1, "json", "identity"), entry=entry(size=40))
+        cache.put(key=(1, "json", "identity"), entry=entry(size=10))
+
+        assert cache.size == 10
+        assert len(cache) == 1
+
+    def test_skips_entries_larger_than_capacity(self, cache):
+        cache.put(key=(1, "json", "identity"), entry=entry(size=101))
+
+        assert len(cache) == 0
+        assert cache.size == 0
+
+    def test_records_hits_and_misses(self, cache):
+        cache.put(key=(1, "json", "identity"), entry=entry(size=10))
+
+        with patch(
+            "app.presenters.response_cache.record_response_cache_lookup"
+        ) as mock_record:
+            cache.get(key=(1, "json", "identity"))
+            cache.get(key=(2, "json", "identity"))
+
+        assert [call.kwargs["hit"] for call in mock_record.call_args_list] == [
+            True,
+            False,
+        ]
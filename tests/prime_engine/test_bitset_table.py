@@ -0,0 +1,133 @@
+import sys
+from array import array
+from bisect import bisect_right
+
+import pytest
+
+from app.prime_engine import bitset_table
+from app.prime_engine.bitset_table import BitsetPrimeTable
+from app.prime_engine.engine_implementation import SievePrimeEngine, TablePrimeEngine
+from app.prime_engine.numpy_sieve import NUMPY_AVAILABLE
+from app.prime_engine.sieve import first_n_primes, sieve_of_eratosthenes
+
+
+@pytest.fixture(scope="module")
+def primes():
+    return sieve_of_eratosthenes(limit=20000)
+
+
+@pytest.fixture(params=["python", "numpy"])
+def decoder(request, monkeypatch):
+    if request.param == "numpy" and not NUMPY_AVAILABLE:
+        pytest.skip("numpy is not installed")
+    monkeypatch.setattr(
+        bitset_table, "NUMPY_AVAILABLE", request.param == "numpy" and NUMPY_AVAILABLE
+    )
+    return request.param
+
+
+@pytest.fixture
+def table():
+    return BitsetPrimeTable(capacity=2000, sieve_engine=SievePrimeEngine())
+
+
+class TestBitsetPrimeTable:
+    def test_is_built_lazily(self, table):
+        assert table.is_loaded is False
+
+        table.contains(n=7)
+
+        assert table.is_loaded is True
+
+    def test_stores_one_byte_per_thirty_integers(self, table):
+        bits = table.load()
+
+        assert isinstance(bits, bytes)
+        assert len(bits) * 30 >= table.nth(n=1000)
+        assert len(bits) < 1000 * 36 // 10
+
+    def test_first_returns_prefix(self, table, decoder):
+        assert list(table.first(count=10)) == [2, 3, 5, 7, 11, 13, 17, 19, 23, 29]
+        assert list(table.first(count=1)) == [2]
+
+    def test_first_matches_sieve(self, table, decoder):
+        for count in (3, 4, 999, 1000, 1001, 2000):
+            assert list(table.first(count=count)) == list(first_n_primes(count=count))
+
+    def test_page_matches_sieve(self, table, decoder, primes):
+        for offset in (0, 1, 2, 3, 4, 500, 1990):
+            assert list(table.page(offset=offset, count=10)) == (
+                primes[offset : offset + 10]
+            )
+
+    def test_first_rejects_count_above_capacity(self, table):
+        with pytest.raises(ValueError):
+            table.first(count=table.capacity + 1)
+
+    def test_contains_matches_sieve_within_table(self, table, primes):
+        prime_set = set(primes)
+        largest = table.nth(n=1000)
+
+        for n in range(-1, largest + 1):
+            assert table.contains(n=n) is (n in prime_set)
+        assert table.contains(n=largest + 2) is False
+
+    def test_covers_numbers_up_to_largest_prime(self, table):
+        largest = table.nth(n=1000)
+
+        assert table.covers(n=largest) is True
+
+    def test_nth_matches_sieve(self, table, primes):
+        for n in range(1, 2001):
+            assert table.nth(n=n) == primes[n - 1]
+
+    def test_count_up_to_matches_bisect(self, table, primes):
+        table.first(count=2000)
+
+        for limit in range(0, primes[1999] + 1):
+            assert table.count_up_to(limit=limit) == bisect_right(primes, limit)
+
+    def test_primes_up_to_returns_covered_prefix(self, table, decoder, primes):
+        result = table.primes_up_to(limit=1000)
+
+        assert isinstance(result, array)
+        assert list(result) == [p for p in primes if p <= 1000]
+
+    def test_primes_up_to_returns_none_beyond_table(self, table):
+        assert table.primes_up_to(limit=10**9) is None
+
+    def test_growth_keeps_published_bits(self, table):
+        before = table.load()
+
+        table.first(count=2000)
+
+        assert table.load() is not before
+        assert table.load()[: len(before) - 1] == before[:-1]
+
+    def test_uses_far_less_memory_than_int_list(self):
+        count = 100000
+        table = BitsetPrimeTable(
+            capacity=count, sieve_engine=SievePrimeEngine(), initial_count=count
+        )
+        primes = list(first_n_primes(count=count))
+        list_size = sys.getsizeof(primes) + sum(map(sys.getsizeof, primes))
+
+        assert sys.getsizeof(table.load()) * 10 < list_size
+
+
+class TestTablePrimeEngineWithBitset:
+    def test_answers_from_bitset(self, table):
+        engine = TablePrimeEngine(table=table, fallback_engine=SievePrimeEngine())
+
+        assert list(engine.first_n_primes(count=5)) == [2, 3, 5, 7, 11]
+        assert engine.are_primes(numbers=[1, 2, 91, 97, 10**12 + 39]) == [
+            False,
+            True,
+            False,
+            True,
+            True,
+        ]
+        assert engine.nth_prime(n=2000) == 17389
+        assert list(engine.primes_from(lo=17387, count=2)) == [17387, 17389]
+        assert engine.prime_count(x=100) == 25
+        assert engine.prime_count(x=10**6) == 78498
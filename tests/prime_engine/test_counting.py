@@ -0,0 +1,115 @@
+from bisect import bisect_right
+
+import pytest
+
+from app.prime_engine import counting
+from app.prime_engine.counting import (
+    estimate_nth_prime,
+    nth_prime,
+    prime_count,
+    primes_from,
+)
+from app.prime_engine.sieve import first_n_primes, sieve_of_eratosthenes
+
+
+@pytest.fixture(scope="module")
+def primes():
+    return sieve_of_eratosthenes(limit=200000)
+
+
+class TestPrimeCount:
+    def test_matches_sieve_for_small_x(self, primes):
+        for x in range(0, 3000):
+            assert prime_count(x=x) == bisect_right(primes, x)
+
+    @pytest.mark.parametrize(
+        "x, expected",
+        [(10**6, 78498), (10**7, 664579), (10**8, 5761455), (10**9, 50847534)],
+    )
+    def test_known_values(self, x, expected):
+        assert prime_count(x=x) == expected
+
+    def test_accepts_precomputed_base_primes(self, primes):
+        assert prime_count(x=10**8, base_primes=primes) == 5761455
+
+
+class TestEstimateNthPrime:
+    @pytest.mark.parametrize("n, expected", [(1, 2), (2, 3), (5, 11)])
+    def test_exact_for_first_primes(self, n, expected):
+        assert estimate_nth_prime(n=n) == expected
+
+    def test_is_within_one_percent_for_large_n(self):
+        millionth_prime = 15485863
+
+        result = estimate_nth_prime(n=10**6)
+
+        assert abs(result - millionth_prime) / millionth_prime < 0.01
+
+
+class TestNthPrime:
+    def test_matches_sieve_for_small_n(self):
+        expected = first_n_primes(count=3000)
+
+        for n in range(1, 3001):
+            assert nth_prime(n=n) == expected[n - 1]
+
+    @pytest.mark.parametrize(
+        "n, expected",
+        [(10**6, 15485863), (10**7, 179424673), (10**8, 2038074743)],
+    )
+    def test_known_values(self, n, expected):
+        assert nth_prime(n=n) == expected
+
+    def test_rejects_non_positive_n(self):
+        with pytest.raises(ValueError):
+            nth_prime(n=0)
+
+
+class TestPrimesFrom:
+    @pytest.mark.parametrize("lo", [0, 2, 3, 4, 1000, 7919, 100000])
+    def test_matches_sieve(self, primes, lo):
+        start = bisect_right(primes, lo - 1)
+
+        result = primes_from(lo=lo, count=500)
+
+        assert result == primes[start : start + 500]
+
+    def test_includes_lo_when_prime(self):
+        assert primes_from(lo=7919, count=2) == [7919, 7927]
+
+    def test_sieves_near_lo_only(self):
+        result = primes_from(lo=10**12, count=3)
+
+        assert result == [10**12 + 39, 10**12 + 61, 10**12 + 63]
+
+    def test_keeps_sieving_when_first_window_falls_short(self, monkeypatch):
+        monkeypatch.setattr(counting, "PAGE_WINDOW_MARGIN", 0)
+
+        # 1328..1360 are all composite.
+        result = primes_from(lo=1328, count=1)
+
+        assert result == [1361]
+
+    def test_accepts_precomputed_base_primes(self, primes):
+        assert primes_from(lo=10**9, count=2, base_primes=primes) == [
+            1000000007,
+            1000000009,
+        ]
+
+    def test_returns_empty_list_for_zero_count(self):
+        assert primes_from(lo=100, count=0) == []
+
+    def test_stops_at_uint64_limit(self):
+        top = 2**64 - 59  # the largest prime below 2^64
+        windows = []
+
+        def sieve_range(lo, hi, base_primes):
+            windows.append((lo, hi))
+            return [top] if lo <= top < hi else []
+
+        result = primes_from(
+            lo=top - 10, count=5, base_primes=[2, 1 << 32], sieve_range=sieve_range
+        )
+
+        assert result == [top]
+        assert windows[-1][1] == 2**64
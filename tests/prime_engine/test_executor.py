@@ -0,0 +1,82 @@
+import pytest
+
+from app.exceptions import PrimeComputationTimeoutException
+from app.prime_engine import SievePrimeEngine
+from app.prime_engine.executor import (
+    get_prime_executor,
+    run_parallel_first_n_primes,
+    run_prime_engine,
+    shutdown_prime_executor,
+    start_prime_executor,
+)
+from app.prime_engine.sieve import first_n_primes
+
+
+@pytest.fixture
+def prime_executor():
+    executor = start_prime_executor(max_workers=1)
+    yield executor
+    shutdown_prime_executor()
+
+
+class TestStartPrimeExecutor:
+    def test_zero_workers_disables_pool(self):
+        assert start_prime_executor(max_workers=0) is None
+        assert get_prime_executor() is None
+
+    def test_returns_running_pool(self, prime_executor):
+        assert prime_executor is not None
+        assert get_prime_executor() is prime_executor
+        assert start_prime_executor(max_workers=1) is prime_executor
+
+    def test_shutdown_clears_pool(self, prime_executor):
+        shutdown_prime_executor()
+
+        assert get_prime_executor() is None
+
+
+class TestRunPrimeEngine:
+    @pytest.mark.asyncio
+    async def test_runs_inline_without_pool(self):
+        result = await run_prime_engine(SievePrimeEngine(), "first_n_primes", count=5)
+
+        assert list(result) == [2, 3, 5, 7, 11]
+
+    @pytest.mark.asyncio
+    async def test_runs_on_worker_engine(self, prime_executor):
+        primes = await run_prime_engine(SievePrimeEngine(), "first_n_primes", count=5)
+        results = await run_prime_engine(
+            SievePrimeEngine(), "are_primes", numbers=[1, 2, 9, 97]
+        )
+
+        assert list(primes) == [2, 3, 5, 7, 11]
+        assert results == [False, True, False, True]
+
+    @pytest.mark.asyncio
+    async def test_raises_on_timeout(self, prime_executor):
+        with pytest.raises(PrimeComputationTimeoutException):
+            await run_prime_engine(
+                SievePrimeEngine(), "prime_count", timeout=0, x=10**9
+            )
+
+
+class TestRunParallelFirstNPrimes:
+    @pytest.mark.asyncio
+    async def test_runs_inline_without_pool(self):
+        result = await run_parallel_first_n_primes(SievePrimeEngine(), count=5)
+
+        assert list(result) == [2, 3, 5, 7, 11]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("count", [1, 2, 100, 12345])
+    async def test_matches_serial_sieve(self, prime_executor, count):
+        result = await run_parallel_first_n_primes(SievePrimeEngine(), count=count)
+
+        assert result == first_n_primes(count=count)
+
+    @pytest.mark.asyncio
+    async def test_raises_on_timeout(self, prime_executor):
+        with pytest.raises(PrimeComputationTimeoutException):
+            await run_parallel_first_n_primes(
+                SievePrimeEngine(), count=10**6, timeout=0
+            )
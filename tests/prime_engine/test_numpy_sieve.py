@@ -0,0 +1,115 @@
+import pytest
+
+from app.prime_engine import factory
+from app.prime_engine.counting import prime_count
+from app.prime_engine.engine_implementation import (
+    NumpySievePrimeEngine,
+    SievePrimeEngine,
+)
+from app.prime_engine.numpy_sieve import (
+    NUMPY_AVAILABLE,
+    numpy_first_n_primes,
+    numpy_prime_count,
+    numpy_primes_in_range,
+    numpy_primes_up_to,
+)
+from app.prime_engine.sieve import sieve_of_eratosthenes
+
+requires_numpy = pytest.mark.skipif(not NUMPY_AVAILABLE, reason="numpy not installed")
+
+
+@requires_numpy
+class TestNumpyPrimesUpTo:
+    @pytest.mark.parametrize("limit", [0, 1, 2, 5, 6, 7, 30, 31, 49, 961, 10007])
+    def test_matches_pure_python_sieve(self, limit):
+        expected = sieve_of_eratosthenes(limit=limit)
+
+        result = numpy_primes_up_to(limit=limit)
+
+        assert result.tolist() == expected
+
+    def test_crosses_off_squares_of_wheel_residues(self):
+        result = numpy_primes_up_to(limit=1000).tolist()
+
+        assert 49 not in result
+        assert 121 not in result
+        assert 169 not in result
+        assert 961 not in result
+
+
+@requires_numpy
+class TestNumpyFirstNPrimes:
+    def test_matches_pure_python_engine(self):
+        expected = list(SievePrimeEngine().first_n_primes(count=10000))
+
+        result = numpy_first_n_primes(count=10000)
+
+        assert list(result) == expected
+
+    def test_returns_python_int_array(self):
+        result = numpy_first_n_primes(count=5)
+
+        assert result.typecode == "I"
+        assert all(type(p) is int for p in result)
+
+
+@requires_numpy
+class TestNumpyPrimesInRange:
+    @pytest.mark.parametrize(
+        "lo, hi", [(0, 1), (0, 3), (2, 3), (0, 1000), (500, 1500), (7919, 7920)]
+    )
+    def test_matches_pure_python_sieve(self, lo, hi):
+        expected = [p for p in sieve_of_eratosthenes(limit=hi) if lo <= p < hi]
+
+        result = numpy_primes_in_range(lo=lo, hi=hi)
+
+        assert list(result) == expected
+
+    def test_matches_pure_python_far_from_zero(self):
+        lo = 10**12
+
+        result = numpy_primes_in_range(lo=lo, hi=lo + 10000)
+
+        assert list(result) == list(
+            SievePrimeEngine().primes_in_range(lo=lo, hi=lo + 10000)
+        )
+
+
+@requires_numpy
+class TestNumpyPrimeCount:
+    def test_matches_pure_python_for_small_x(self):
+        for x in range(0, 2000):
+            assert numpy_prime_count(x=x) == prime_count(x=x)
+
+    def test_known_value(self):
+        assert numpy_prime_count(x=10**10) == 455052511
+
+    def test_engine_finds_nth_prime(self):
+        assert NumpySievePrimeEngine().nth_prime(n=10**7) == 179424673
+
+    def test_engine_finds_primes_from(self):
+        result = NumpySievePrimeEngine().primes_from(lo=10**9, count=1000)
+
+        assert list(result) == list(
+            SievePrimeEngine().primes_from(lo=10**9, count=1000)
+        )
+
+
+class TestGetSieveEngine:
+    @requires_numpy
+    def test_selects_numpy_backend(self):
+        result = factory.get_sieve_engine(backend="numpy")
+
+        assert isinstance(result, NumpySievePrimeEngine)
+
+    def test_selects_python_backend(self):
+        result = factory.get_sieve_engine(backend="python")
+
+        assert isinstance(result, SievePrimeEngine)
+
+    def test_falls_back_when_numpy_missing(self, monkeypatch):
+        monkeypatch.setattr(factory, "NUMPY_AVAILABLE", False)
+
+        result = factory.get_sieve_engine(backend="numpy")
+
+        assert isinstance(result, SievePrimeEngine)
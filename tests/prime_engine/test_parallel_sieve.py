@@ -0,0 +1,87 @@
+from array import array
+from concurrent.futures import Future
+from multiprocessing import shared_memory
+
+import pytest
+
+from app.prime_engine.parallel_sieve import (
+    discard_segment_future,
+    read_shared_segments,
+    split_range,
+    write_shared_segment,
+)
+
+
+def segment_exists(name):
+    try:
+        block = shared_memory.SharedMemory(name=name)
+    except FileNotFoundError:
+        return False
+    block.close()
+    return True
+
+
+class TestSplitRange:
+    def test_covers_range_in_order(self):
+        result = split_range(lo=0, hi=10, parts=3)
+
+        assert result == [(0, 4), (4, 8), (8, 10)]
+
+    def test_more_parts_than_numbers(self):
+        result = split_range(lo=5, hi=7, parts=8)
+
+        assert result == [(5, 6), (6, 7)]
+
+    def test_empty_range(self):
+        assert split_range(lo=3, hi=3, parts=4) == []
+
+
+class TestSharedSegments:
+    def test_round_trip_concatenates_in_order(self):
+        segments = [
+            write_shared_segment(primes=array("I", [2, 3, 5, 7]), typecode="I"),
+            write_shared_segment(primes=[], typecode="I"),
+            write_shared_segment(primes=[11, 13, 17], typecode="I"),
+        ]
+
+        result = read_shared_segments(segments=segments, count=6)
+
+        assert result == array("I", [2, 3, 5, 7, 11, 13])
+        assert not any(segment_exists(name) for name, _, _ in segments if name)
+
+    def test_converts_to_requested_typecode(self):
+        segment = write_shared_segment(primes=array("I", [2, 3]), typecode="Q")
+
+        result = read_shared_segments(segments=[segment], count=2)
+
+        assert result == array("Q", [2, 3])
+
+    def test_unlinks_segments_past_count(self):
+        segments = [
+            write_shared_segment(primes=[2, 3], typecode="I"),
+            write_shared_segment(primes=[5, 7], typecode="I"),
+        ]
+
+        result = read_shared_segments(segments=segments, count=2)
+
+        assert list(result) == [2, 3]
+        assert not segment_exists(segments[1][0])
+
+    def test_discard_segment_future_unlinks_result(self):
+        segment = write_shared_segment(primes=[2, 3], typecode="I")
+        future = Future()
+        future.set_result(segment)
+
+        discard_segment_future(future=future)
+
+        assert not segment_exists(segment[0])
+
+    @pytest.mark.parametrize("outcome", ["cancelled", "failed"])
+    def test_discard_segment_future_ignores_unfinished_work(self, outcome):
+        future = Future()
+        if outcome == "cancelled":
+            future.cancel()
+        else:
+            future.set_exception(RuntimeError())
+
+        discard_segment_future(future=future)
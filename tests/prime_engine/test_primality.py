@@ -0,0 +1,47 @@
+import pytest
+
+from app.prime_engine.primality import is_prime
+from app.prime_engine.sieve import sieve_of_eratosthenes
+
+
+class TestIsPrime:
+    def test_matches_sieve_below_one_hundred_thousand(self):
+        limit = 100000
+        expected = set(sieve_of_eratosthenes(limit=limit))
+
+        for n in range(limit + 1):
+            assert is_prime(n=n) is (n in expected)
+
+    @pytest.mark.parametrize("n", [-7, -1, 0, 1])
+    def test_rejects_numbers_below_two(self, n):
+        assert is_prime(n=n) is False
+
+    @pytest.mark.parametrize(
+        "n",
+        [
+            2**31 - 1,
+            2**61 - 1,
+            1000000000039,
+            18446744073709551557,
+        ],
+    )
+    def test_accepts_large_primes(self, n):
+        assert is_prime(n=n) is True
+
+    @pytest.mark.parametrize(
+        "n",
+        [
+            2047,
+            3215031751,
+            2152302898747,
+            3474749660383,
+            341550071728321,
+            3825123056546413051,
+            18446744073709551615,
+        ],
+    )
+    def test_rejects_strong_pseudoprimes_and_composites(self, n):
+        assert is_prime(n=n) is False
+
+    def test_rejects_square_of_large_prime(self):
+        assert is_prime(n=4294967291**2) is False
@@ -0,0 +1,299 @@
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import create_autospec
+
+import pytest
+
+from app.interactos.prime_engine_interface import IPrimeEngine
+from app.prime_engine.engine_implementation import SievePrimeEngine, TablePrimeEngine
+from app.prime_engine.prime_table import PrimeTable
+from app.prime_engine.sieve import first_n_primes
+
+
+@pytest.fixture
+def table():
+    return PrimeTable(capacity=100, sieve_engine=SievePrimeEngine(), initial_count=100)
+
+
+@pytest.fixture
+def growable_table():
+    return PrimeTable(capacity=5000, sieve_engine=SievePrimeEngine(), initial_count=10)
+
+
+@pytest.fixture
+def mock_fallback_engine():
+    return create_autospec(spec=IPrimeEngine, instance=True)
+
+
+@pytest.fixture
+def table_engine(table, mock_fallback_engine):
+    return TablePrimeEngine(table=table, fallback_engine=mock_fallback_engine)
+
+
+class TestPrimeTable:
+    def test_is_built_lazily(self, table):
+        assert table.is_loaded is False
+
+        table.first(count=1)
+
+        assert table.is_loaded is True
+
+    def test_load_builds_table_once(self, table):
+        first_load = table.load()
+        second_load = table.load()
+
+        assert first_load is second_load
+
+    def test_stores_primes_in_compact_array(self, table):
+        primes = table.load()
+
+        assert isinstance(primes, array)
+        assert len(primes) == table.capacity
+        assert primes[-1] == 541
+
+    def test_first_returns_prefix(self, table):
+        result = table.first(count=5)
+
+        assert isinstance(result, array)
+        assert list(result) == [2, 3, 5, 7, 11]
+
+    def test_first_rejects_count_above_capacity(self, table):
+        with pytest.raises(ValueError):
+            table.first(count=table.capacity + 1)
+
+    def test_contains_only_primes_in_table(self, table):
+        assert table.contains(n=2) is True
+        assert table.contains(n=541) is True
+        assert table.contains(n=540) is False
+        assert table.contains(n=0) is False
+
+    def test_covers_numbers_up_to_largest_prime(self, table):
+        assert table.covers(n=541) is True
+        assert table.covers(n=542) is False
+
+    def test_nth_is_one_indexed(self, table):
+        assert table.nth(n=1) == 2
+        assert table.nth(n=100) == 541
+
+    def test_count_up_to(self, table):
+        assert table.count_up_to(limit=1) == 0
+        assert table.count_up_to(limit=100) == 25
+        assert table.count_up_to(limit=541) == 100
+
+    def test_page_returns_slice_by_index(self, table):
+        assert list(table.page(offset=4, count=3)) == [11, 13, 17]
+        assert list(table.page(offset=0, count=2)) == [2, 3]
+
+    def test_primes_up_to_returns_covered_prefix(self, table):
+        assert list(table.primes_up_to(limit=20)) == [2, 3, 5, 7, 11, 13, 17, 19]
+
+    def test_primes_up_to_returns_none_beyond_table(self, table):
+        assert table.primes_up_to(limit=542) is None
+
+
+class TestGrowablePrimeTable:
+    def test_load_builds_initial_count_only(self, growable_table):
+        assert len(growable_table.load()) == 10
+
+    def test_cached_count_tracks_growth(self, growable_table):
+        assert growable_table.cached_count() == 0
+
+        growable_table.load()
+        assert growable_table.cached_count() == 10
+
+        growable_table.first(count=11)
+
+        assert growable_table.cached_count() == 20
+
+    def test_first_extends_with_missing_tail(self, growable_table):
+        result = growable_table.first(count=1234)
+
+        assert list(result) == list(first_n_primes(count=1234))
+        assert len(growable_table.load()) >= 1234
+
+    def test_extension_at_least_doubles_cache(self, growable_table):
+        growable_table.load()
+
+        growable_table.first(count=11)
+
+        assert len(growable_table.load()) == 20
+
+    def test_extension_stops_at_capacity(self, growable_table):
+        growable_table.first(count=3000)
+        growable_table.first(count=4000)
+
+        assert growable_table.load() == first_n_primes(count=5000)
+
+    def test_extension_does_not_mutate_published_array(self, growable_table):
+        before = growable_table.load()
+
+        growable_table.first(count=500)
+
+        assert len(before) == 10
+        assert growable_table.load() is not before
+
+    def test_page_extends_cache(self, growable_table):
+        result = growable_table.page(offset=1000, count=2)
+
+        assert list(result) == [7927, 7933]
+        assert len(growable_table.load()) >= 1002
+
+    def test_nth_extends_cache(self, growable_table):
+        assert growable_table.nth(n=1000) == 7919
+
+    def test_extend_to_rejects_count_above_capacity(self, growable_table):
+        with pytest.raises(ValueError):
+            growable_table.extend_to(count=5001)
+
+    def test_concurrent_requests_extend_once(self, growable_table):
+        growable_table.load()
+        sieve_engine = growable_table.sieve_engine
+        original_primes_in_range = sieve_engine.primes_in_range
+        calls = []
+
+        def primes_in_range(**kwargs):
+            calls.append(kwargs)
+            return original_primes_in_range(**kwargs)
+
+        sieve_engine.primes_in_range = primes_in_range
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(
+                executor.map(lambda _: growable_table.first(count=2000), range(8))
+            )
+
+        assert len(calls) == 1
+        assert all(result == results[0] for result in results)
+
+
+class TestTablePrimeEngine:
+    def test_answers_from_table(self, table_engine, mock_fallback_engine):
+        result = table_engine.first_n_primes(count=10)
+
+        assert list(result) == [2, 3, 5, 7, 11, 13, 17, 19, 23, 29]
+        mock_fallback_engine.first_n_primes.assert_not_called()
+
+    def test_returns_empty_list_for_zero_count(self, table_engine):
+        assert table_engine.first_n_primes(count=0) == []
+
+    def test_uses_fallback_above_capacity(
+        self, table_engine, table, mock_fallback_engine
+    ):
+        expected_primes = [2, 3, 5]
+        mock_fallback_engine.first_n_primes.return_value = expected_primes
+
+        result = table_engine.first_n_primes(count=table.capacity + 1)
+
+        assert result == expected_primes
+        mock_fallback_engine.first_n_primes.assert_called_once_with(
+            count=table.capacity + 1
+        )
+
+    def test_seeds_range_sieve_with_table_primes(
+        self, table_engine, mock_fallback_engine
+    ):
+        table_engine.primes_in_range(lo=1000, hi=1100)
+
+        call_kwargs = mock_fallback_engine.primes_in_range.call_args.kwargs
+        assert call_kwargs["lo"] == 1000
+        assert call_kwargs["hi"] == 1100
+        assert list(call_kwargs["base_primes"]) == [
+            2,
+            3,
+            5,
+            7,
+            11,
+            13,
+            17,
+            19,
+            23,
+            29,
+            31,
+        ]
+
+    def test_leaves_base_primes_unset_beyond_table(
+        self, table_engine, mock_fallback_engine
+    ):
+        table_engine.primes_in_range(lo=10**12, hi=10**12 + 10)
+
+        call_kwargs = mock_fallback_engine.primes_in_range.call_args.kwargs
+        assert call_kwargs["base_primes"] is None
+
+    def test_primes_from_answers_from_table(self, table_engine, mock_fallback_engine):
+        result = table_engine.primes_from(lo=12, count=3)
+
+        assert list(result) == [13, 17, 19]
+        mock_fallback_engine.primes_from.assert_not_called()
+
+    def test_primes_from_past_capacity_is_seeded_with_table(
+        self, table_engine, mock_fallback_engine
+    ):
+        mock_fallback_engine.primes_from.return_value = [523, 541, 547]
+
+        result = table_engine.primes_from(lo=522, count=3)
+
+        assert result == [523, 541, 547]
+        call_kwargs = mock_fallback_engine.primes_from.call_args.kwargs
+        assert call_kwargs["lo"] == 522
+        assert call_kwargs["count"] == 3
+        assert list(call_kwargs["base_primes"])[-1] >= 23
+
+    def test_primes_from_matches_sieve_engine(self, table):
+        engine = TablePrimeEngine(table=table, fallback_engine=SievePrimeEngine())
+
+        for lo in (0, 100, 540, 541, 542, 10**6):
+            assert list(engine.primes_from(lo=lo, count=20)) == list(
+                SievePrimeEngine().primes_from(lo=lo, count=20)
+            )
+
+    def test_are_primes_uses_table_membership_within_range(self, table_engine):
+        result = table_engine.are_primes(numbers=[0, 1, 2, 9, 523, 541])
+
+        assert result == [False, False, True, False, True, True]
+
+    def test_are_primes_tests_numbers_beyond_table(self, table_engine):
+        result = table_engine.are_primes(numbers=[547, 549, 1000000007])
+
+        assert result == [True, False, True]
+
+    def test_nth_prime_within_table(self, table_engine, mock_fallback_engine):
+        assert table_engine.nth_prime(n=100) == 541
+        mock_fallback_engine.nth_prime.assert_not_called()
+
+    def test_nth_prime_beyond_table_is_seeded_with_table(
+        self, table_engine, table, mock_fallback_engine
+    ):
+        mock_fallback_engine.nth_prime.return_value = 547
+
+        result = table_engine.nth_prime(n=101)
+
+        assert result == 547
+        call_kwargs = mock_fallback_engine.nth_prime.call_args.kwargs
+        assert call_kwargs["n"] == 101
+        assert list(call_kwargs["base_primes"]) == [2, 3, 5, 7, 11, 13, 17, 19, 23]
+
+    def test_prime_count_within_table(self, table_engine, mock_fallback_engine):
+        assert table_engine.prime_count(x=100) == 25
+        mock_fallback_engine.prime_count.assert_not_called()
+
+    def test_prime_count_beyond_table_is_seeded_with_table(
+        self, table_engine, mock_fallback_engine
+    ):
+        mock_fallback_engine.prime_count.return_value = 168
+
+        result = table_engine.prime_count(x=1000)
+
+        assert result == 168
+        call_kwargs = mock_fallback_engine.prime_count.call_args.kwargs
+        assert list(call_kwargs["base_primes"]) == [
+            2,
+            3,
+            5,
+            7,
+            11,
+            13,
+            17,
+            19,
+            23,
+            29,
+            31,
+        ]
@@ -0,0 +1,178 @@
+import pytest
+
+from app.interactos.primes_interactor import PrimeNumbersInteractor
+from app.prime_engine.engine_implementation import SievePrimeEngine
+from app.prime_engine.sieve import (
+    estimate_nth_prime_upper_bound,
+    first_n_primes,
+    iter_prime_segments,
+    prime_typecode,
+    primes_in_range,
+    sieve_of_eratosthenes,
+    sieve_segment,
+)
+
+
+def trial_division_primes(count: int) -> list[int]:
+    is_prime = PrimeNumbersInteractor._is_prime
+    primes = []
+    num = 2
+
+    while len(primes) < count:
+        if is_prime(None, num):
+            primes.append(num)
+        num += 1
+
+    return primes
+
+
+@pytest.fixture
+def prime_engine():
+    return SievePrimeEngine()
+
+
+class TestEstimateNthPrimeUpperBound:
+    @pytest.mark.parametrize("n", [1, 2, 5, 6, 10, 100, 1000, 10000])
+    def test_bound_is_not_below_nth_prime(self, n):
+        expected_nth_prime = trial_division_primes(count=n)[-1]
+
+        result = estimate_nth_prime_upper_bound(n=n)
+
+        assert result >= expected_nth_prime
+
+    def test_uses_dusart_bound_for_large_n(self):
+        n = 1000000
+        expected_millionth_prime = 15485863
+        rosser_bound = 16441303
+
+        result = estimate_nth_prime_upper_bound(n=n)
+
+        assert expected_millionth_prime <= result < rosser_bound
+
+
+class TestSieveOfEratosthenes:
+    def test_returns_empty_list_below_two(self):
+        assert sieve_of_eratosthenes(limit=0) == []
+        assert sieve_of_eratosthenes(limit=1) == []
+
+    def test_includes_limit_when_prime(self):
+        assert sieve_of_eratosthenes(limit=2) == [2]
+        assert sieve_of_eratosthenes(limit=13) == [2, 3, 5, 7, 11, 13]
+
+    def test_excludes_perfect_squares(self):
+        assert sieve_of_eratosthenes(limit=49) == trial_division_primes(count=15)
+
+
+class TestSieveSegment:
+    @pytest.mark.parametrize(
+        "low, high", [(0, 2), (0, 3), (0, 100), (2, 3), (3, 50), (90, 97), (1000, 1500)]
+    )
+    def test_matches_full_sieve_on_window(self, low, high):
+        base_primes = sieve_of_eratosthenes(limit=100)
+        expected = [p for p in sieve_of_eratosthenes(limit=high) if low <= p < high]
+
+        result = sieve_segment(low=low, high=high, base_primes=base_primes)
+
+        assert result == expected
+
+    def test_excludes_upper_bound(self):
+        base_primes = sieve_of_eratosthenes(limit=10)
+
+        assert sieve_segment(low=90, high=97, base_primes=base_primes) == []
+
+    def test_returns_empty_list_for_empty_window(self):
+        assert sieve_segment(low=10, high=10, base_primes=[2, 3]) == []
+
+
+class TestIterPrimeSegments:
+    def test_concatenated_segments_match_full_sieve(self):
+        limit = 10007
+        segment_size = 64
+        expected = sieve_of_eratosthenes(limit=limit)
+
+        segments = list(iter_prime_segments(limit=limit, segment_size=segment_size))
+
+        assert len(segments) > 1
+        assert [p for segment in segments for p in segment] == expected
+
+    def test_yields_nothing_below_two(self):
+        assert list(iter_prime_segments(limit=1)) == []
+
+
+class TestFirstNPrimes:
+    @pytest.mark.parametrize("segment_size", [1, 7, 64, 4096])
+    def test_is_independent_of_segment_size(self, segment_size):
+        expected = trial_division_primes(count=500)
+
+        result = first_n_primes(count=500, segment_size=segment_size)
+
+        assert list(result) == expected
+
+    def test_returns_compact_uint32_array(self):
+        result = first_n_primes(count=10)
+
+        assert result.typecode == "I"
+        assert len(result) == 10
+
+    def test_prime_typecode_widens_above_uint32(self):
+        assert prime_typecode(limit=2**32 - 1) == "I"
+        assert prime_typecode(limit=2**32) == "Q"
+
+
+class TestPrimesInRange:
+    @pytest.mark.parametrize(
+        "lo, hi", [(0, 1), (0, 3), (2, 3), (0, 1000), (500, 1500), (7919, 7920)]
+    )
+    def test_matches_full_sieve_on_window(self, lo, hi):
+        expected = [p for p in sieve_of_eratosthenes(limit=hi) if lo <= p < hi]
+
+        result = primes_in_range(lo=lo, hi=hi, segment_size=16)
+
+        assert list(result) == expected
+
+    def test_returns_empty_for_empty_window(self):
+        assert list(primes_in_range(lo=100, hi=100)) == []
+
+    def test_uses_uint64_array_above_uint32(self):
+        lo = 2**32
+
+        result = primes_in_range(lo=lo, hi=lo + 100)
+
+        assert result.typecode == "Q"
+        assert list(result) == [
+            4294967311,
+            4294967357,
+            4294967371,
+            4294967377,
+            4294967387,
+            4294967389,
+        ]
+
+    def test_accepts_precomputed_base_primes(self):
+        base_primes = sieve_of_eratosthenes(limit=40)
+
+        result = primes_in_range(lo=1500, hi=1600, base_primes=base_primes)
+
+        assert list(result) == [p for p in sieve_of_eratosthenes(1600) if p >= 1500]
+
+
+class TestSievePrimeEngine:
+    def test_returns_empty_list_for_zero_count(self, prime_engine):
+        assert prime_engine.first_n_primes(count=0) == []
+
+    @pytest.mark.parametrize("count", [1, 2, 5, 6, 7, 100, 1000])
+    def test_matches_trial_division(self, prime_engine, count):
+        expected = trial_division_primes(count=count)
+
+        result = prime_engine.first_n_primes(count=count)
+
+        assert list(result) == expected
+
+    def test_matches_trial_division_at_max_prime_count(self, prime_engine):
+        from app.constants import MAX_PRIME_COUNT
+
+        expected = trial_division_primes(count=MAX_PRIME_COUNT)
+
+        result = prime_engine.first_n_primes(count=MAX_PRIME_COUNT)
+
+        assert list(result) == expected
@@ -0,0 +1,95 @@
+import pytest
+
+from app.prime_engine.bitset_table import BitsetPrimeTable
+from app.prime_engine.engine_implementation import SievePrimeEngine
+from app.prime_engine.factory import TABLE_STORAGE_BITSET, _open_prime_table
+from app.prime_engine.prime_table import MappedPrimeTable, PrimeTable
+from app.prime_engine.table_file import write_prime_table_file
+
+
+@pytest.fixture
+def table_path(tmp_path):
+    path = tmp_path / "primes.bin"
+    write_prime_table_file(path=str(path), count=100)
+    return str(path)
+
+
+class TestWritePrimeTableFile:
+    def test_writes_packed_little_endian_uint32(self, tmp_path):
+        path = tmp_path / "primes.bin"
+        expected_bytes = (
+            b"\x02\x00\x00\x00\x03\x00\x00\x00\x05\x00\x00\x00\x07\x00\x00\x00"
+        )
+
+        written = write_prime_table_file(path=str(path), count=4)
+
+        assert written == 4
+        assert path.read_bytes() == expected_bytes
+
+
+class TestMappedPrimeTable:
+    def test_capacity_is_read_from_file_size(self, table_path):
+        table = MappedPrimeTable(path=table_path)
+
+        assert table.capacity == 100
+        assert table.is_loaded is False
+
+    def test_first_returns_zero_copy_view(self, table_path):
+        table = MappedPrimeTable(path=table_path)
+
+        result = table.first(count=5)
+
+        assert isinstance(result, memoryview)
+        assert result.tolist() == [2, 3, 5, 7, 11]
+
+    def test_matches_in_process_table(self, table_path):
+        mapped_table = MappedPrimeTable(path=table_path)
+        in_process_table = PrimeTable(capacity=100, sieve_engine=SievePrimeEngine())
+
+        assert mapped_table.first(count=100).tolist() == (
+            in_process_table.first(count=100).tolist()
+        )
+
+    def test_page_returns_slice_by_index(self, table_path):
+        table = MappedPrimeTable(path=table_path)
+
+        assert table.page(offset=97, count=3).tolist() == [521, 523, 541]
+        with pytest.raises(ValueError):
+            table.page(offset=98, count=3)
+
+    def test_first_rejects_count_above_capacity(self, table_path):
+        table = MappedPrimeTable(path=table_path)
+
+        with pytest.raises(ValueError):
+            table.first(count=101)
+
+    def test_rejects_truncated_file(self, tmp_path):
+        path = tmp_path / "primes.bin"
+        path.write_bytes(b"\x02\x00\x00")
+
+        with pytest.raises(ValueError):
+            MappedPrimeTable(path=str(path))
+
+
+class TestOpenPrimeTable:
+    def test_maps_existing_file(self, table_path):
+        result = _open_prime_table(path=table_path)
+
+        assert isinstance(result, MappedPrimeTable)
+
+    def test_falls_back_to_in_process_table_when_file_missing(self, tmp_path):
+        result = _open_prime_table(path=str(tmp_path / "missing.bin"))
+
+        assert isinstance(result, PrimeTable)
+
+    def test_falls_back_to_in_process_table_when_path_empty(self):
+        result = _open_prime_table(path="")
+
+        assert isinstance(result, PrimeTable)
+
+    def test_uses_bitset_storage_when_configured(self, tmp_path):
+        result = _open_prime_table(
+            path=str(tmp_path / "missing.bin"), storage=TABLE_STORAGE_BITSET
+        )
+
+        assert isinstance(result, BitsetPrimeTable)
@@ -0,0 +1,261 @@
+import fcntl
+import time
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import event
+from sqlmodel import Session, func, select
+
+from app.models import LoginLog
+from app.storages.login_log_buffer import LoginLogBuffer, _dump_row
+from app.storages.storage_implementation import BufferedLoginLogStorage
+from tests.factories.dto_factories import LoginLogDTOFactory
+
+
+def login_log(user_id: str = "user-123") -> LoginLog:
+    return LoginLog(user_id=user_id, ip_address="127.0.0.1", user_agent="Mozilla/5.0")
+
+
+def stored_count(engine) -> int:
+    with Session(engine) as session:
+        return session.exec(select(func.count()).select_from(LoginLog)).one()
+
+
+def wait_for_count(engine, expected: int, timeout: float = 2.0) -> int:
+    deadline = time.monotonic() + timeout
+    while stored_count(engine) < expected and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return stored_count(engine)
+
+
+@pytest.fixture
+def buffer(engine):
+    buffer = LoginLogBuffer(
+        engine=engine, flush_size=3, flush_interval_ms=60_000, max_rows=10
+    )
+    yield buffer
+    buffer.stop()
+
+
+class TestFlush:
+    def test_writes_buffered_rows_in_one_insert(self, buffer, engine):
+        statements = []
+        event.listen(
+            engine,
+            "before_cursor_execute",
+            lambda conn, cursor, statement, *args: statements.append(statement),
+        )
+        for _ in range(2):
+            buffer.add(login_log=login_log())
+
+        written = buffer.flush()
+
+        inserts = [s for s in statements if s.startswith("INSERT")]
+        assert written == 2
+        assert len(inserts) == 1
+        assert stored_count(engine) == 2
+        assert len(buffer) == 0
+
+    def test_flush_of_empty_buffer_is_a_no_op(self, buffer):
+        assert buffer.flush() == 0
+
+    def test_failed_insert_keeps_rows_for_retry(self, buffer, engine):
+        buffer.add(login_log=login_log())
+
+        with patch.object(LoginLogBuffer, "_insert", side_effect=RuntimeError()):
+            assert buffer.flush() == 0
+
+        assert len(buffer) == 1
+        assert buffer.flush() == 1
+        assert stored_count(engine) == 1
+
+    def test_rejected_row_is_dropped_and_the_rest_written(self, buffer, engine):
+        buffer.add(login_log=login_log())
+        buffer.add(login_log=login_log(user_id=None))
+        buffer.add(login_log=login_log())
+
+        with patch(
+            "app.storages.login_log_buffer.record_login_log_dropped"
+        ) as record_dropped:
+            written = buffer.flush()
+
+        assert written == 2
+        assert len(buffer) == 0
+        assert stored_count(engine) == 2
+        record_dropped.assert_called_once_with(rows=1, reason="rejected")
+
+    def test_drops_rows_beyond_max_rows(self, engine):
+        buffer = LoginLogBuffer(
+            engine=engine, flush_size=2, flush_interval_ms=60_000, max_rows=2
+        )
+
+        with patch(
+            "app.storages.login_log_buffer.record_login_log_dropped"
+        ) as record_dropped:
+            for _ in range(3):
+                buffer.add(login_log=login_log())
+
+        assert len(buffer) == 2
+        record_dropped.assert_called_once_with(rows=1, reason="overflow")
+
+    def test_requeue_after_failure_respects_max_rows(self, engine):
+        buffer = LoginLogBuffer(
+            engine=engine, flush_size=2, flush_interval_ms=60_000, max_rows=2
+        )
+        for _ in range(2):
+            buffer.add(login_log=login_log())
+
+        def fail_and_add(rows):
+            buffer.add(login_log=login_log())
+            raise RuntimeError()
+
+        with patch.object(LoginLogBuffer, "_insert", side_effect=fail_and_add):
+            buffer.flush()
+
+        assert len(buffer) == 2
+
+
+class TestBackgroundFlush:
+    def test_flushes_when_flush_size_is_reached(self, buffer, engine):
+        buffer.start()
+
+        for _ in range(3):
+            buffer.add(login_log=login_log())
+
+        assert wait_for_count(engine, expected=3) == 3
+
+    def test_flushes_after_interval(self, engine):
+        buffer = LoginLogBuffer(
+            engine=engine, flush_size=100, flush_interval_ms=10, max_rows=100
+        )
+        buffer.start()
+
+        buffer.add(login_log=login_log())
+
+        assert wait_for_count(engine, expected=1) == 1
+        buffer.stop()
+
+    def test_stop_flushes_remaining_rows(self, buffer, engine):
+        buffer.start()
+        buffer.add(login_log=login_log())
+
+        buffer.stop()
+
+        assert stored_count(engine) == 1
+
+
+def spool_buffer(engine, spool_path) -> LoginLogBuffer:
+    return LoginLogBuffer(
+        engine=engine,
+        flush_size=100,
+        flush_interval_ms=60_000,
+        max_rows=100,
+        spool_path=str(spool_path),
+    )
+
+
+def write_spool(path, rows: list[LoginLog]) -> None:
+    path.write_text("".join(_dump_row(row=row.model_dump()) + "\n" for row in rows))
+
+
+class TestSpool:
+    def test_replays_rows_left_by_a_dead_process(self, engine, tmp_path):
+        write_spool(tmp_path / "login_logs.spool.123-dead", [login_log(), login_log()])
+        (tmp_path / "login_logs.spool.123-dead.lock").touch()
+
+        buffer = spool_buffer(engine, spool_path=tmp_path / "login_logs.spool")
+        buffer.start()
+        buffer.stop()
+
+        assert stored_count(engine) == 2
+        assert list(tmp_path.iterdir()) == []
+
+    def test_leaves_spools_of_running_processes_alone(self, engine, tmp_path):
+        spool = tmp_path / "login_logs.spool.456-live"
+        write_spool(spool, [login_log()])
+        with open(tmp_path / "login_logs.spool.456-live.lock", "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+            buffer = spool_buffer(engine, spool_path=tmp_path / "login_logs.spool")
+            buffer.start()
+            buffer.stop()
+
+        assert stored_count(engine) == 0
+        assert len(spool.read_text().splitlines()) == 1
+
+    def test_workers_sharing_a_path_spool_to_separate_files(self, engine, tmp_path):
+        first = spool_buffer(engine, spool_path=tmp_path / "login_logs.spool")
+        second = spool_buffer(engine, spool_path=tmp_path / "login_logs.spool")
+        first.start()
+        second.start()
+        first.add(login_log=login_log())
+
+        second.flush()
+        second.stop()
+
+        assert first._spool_file_path != second._spool_file_path
+        assert len(open(first._spool_file_path).read().splitlines()) == 1
+        first.stop()
+        assert stored_count(engine) == 1
+
+    def test_replay_skips_rows_already_committed(self, engine, tmp_path):
+        committed = login_log()
+        pending = login_log()
+        with Session(engine) as session:
+            session.add(
+                LoginLog(
+                    id=committed.id,
+                    user_id=committed.user_id,
+                    login_timestamp=committed.login_timestamp,
+                )
+            )
+            session.commit()
+        inflight = tmp_path / "login_logs.spool.123-dead.inflight"
+        write_spool(inflight, [committed, pending])
+
+        buffer = spool_buffer(engine, spool_path=tmp_path / "login_logs.spool")
+        buffer.start()
+        buffer.stop()
+
+        assert stored_count(engine) == 2
+        assert not inflight.exists()
+
+    def test_flushed_rows_leave_the_spool(self, engine, tmp_path):
+        buffer = spool_buffer(engine, spool_path=tmp_path / "login_logs.spool")
+        buffer.start()
+        buffer.add(login_log=login_log())
+        with open(buffer._spool_file_path) as spool:
+            assert len(spool.read().splitlines()) == 1
+
+        buffer.flush()
+
+        with open(buffer._spool_file_path) as spool:
+            assert spool.read() == ""
+        buffer.stop()
+
+
+class TestBufferedLoginLogStorage:
+    @pytest.mark.asyncio
+    async def test_returns_dto_without_writing(self, buffer, engine):
+        storage = BufferedLoginLogStorage(buffer=buffer)
+
+        result = await storage.create(
+            login_log_dto=LoginLogDTOFactory(user_id="user-123")
+        )
+
+        assert result.id is not None
+        assert result.user_id == "user-123"
+        assert isinstance(result.login_timestamp, datetime)
+        assert len(buffer) == 1
+        assert stored_count(engine) == 0
+
+    @pytest.mark.asyncio
+    async def test_create_many_queues_every_row(self, buffer):
+        storage = BufferedLoginLogStorage(buffer=buffer)
+
+        await storage.create_many(
+            login_log_dtos=[LoginLogDTOFactory() for _ in range(2)]
+        )
+
+        assert len(buffer) == 2
@@ -1,9 +1,15 @@
 import pytest
 from freezegun import freeze_time
+from sqlalchemy import event
 from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.models import LoginLog
-from app.storages.storage_implementation import LoginLogStorage
+from app.storages.storage_implementation import (
+    AsyncLoginLogStorage,
+    LoginLogStorage,
+    ThreadedLoginLogStorage,
+)
 from tests.factories.dto_factories import LoginLogDTOFactory
 
 
@@ -12,6 +18,11 @@ def login_log_storage(session: Session):
     return LoginLogStorage(session=session)
 
 
+@pytest.fixture
+def async_login_log_storage(async_session: AsyncSession):
+    return AsyncLoginLogStorage(session=async_session)
+
+
 class TestCreate:
     @freeze_time("2025-01-01 12:00:00")
     def test_creates_login_log_successfully(
@@ -123,3 +134,115 @@ class TestCreate:
 
         assert result.id is not None
         assert len(str(result.id)) >= expected_id_length_min
+
+    @freeze_time("2025-01-01 12:00:00")
+    def test_does_not_read_the_row_back(
+        self, login_log_storage: LoginLogStorage, engine
+    ):
+        statements = []
+        event.listen(
+            engine,
+            "before_cursor_execute",
+            lambda conn, cursor, statement, *args: statements.append(statement),
+        )
+
+        result = login_log_storage.create(login_log_dto=LoginLogDTOFactory())
+
+        assert result.id is not None
+        assert [s.split()[0] for s in statements] == ["INSERT"]
+
+
+class TestCreateMany:
+    def test_inserts_all_rows_in_one_statement(
+        self, login_log_storage: LoginLogStorage, session: Session, engine
+    ):
+        statements = []
+        event.listen(
+            engine,
+            "before_cursor_execute",
+            lambda conn, cursor, statement, *args: statements.append(statement),
+        )
+        login_log_dtos = [
+            LoginLogDTOFactory(user_id=f"user-{i}", ip_address=f"10.0.0.{i}")
+            for i in range(3)
+        ]
+
+        result = login_log_storage.create_many(login_log_dtos=login_log_dtos)
+        executed = list(statements)
+
+        stored = session.exec(select(LoginLog).order_by(LoginLog.user_id)).all()
+        assert result is None
+        assert [s.split()[0] for s in executed] == ["INSERT"]
+        assert [log.ip_address for log in stored] == [
+            "10.0.0.0",
+            "10.0.0.1",
+            "10.0.0.2",
+        ]
+        assert len({log.id for log in stored}) == 3
+
+    def test_empty_batch_is_a_no_op(self, login_log_storage: LoginLogStorage, engine):
+        statements = []
+        event.listen(
+            engine,
+            "before_cursor_execute",
+            lambda conn, cursor, statement, *args: statements.append(statement),
+        )
+
+        login_log_storage.create_many(login_log_dtos=[])
+
+        assert statements == []
+
+
+class TestAsyncCreate:
+    @pytest.mark.asyncio
+    @freeze_time("2025-01-01 12:00:00")
+    async def test_persists_login_log(
+        self,
+        async_login_log_storage: AsyncLoginLogStorage,
+        async_session: AsyncSession,
+    ):
+        login_log_dto = LoginLogDTOFactory(
+            user_id="user-123", ip_address="127.0.0.1", user_agent="Mozilla/5.0"
+        )
+
+        result = await async_login_log_storage.create(login_log_dto=login_log_dto)
+
+        stored = (
+            await async_session.exec(select(LoginLog).where(LoginLog.id == result.id))
+        ).one()
+        assert result.user_id == "user-123"
+        assert result.login_timestamp is not None
+        assert stored.ip_address == "127.0.0.1"
+        assert stored.user_agent == "Mozilla/5.0"
+
+    @pytest.mark.asyncio
+    async def test_create_many_persists_all_rows(
+        self,
+        async_login_log_storage: AsyncLoginLogStorage,
+        async_session: AsyncSession,
+    ):
+        await async_login_log_storage.create_many(
+            login_log_dtos=[LoginLogDTOFactory(user_id="user-123") for _ in range(3)]
+        )
+
+        stored = (await async_session.exec(select(LoginLog))).all()
+        assert len(stored) == 3
+
+
+class TestThreadedLoginLogStorage:
+    @pytest.mark.asyncio
+    async def test_serves_sync_storage_to_async_callers(
+        self, login_log_storage: LoginLogStorage, session: Session
+    ):
+        threaded_login_log_storage = ThreadedLoginLogStorage(storage=login_log_storage)
+
+        result = await threaded_login_log_storage.create(
+            login_log_dto=LoginLogDTOFactory(user_id="user-123")
+        )
+        await threaded_login_log_storage.create_many(
+            login_log_dtos=[LoginLogDTOFactory(user_id="user-123") for _ in range(2)]
+        )
+
+        stored = session.exec(select(LoginLog)).all()
+        assert result.user_id == "user-123"
+        assert len(stored) == 3
@@ -0,0 +1,343 @@
+import asyncio
+import json
+from datetime import datetime
+from unittest.mock import create_autospec, patch
+
+import pytest
+import pytest_asyncio
+import redis
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.dependencies import get_current_user, get_current_user_async
+from app.dtos import UserDTO
+from app.models import User
+from app.storages import user_cache as user_cache_module
+from app.storages.user_cache import RedisUserCacheTier, UserCache
+from app.utils import create_jwt_token
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def snapshot(user_id: str = "user-123", is_active: bool = True) -> UserDTO:
+    return UserDTO(
+        id=user_id,
+        username=f"{user_id}-name",
+        email=f"{user_id}@example.com",
+        is_active=is_active,
+        created_at=datetime(2024, 1, 2, 3, 4, 5),
+    )
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(clock):
+    return UserCache(max_size=2, ttl_seconds=30, clock=clock)
+
+
+@pytest.fixture
+def mock_redis():
+    return create_autospec(spec=redis.Redis, instance=True)
+
+
+@pytest.fixture
+def redis_tier(mock_redis):
+    return RedisUserCacheTier(client=mock_redis, ttl_seconds=30, channel="invalidate")
+
+
+class TestUserCache:
+    def test_returns_cached_user(self, cache):
+        user = snapshot()
+        cache.put(user=user)
+
+        assert cache.get(user_id="user-123") is user
+
+    def test_returns_none_for_unknown_user(self, cache):
+        assert cache.get(user_id="user-123") is None
+
+    def test_expires_after_ttl(self, cache, clock):
+        cache.put(user=snapshot())
+
+        clock.now = 29.9
+        assert cache.get(user_id="user-123") is not None
+        clock.now = 30
+        assert cache.get(user_id="user-123") is None
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self, cache):
+        cache.put(user=snapshot(user_id="a"))
+        cache.put(user=snapshot(user_id="b"))
+        cache.get(user_id="a")
+
+        cache.put(user=snapshot(user_id="c"))
+
+        assert cache.get(user_id="a") is not None
+        assert cache.get(user_id="b") is None
+        assert cache.get(user_id="c") is not None
+
+    def test_does_not_cache_inactive_users(self, cache):
+        cache.put(user=snapshot(is_active=False))
+
+        assert cache.get(user_id="user-123") is None
+
+    def test_invalidate_drops_user(self, cache):
+        cache.put(user=snapshot())
+
+        cache.invalidate(user_id="user-123")
+
+        assert cache.get(user_id="user-123") is None
+
+    def test_records_hits_and_misses(self, cache):
+        cache.put(user=snapshot())
+
+        with patch("app.storages.user_cache.record_user_cache_lookup") as record_lookup:
+            cache.get(user_id="user-123")
+            cache.get(user_id="user-456")
+
+        assert [c.kwargs["hit"] for c in record_lookup.call_args_list] == [
+            True,
+            False,
+        ]
+
+
+class TestRedisUserCacheTier:
+    def test_local_miss_reads_shared_tier(self, clock, redis_tier, mock_redis):
+        mock_redis.get.return_value = user_cache_module._dump_snapshot(user=snapshot())
+        cache = UserCache(
+            max_size=2, ttl_seconds=30, redis_tier=redis_tier, clock=clock
+        )
+
+        first = cache.get(user_id="user-123")
+        second = cache.get(user_id="user-123")
+
+        assert first == snapshot()
+        assert second is first
+        mock_redis.get.assert_called_once_with("user-cache:user-123")
+
+    def test_put_writes_snapshot_without_password_hash(
+        self, clock, redis_tier, mock_redis
+    ):
+        cache = UserCache(
+            max_size=2, ttl_seconds=30, redis_tier=redis_tier, clock=clock
+        )
+        user = snapshot()
+        user.password_hash = "secret"
+
+        cache.put(user=user)
+
+        key, data = mock_redis.set.call_args.args
+        assert key == "user-cache:user-123"
+        assert mock_redis.set.call_args.kwargs["ex"] == 30
+        assert "password_hash" not in json.loads(data)
+
+    def test_invalidate_deletes_and_publishes(self, clock, redis_tier, mock_redis):
+        cache = UserCache(
+            max_size=2, ttl_seconds=30, redis_tier=redis_tier, clock=clock
+        )
+
+        cache.invalidate(user_id="user-123")
+
+        mock_redis.delete.assert_called_once_with("user-cache:user-123")
+        mock_redis.publish.assert_called_once_with("invalidate", "user-123")
+
+    @pytest.mark.asyncio
+    async def test_async_methods_use_shared_tier_off_the_event_loop(
+        self, clock, redis_tier, mock_redis
+    ):
+        mock_redis.get.return_value = user_cache_module._dump_snapshot(user=snapshot())
+        cache = UserCache(
+            max_size=2, ttl_seconds=30, redis_tier=redis_tier, clock=clock
+        )
+
+        with patch(
+            "app.storages.user_cache.asyncio.to_thread", wraps=asyncio.to_thread
+        ) as to_thread:
+            user = await cache.get_async(user_id="user-123")
+            await cache.put_async(user=snapshot(user_id="user-456"))
+            assert await cache.get_async(user_id="user-123") is user
+
+        assert user == snapshot()
+        assert [c.args[0] for c in to_thread.call_args_list] == [
+            redis_tier.get,
+            redis_tier.put,
+        ]
+        mock_redis.get.assert_called_once_with("user-cache:user-123")
+        assert mock_redis.set.call_args.args[0] == "user-cache:user-456"
+
+    def test_redis_errors_are_misses(self, redis_tier, mock_redis):
+        mock_redis.get.side_effect = redis.ConnectionError()
+
+        assert redis_tier.get(user_id="user-123") is None
+
+    def test_subscriber_evicts_published_users(self, cache, redis_tier, mock_redis):
+        cache.put(user=snapshot())
+        redis_tier.subscribe(on_invalidate=lambda user_id: cache.evict(user_id=user_id))
+        pubsub = mock_redis.pubsub.return_value
+        handler = pubsub.subscribe.call_args.kwargs["invalidate"]
+
+        handler({"type": "message", "data": "user-123"})
+
+        assert cache.get(user_id="user-123") is None
+        pubsub.run_in_thread.assert_called_once()
+
+
+class TestCommitInvalidation:
+    def test_commit_of_updated_user_invalidates_cache(self, session: Session):
+        user = User(
+            id="user-123",
+            username="testuser",
+            email="test@example.com",
+            password_hash="hash",
+        )
+        session.add(instance=user)
+        session.commit()
+
+        user.is_active = False
+        session.add(instance=user)
+        with patch(
+            "app.storages.user_cache.invalidate_cached_user"
+        ) as invalidate_cached_user:
+            session.commit()
+
+        invalidate_cached_user.assert_called_once_with(user_id="user-123")
+
+    def test_rollback_discards_pending_invalidation(self, engine):
+        with Session(engine) as session:
+            user = User(
+                id="user-123",
+                username="testuser",
+                email="test@example.com",
+                password_hash="hash",
+            )
+            session.add(instance=user)
+            session.commit()
+
+            user.is_active = False
+            session.add(instance=user)
+            session.flush()
+            session.rollback()
+            with patch(
+                "app.storages.user_cache.invalidate_cached_user"
+            ) as invalidate_cached_user:
+                session.commit()
+
+        invalidate_cached_user.assert_not_called()
+
+
+class TestGetCurrentUser:
+    @pytest.fixture
+    def user(self, session: Session):
+        user = User(
+            id="user-123",
+            username="testuser",
+            email="test@example.com",
+            password_hash="hash",
+        )
+        session.add(instance=user)
+        session.commit()
+        return user
+
+    @pytest.fixture
+    def credentials(self):
+        token, _ = create_jwt_token(user_id="user-123", username="testuser")
+        return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+    @pytest.fixture(autouse=True)
+    def cache(self, cache):
+        with patch("app.dependencies.get_user_cache", return_value=cache):
+            yield cache
+
+    def test_loads_user_once_then_serves_from_cache(self, user, credentials, session):
+        first = get_current_user(credentials=credentials, session=session)
+
+        with patch.object(Session, "get") as session_get:
+            second = get_current_user(credentials=credentials, session=session)
+
+        session_get.assert_not_called()
+        assert first == second
+        assert first.id == "user-123"
+        assert first.password_hash is None
+
+    def test_rejects_unknown_user(self, credentials, session):
+        with pytest.raises(HTTPException) as exc_info:
+            get_current_user(credentials=credentials, session=session)
+
+        assert exc_info.value.status_code == 401
+
+    def test_deactivation_takes_effect_on_next_request(
+        self, user, credentials, session, cache
+    ):
+        get_current_user(credentials=credentials, session=session)
+
+        user.is_active = False
+        session.add(instance=user)
+        with patch(
+            "app.storages.user_cache.get_user_cache",
+            return_value=cache,
+        ):
+            session.commit()
+
+        with pytest.raises(HTTPException) as exc_info:
+            get_current_user(credentials=credentials, session=session)
+
+        assert exc_info.value.status_code == 403
+
+
+class TestGetCurrentUserAsync:
+    @pytest_asyncio.fixture
+    async def user(self, async_session: AsyncSession):
+        user = User(
+            id="user-123",
+            username="testuser",
+            email="test@example.com",
+            password_hash="hash",
+        )
+        async_session.add(instance=user)
+        await async_session.commit()
+        return user
+
+    @pytest.fixture
+    def credentials(self):
+        token, _ = create_jwt_token(user_id="user-123", username="testuser")
+        return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+    @pytest.fixture(autouse=True)
+    def cache(self, cache):
+        with patch("app.dependencies.get_user_cache", return_value=cache):
+            yield cache
+
+    @pytest.mark.asyncio
+    async def test_loads_user_once_then_serves_from_cache(
+        self, user, credentials, async_session
+    ):
+        first = await get_current_user_async(
+            credentials=credentials, session=async_session
+        )
+
+        with patch.object(AsyncSession, "get") as session_get:
+            second = await get_current_user_async(
+                credentials=credentials, session=async_session
+            )
+
+        session_get.assert_not_called()
+        assert first == second
+        assert first.password_hash is None
+
+    @pytest.mark.asyncio
+    async def test_rejects_unknown_user(self, credentials, async_session):
+        with pytest.raises(HTTPException) as exc_info:
+            await get_current_user_async(credentials=credentials, session=async_session)
+
+        assert exc_info.value.status_code == 401
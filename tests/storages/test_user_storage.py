@@ -1,8 +1,14 @@
 import pytest
+import pytest_asyncio
 from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.models import User
-from app.storages.storage_implementation import UserStorage
+from app.storages.storage_implementation import (
+    AsyncUserStorage,
+    ThreadedUserStorage,
+    UserStorage,
+)
 from app.utils import hash_password
 
 
@@ -11,6 +17,11 @@ def user_storage(session: Session):
     return UserStorage(session=session)
 
 
+@pytest.fixture
+def async_user_storage(async_session: AsyncSession):
+    return AsyncUserStorage(session=async_session)
+
+
 class TestGetByUsername:
     def test_returns_user_when_username_exists(
         self, user_storage: UserStorage, session: Session
@@ -156,3 +167,92 @@ class TestGetByUsername:
         assert result is not None
         assert result.username == username
         assert result.is_active == expected_is_active
+
+
+class TestGetById:
+    def test_returns_user_when_id_exists(
+        self, user_storage: UserStorage, session: Session
+    ):
+        user = User(
+            id="user-123",
+            username="testuser",
+            email="test@example.com",
+            password_hash=hash_password(password="password123"),
+            is_active=True,
+        )
+        session.add(instance=user)
+        session.commit()
+
+        result = user_storage.get_by_id(user_id="user-123")
+
+        assert result is not None
+        assert result.id == "user-123"
+        assert result.username == "testuser"
+        assert result.is_active is True
+
+    def test_returns_none_when_id_not_found(self, user_storage: UserStorage):
+        assert user_storage.get_by_id(user_id="missing") is None
+
+
+class TestAsyncUserStorage:
+    @pytest_asyncio.fixture
+    async def user(self, async_session: AsyncSession):
+        user = User(
+            id="user-123",
+            username="testuser",
+            email="test@example.com",
+            password_hash="hash",
+        )
+        async_session.add(instance=user)
+        await async_session.commit()
+        return user
+
+    @pytest.mark.asyncio
+    async def test_get_by_username_returns_user(
+        self, async_user_storage: AsyncUserStorage, user
+    ):
+        result = await async_user_storage.get_by_username(username="testuser")
+
+        assert result is not None
+        assert result.id == "user-123"
+        assert result.password_hash == "hash"
+
+    @pytest.mark.asyncio
+    async def test_get_by_id_returns_user(
+        self, async_user_storage: AsyncUserStorage, user
+    ):
+        result = await async_user_storage.get_by_id(user_id="user-123")
+
+        assert result is not None
+        assert result.username == "testuser"
+
+    @pytest.mark.asyncio
+    async def test_returns_none_when_user_not_found(
+        self, async_user_storage: AsyncUserStorage
+    ):
+        assert await async_user_storage.get_by_username(username="nobody") is None
+        assert await async_user_storage.get_by_id(user_id="nobody") is None
+
+
+class TestThreadedUserStorage:
+    @pytest.mark.asyncio
+    async def test_serves_sync_storage_to_async_callers(
+        self, user_storage: UserStorage, session: Session
+    ):
+        session.add(
+            instance=User(
+                id="user-123",
+                username="testuser",
+                email="test@example.com",
+                password_hash="hash",
+            )
+        )
+        session.commit()
+        threaded_user_storage = ThreadedUserStorage(storage=user_storage)
+
+        by_username = await threaded_user_storage.get_by_username(username="testuser")
+        by_id = await threaded_user_storage.get_by_id(user_id="user-123")
+
+        assert by_username.id == "user-123"
+        assert by_id.username == "testuser"
+        assert await threaded_user_storage.get_by_id(user_id="nobody") is None
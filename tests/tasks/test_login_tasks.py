@@ -0,0 +1,113 @@
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+from sqlmodel import Session, select
+
+from app.models import LoginLog, User
+from app.tasks.login_tasks import check_login_location, record_login
+
+
+def login_event(login_id: str, ip_address: str, login_timestamp: datetime) -> dict:
+    return {
+        "id": login_id,
+        "user_id": "user-123",
+        "ip_address": ip_address,
+        "user_agent": "Mozilla/5.0",
+        "login_timestamp": login_timestamp.isoformat(),
+    }
+
+
+@pytest.fixture(autouse=True)
+def task_engine(engine):
+    with patch("app.tasks.login_tasks.engine", engine):
+        yield engine
+
+
+@pytest.fixture
+def user(engine):
+    with Session(engine) as session:
+        session.add(
+            User(
+                id="user-123",
+                username="testuser",
+                email="test@example.com",
+                password_hash="hash",
+            )
+        )
+        session.commit()
+
+
+@pytest.fixture
+def send_alert():
+    with patch("app.tasks.login_tasks.send_location_alert_email") as send_alert:
+        yield send_alert.delay
+
+
+def add_login(engine, ip_address: str, login_timestamp: datetime) -> None:
+    with Session(engine) as session:
+        session.add(
+            LoginLog(
+                user_id="user-123",
+                ip_address=ip_address,
+                login_timestamp=login_timestamp,
+            )
+        )
+        session.commit()
+
+
+class TestRecordLogin:
+    def test_persists_login_log(self, user, engine, send_alert):
+        record_login(login_event("login-1", "10.0.0.1", datetime(2025, 1, 1, 12, 0, 0)))
+
+        with Session(engine) as session:
+            stored = session.get(LoginLog, "login-1")
+        assert stored.user_id == "user-123"
+        assert stored.ip_address == "10.0.0.1"
+        assert stored.login_timestamp == datetime(2025, 1, 1, 12, 0, 0)
+        send_alert.assert_not_called()
+
+    def test_alerts_on_login_from_new_ip(self, user, engine, send_alert):
+        add_login(engine, "10.0.0.1", datetime(2025, 1, 1, 11, 0, 0))
+
+        record_login(login_event("login-2", "10.0.0.2", datetime(2025, 1, 1, 12, 0, 0)))
+
+        send_alert.assert_called_once_with("test@example.com", "10.0.0.2", ["10.0.0.1"])
+
+    def test_does_not_alert_on_known_ip(self, user, engine, send_alert):
+        add_login(engine, "10.0.0.1", datetime(2025, 1, 1, 11, 0, 0))
+
+        record_login(login_event("login-2", "10.0.0.1", datetime(2025, 1, 1, 12, 0, 0)))
+
+        send_alert.assert_not_called()
+
+    def test_ignores_logins_recorded_after_the_event(self, user, engine, send_alert):
+        add_login(engine, "10.0.0.9", datetime(2025, 1, 1, 13, 0, 0))
+
+        record_login(login_event("login-1", "10.0.0.1", datetime(2025, 1, 1, 12, 0, 0)))
+
+        send_alert.assert_not_called()
+
+    def test_redelivered_event_is_a_no_op(self, user, engine, send_alert):
+        add_login(engine, "10.0.0.1", datetime(2025, 1, 1, 11, 0, 0))
+        event = login_event("login-2", "10.0.0.2", datetime(2025, 1, 1, 12, 0, 0))
+
+        record_login(event)
+        record_login(event)
+
+        with Session(engine) as session:
+            stored = session.exec(select(LoginLog)).all()
+        assert len(stored) == 2
+        send_alert.assert_called_once()
+
+
+class TestCheckLoginLocation:
+    def test_compares_against_recent_login_count_logins(self, user, engine, send_alert):
+        for hour in range(1, 8):
+            add_login(engine, f"10.0.0.{hour}", datetime(2025, 1, 1, hour, 0, 0))
+        add_login(engine, "10.0.0.1", datetime(2025, 1, 1, 12, 0, 0))
+
+        with patch("app.tasks.login_tasks.RECENT_LOGIN_COUNT", 7):
+            check_login_location("user-123", "10.0.0.1")
+
+        send_alert.assert_not_called()
@@ -0,0 +1,30 @@
+from datetime import datetime
+from unittest.mock import patch
+
+from freezegun import freeze_time
+
+from app.dtos import LoginLogDTO
+from app.tasks.publisher_implementation import LoginEventPublisher
+
+
+class TestPublishLogin:
+    @freeze_time("2025-01-01 12:00:00")
+    def test_publishes_one_record_login_message(self):
+        login_log_dto = LoginLogDTO(
+            user_id="user-123", ip_address="127.0.0.1", user_agent="Mozilla/5.0"
+        )
+
+        with patch("app.tasks.publisher_implementation.record_login") as record_login:
+            result = LoginEventPublisher().publish_login(login_log_dto=login_log_dto)
+
+        record_login.delay.assert_called_once_with(
+            {
+                "id": result.id,
+                "user_id": "user-123",
+                "ip_address": "127.0.0.1",
+                "user_agent": "Mozilla/5.0",
+                "login_timestamp": "2025-01-01T12:00:00",
+            }
+        )
+        assert result.id is not None
+        assert result.login_timestamp == datetime(2025, 1, 1, 12, 0, 0)
@@ -0,0 +1,27 @@
+import pytest
+
+from app.database import to_async_database_url
+
+
+class TestToAsyncDatabaseUrl:
+    @pytest.mark.parametrize(
+        "database_url, expected",
+        [
+            ("sqlite:///./primes.db", "sqlite+aiosqlite:///./primes.db"),
+            ("sqlite:///:memory:", "sqlite+aiosqlite:///:memory:"),
+            (
+                "postgresql://user:secret@db:5432/primes",
+                "postgresql+asyncpg://user:secret@db:5432/primes",
+            ),
+            (
+                "postgresql+psycopg2://user:secret@db/primes",
+                "postgresql+asyncpg://user:secret@db/primes",
+            ),
+        ],
+    )
+    def test_swaps_in_async_driver(self, database_url, expected):
+        assert to_async_database_url(database_url=database_url) == expected
+
+    def test_rejects_backend_without_async_driver(self):
+        with pytest.raises(ValueError):
+            to_async_database_url(database_url="mysql://user@db/primes")
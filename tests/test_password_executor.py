@@ -0,0 +1,108 @@
+import asyncio
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from app import password_executor
+from app.password_executor import (
+    run_password_task,
+    shutdown_password_executor,
+    start_password_executor,
+)
+from app.utils import hash_password, verify_password
+
+
+def sleep(seconds: float) -> None:
+    time.sleep(seconds)
+
+
+@pytest.fixture
+def executor():
+    executor = start_password_executor(max_workers=2, max_concurrency=1)
+    yield executor
+    shutdown_password_executor()
+
+
+class TestRunPasswordTask:
+    @pytest.mark.asyncio
+    async def test_runs_inline_without_executor(self):
+        assert password_executor._executor is None
+
+        result = await run_password_task(threading.current_thread, operation="verify")
+
+        assert result is threading.current_thread()
+
+    @pytest.mark.asyncio
+    async def test_runs_on_password_hash_thread(self, executor):
+        thread = await run_password_task(threading.current_thread, operation="verify")
+
+        assert thread.name.startswith("password-hash")
+
+    @pytest.mark.asyncio
+    async def test_verifies_argon2_hash_off_the_event_loop(self, executor):
+        hashed_password = await run_password_task(
+            hash_password, operation="hash", password="password123"
+        )
+
+        assert await run_password_task(
+            verify_password,
+            operation="verify",
+            plain_password="password123",
+            hashed_password=hashed_password,
+        )
+        assert not await run_password_task(
+            verify_password,
+            operation="verify",
+            plain_password="wrong-password",
+            hashed_password=hashed_password,
+        )
+
+    @pytest.mark.asyncio
+    async def test_semaphore_caps_concurrent_tasks(self, executor):
+        running = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def slow_task():
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.02)
+            with lock:
+                running -= 1
+
+        await asyncio.gather(
+            *(run_password_task(slow_task, operation="verify") for _ in range(4))
+        )
+
+        assert peak == 1
+
+    @pytest.mark.asyncio
+    async def test_records_queue_wait_and_duration(self, executor):
+        with patch(
+            "app.password_executor.record_password_hashing"
+        ) as record_password_hashing:
+            await asyncio.gather(
+                *(
+                    run_password_task(sleep, operation="hash", seconds=0.02)
+                    for _ in range(2)
+                )
+            )
+
+        calls = [c.kwargs for c in record_password_hashing.call_args_list]
+        assert [c["operation"] for c in calls] == ["hash", "hash"]
+        assert all(c["duration_ms"] >= 20 for c in calls)
+        assert max(c["queue_wait_ms"] for c in calls) >= 20
+
+    @pytest.mark.asyncio
+    async def test_records_failed_tasks(self, executor):
+        with patch(
+            "app.password_executor.record_password_hashing"
+        ) as record_password_hashing:
+            with pytest.raises(ZeroDivisionError):
+                await run_password_task(lambda: 1 / 0, operation="verify")
+
+        record_password_hashing.assert_called_once()